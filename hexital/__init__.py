@@ -1,7 +1,15 @@
 from hexital.analysis import movement, patterns  # noqa F401
+from hexital.core.backfill import backfill  # noqa F401
 from hexital.core.candle import Candle  # noqa F401
+from hexital.core.candle_arrays import CandleArrays  # noqa F401
+from hexital.core.candle_schema import CandleSchema  # noqa F401
 from hexital.core.hexital import Hexital, HexitalCol  # noqa F401
+from hexital.core.hexital_pool import HexitalPool  # noqa F401
+from hexital.core.hexital_stream import HexitalStream  # noqa F401
 from hexital.core.indicator_collection import IndicatorCollection  # noqa F401
+from hexital.core.shared_candles import SharedCandles  # noqa F401
+from hexital.core.snapshot import HexitalSnapshot  # noqa F401
+from hexital.core.tick_aggregator import TickAggregator  # noqa F401
 from hexital.indicators import *  # noqa F401
 from hexital.utils import TimeFrame  # noqa F401
 from hexital.core.indicator import Indicator  # noqa F401
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hexital.core.candle_manager import Candles
+from hexital.core.hexital import Hexital
+
+CandleSource = Candles | Callable[[], Candles]
+
+_settings: Dict[str, Any] = {}
+
+
+def _init_worker(settings: Dict[str, Any]):
+    """Sets the strategy settings once per worker, rather than sending them with every symbol"""
+    global _settings
+    _settings = settings
+
+
+def _backfill_symbol(task: Tuple[str, CandleSource, bool]) -> Tuple[str, Dict[str, Any]]:
+    symbol, source, as_arrays = task
+    return symbol, calculate_readings(_settings, source, as_arrays)
+
+
+def calculate_readings(
+    settings: Dict[str, Any], source: CandleSource, as_arrays: bool = False
+) -> Dict[str, Any]:
+    """Calculates a strategy over a single Candle source, returning only the readings.
+
+    Args:
+        settings: The strategy, in the `Hexital.settings` format
+        source: The Candles, or a callable loading them
+        as_arrays: Returns `Hexital.readings_as_arrays` rather than `Hexital.readings`
+    """
+    candles = source() if callable(source) else source
+    strategy = Hexital(**{**settings, "candles": candles})
+    strategy.calculate()
+
+    return strategy.readings_as_arrays() if as_arrays else strategy.readings()
+
+
+def backfill(
+    settings: Dict[str, Any],
+    candles: Dict[str, CandleSource],
+    processes: Optional[int] = None,
+    chunksize: int = 1,
+    as_arrays: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Calculates a strategy over many symbol's history in parallel, across a process pool.
+
+    Each symbol is calculated in a worker process as it's own `Hexital`, only it's readings are
+    returned, never the Candles. Candle sources can be a callable taking no arguments, such as a
+    `functools.partial` of a loading function, which is called within the worker, so the Candles
+    themselves are never sent between processes.
+
+    Args:
+        settings: The strategy, in the `Hexital.settings` format
+        candles: The Candles, or a callable loading them, by symbol
+        processes: Number of worker processes, defaults to the CPU count. `1` calculates every
+            symbol in this process
+        chunksize: Symbols sent to a worker at a time
+        as_arrays: Returns each symbol's readings as NumPy arrays, as
+            `Hexital.readings_as_arrays`, rather than lists, as `Hexital.readings`
+
+    Returns:
+        Each symbol's readings, by symbol, in the order given
+    """
+    settings = {key: value for key, value in settings.items() if key != "candles"}
+    tasks: List[Tuple[str, CandleSource, bool]] = [
+        (symbol, source, as_arrays) for symbol, source in candles.items()
+    ]
+
+    if processes == 1 or len(tasks) <= 1:
+        return {
+            symbol: calculate_readings(settings, source, as_arrays) for symbol, source, _ in tasks
+        }
+
+    with Pool(processes, initializer=_init_worker, initargs=(settings,)) as pool:
+        results = dict(pool.imap_unordered(_backfill_symbol, tasks, chunksize))
+
+    return {symbol: results[symbol] for symbol in candles}
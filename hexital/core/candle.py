@@ -5,28 +5,91 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from hexital.core import Reading
+from hexital.core.reading_table import ReadingsView, ReadingTable
 from hexital.utils.timeframe import (
     TimeFrame,
     TimeFramesSource,
     convert_timeframe_to_timedelta,
 )
 
+CANDLE_FIELDS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "timeframe",
+    "tag",
+    "aggregation_factor",
+    "timestamp",
+    "refs",
+    "indicators",
+    "sub_indicators",
+)
+LAZY_FIELDS = ("refs", "indicators", "sub_indicators")
+
+
+_TIMEFRAMES: Dict[Any, Optional[timedelta]] = {}
+
+
+def shared_timeframe(timeframe: Optional[TimeFramesSource]) -> Optional[timedelta]:
+    """Converts a timeframe to a timedelta, sharing one timedelta object per timeframe
+    rather than creating one per Candle"""
+    if not timeframe:
+        return None
+    if isinstance(timeframe, timedelta):
+        return _TIMEFRAMES.setdefault(timeframe, timeframe)
+
+    converted = _TIMEFRAMES.get(timeframe)
+    if converted is None:
+        converted = convert_timeframe_to_timedelta(timeframe)
+        converted = _TIMEFRAMES[timeframe] = _TIMEFRAMES.setdefault(converted, converted)
+    return converted
+
 
 class Candle:
+    """A single OHLCV Candle.
+
+    Candle's use `__slots__` to stay compact, `refs`, `indicators` and `sub_indicators` are only
+    created once used, and a timeframe is a shared timedelta rather than one per Candle.
+    """
+
+    __slots__ = (
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "timestamp",
+        "timeframe",
+        "aggregation_factor",
+        "tag",
+        "_refs",
+        "_start_timestamp",
+        "_end_timestamp",
+        "_indicators",
+        "_sub_indicators",
+        "_table",
+        "_slot",
+        "__weakref__",
+    )
+
     open: float
     high: float
     low: float
     close: float
     volume: int
     timestamp: Optional[datetime]
-    indicators: Dict[str, Reading]
-    sub_indicators: Dict[str, Reading]
     timeframe: Optional[timedelta]
     aggregation_factor: int
-    tag: Optional[str] = None
-    refs: Dict[str, Sequence | None]
-    _start_timestamp: Optional[datetime] = None
-    _end_timestamp: Optional[datetime] = None
+    tag: Optional[str]
+    _refs: Optional[Dict[str, Sequence | None]]
+    _start_timestamp: Optional[datetime]
+    _end_timestamp: Optional[datetime]
+    _indicators: Optional[Dict[str, Reading]]
+    _sub_indicators: Optional[Dict[str, Reading]]
+    _table: Optional[ReadingTable]
+    _slot: int
 
     def __init__(
         self,
@@ -45,7 +108,7 @@ class Candle:
         self.low = low
         self.close = close
         self.volume = volume
-        self.timeframe = convert_timeframe_to_timedelta(timeframe) if timeframe else None
+        self.timeframe = shared_timeframe(timeframe)
 
         self.tag = None
         self.aggregation_factor = 1
@@ -57,27 +120,144 @@ class Candle:
         else:
             self.timestamp = None
 
-        self.refs = {}
-        self.indicators = indicators if indicators else {}
-        self.sub_indicators = sub_indicators if sub_indicators else {}
+        self._refs = None
+        self._start_timestamp = None
+        self._end_timestamp = None
+        self._indicators = indicators if indicators else None
+        self._sub_indicators = sub_indicators if sub_indicators else None
+        self._table = None
+        self._slot = -1
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Candle):
             return False
-        for key in set().union(self.__dict__.keys(), other.__dict__.keys()):
-            if key in ["_start_timestamp", "_end_timestamp", "timeframe"]:
-                local = getattr(self, key)
-                remote = getattr(other, key)
-                if remote is not None and local is not None and remote != local:
-                    return False
-            elif key.startswith("_"):
+        for key in ["_start_timestamp", "_end_timestamp", "timeframe"]:
+            local = getattr(self, key)
+            remote = getattr(other, key)
+            if remote is not None and local is not None and remote != local:
+                return False
+        for key in CANDLE_FIELDS:
+            if key == "timeframe":
                 continue
+            elif key in LAZY_FIELDS:
+                if self._lazy_field(key) != other._lazy_field(key):
+                    return False
             elif getattr(self, key) != getattr(other, key):
                 return False
         return True
 
     def __repr__(self) -> str:
-        return str({name: value for name, value in vars(self).items() if not name.startswith("_")})
+        return str(
+            {
+                name: self._lazy_field(name) if name in LAZY_FIELDS else getattr(self, name)
+                for name in CANDLE_FIELDS
+            }
+        )
+
+    def __reduce__(self) -> tuple:
+        """Pickles and copies as a plain `Candle`, keeping it's readings but not it's refs"""
+        return (
+            _restore_candle,
+            (
+                self.as_list(readings=True),
+                self.tag,
+                self.aggregation_factor,
+                self._start_timestamp,
+                self._end_timestamp,
+            ),
+        )
+
+    def _lazy_field(self, name: str) -> Any:
+        """Reads a lazily created field, without creating it"""
+        if name == "refs":
+            return self._refs or {}
+        if self._table is not None:
+            return ReadingsView(self._table, self._slot, name == "sub_indicators")
+        readings = self._indicators if name == "indicators" else self._sub_indicators
+        return readings or {}
+
+    @property
+    def refs(self) -> Dict[str, Sequence | None]:
+        if self._refs is None:
+            self._refs = {}
+        return self._refs
+
+    @refs.setter
+    def refs(self, refs: Dict[str, Sequence | None]):
+        self._refs = refs
+
+    @property
+    def indicators(self) -> Dict[str, Reading]:
+        """The Candle's readings, once the Candle has been calculated on this is a view of
+        the Indicator's reading columns."""
+        if self._table is not None:
+            return ReadingsView(self._table, self._slot)
+        if self._indicators is None:
+            self._indicators = {}
+        return self._indicators
+
+    @indicators.setter
+    def indicators(self, readings: Dict[str, Reading]):
+        if self._table is None:
+            self._indicators = readings
+            return
+
+        self._table.clear(self._slot, sub=False)
+        for name, reading in readings.items():
+            self._table.set(self._slot, name, reading)
+
+    @property
+    def sub_indicators(self) -> Dict[str, Reading]:
+        if self._table is not None:
+            return ReadingsView(self._table, self._slot, True)
+        if self._sub_indicators is None:
+            self._sub_indicators = {}
+        return self._sub_indicators
+
+    @sub_indicators.setter
+    def sub_indicators(self, readings: Dict[str, Reading]):
+        if self._table is None:
+            self._sub_indicators = readings
+            return
+
+        self._table.clear(self._slot, sub=True)
+        for name, reading in readings.items():
+            self._table.set(self._slot, name, reading, True)
+
+    def has_reading(self, name: str) -> bool:
+        if self._table is not None:
+            return self._table.has(self._slot, name)
+        return bool(
+            (self._indicators and name in self._indicators)
+            or (self._sub_indicators and name in self._sub_indicators)
+        )
+
+    def get_reading(self, name: str) -> Reading:
+        """Returns the Indicator or sub Indicator reading by exact name, or None"""
+        if self._table is not None:
+            return self._table.get(self._slot, name)
+        if self._indicators and name in self._indicators:
+            return self._indicators[name]
+        return self._sub_indicators.get(name) if self._sub_indicators else None
+
+    def set_reading(self, name: str, reading: Reading, sub: bool = False):
+        if self._table is not None:
+            self._table.set(self._slot, name, reading, sub)
+        elif sub:
+            self.sub_indicators[name] = reading
+        else:
+            self.indicators[name] = reading
+
+    def detach(self):
+        """Releases the Candle from it's reading table, along with any derived Candles.
+        The readings are kept on the Candle itself."""
+        if self._refs:
+            for derived in self._refs.values():
+                for candle in derived or []:
+                    candle.detach()
+
+        if self._table is not None:
+            self._table.detach(self)
 
     @property
     def positive(self) -> bool:
@@ -124,8 +304,8 @@ class Candle:
         cdl = [self.timestamp, self.open, self.high, self.low, self.close, self.volume]
 
         if readings:
-            cdl.append(self.indicators)
-            cdl.append(self.sub_indicators)
+            cdl.append(dict(self.indicators))
+            cdl.append(dict(self.sub_indicators))
 
         cdl += [self.timeframe] if self.timeframe else []
 
@@ -157,8 +337,8 @@ class Candle:
             cdl["timeframe"] = self.timeframe
 
         if readings:
-            cdl["indicators"] = self.indicators
-            cdl["sub_indicators"] = self.sub_indicators
+            cdl["indicators"] = dict(self.indicators)
+            cdl["sub_indicators"] = dict(self.sub_indicators)
 
         return cdl
 
@@ -221,7 +401,7 @@ class Candle:
         return [cls.from_dict(candle) for candle in candles]
 
     @classmethod
-    def from_list(cls, candle: list) -> Candle:
+    def from_list(cls, candle: Sequence) -> Candle:
         """
         Create a `Candle` object from a list representation.
 
@@ -235,30 +415,35 @@ class Candle:
         If the last element is a `str`, `int`, `TimeFrame`, or `timedelta`, it is treated as the `timeframe`.
 
         Args:
-            candle (list): A list containing the candle data.
+            candle (list | tuple): A list or tuple containing the candle data, which is left
+                unmodified.
 
         Returns:
             Candle: A `Candle` object initialized with the data from the list.
         """
         timestamp = None
         timeframe = None
-        indicators = {}
-        sub_indicators = {}
-
-        if len(candle) > 5 and (isinstance(candle[0], (str, datetime)) or candle[0] is None):
-            timestamp = candle.pop(0)
-        if len(candle) > 5 and isinstance(candle[-1], (str, int, TimeFrame, timedelta)):
-            timeframe = candle.pop(-1)
-        if len(candle) > 5 and isinstance(candle[-1], dict):
-            sub_indicators = candle.pop(-1)
-            indicators = candle.pop(-1)
+        indicators = None
+        sub_indicators = None
+        start = 0
+        end = len(candle)
+
+        if end > 5 and (isinstance(candle[0], (str, datetime)) or candle[0] is None):
+            timestamp = candle[0]
+            start = 1
+        if end - start > 5 and isinstance(candle[end - 1], (str, int, TimeFrame, timedelta)):
+            timeframe = candle[end - 1]
+            end -= 1
+        if end - start > 5 and isinstance(candle[end - 1], dict):
+            sub_indicators = candle[end - 1]
+            indicators = candle[end - 2]
 
         return cls(
-            open=candle[0],
-            high=candle[1],
-            low=candle[2],
-            close=candle[3],
-            volume=candle[4],
+            open=candle[start],
+            high=candle[start + 1],
+            low=candle[start + 2],
+            close=candle[start + 3],
+            volume=candle[start + 4],
             indicators=indicators,
             sub_indicators=sub_indicators,
             timestamp=timestamp,
@@ -266,7 +451,7 @@ class Candle:
         )
 
     @classmethod
-    def from_lists(cls, candles: List[list]) -> List[Candle]:
+    def from_lists(cls, candles: Sequence[Sequence]) -> List[Candle]:
         """
         Create a list of `Candle` object's from a list of list representation.
 
@@ -280,7 +465,7 @@ class Candle:
         If the last element is a `str`, `int`, `TimeFrame`, or `timedelta`, it is treated as the `timeframe`.
 
         Args:
-            candles (List[list]): A list of list's containing the candle data.
+            candles (List[list | tuple]): A list of list's or tuple's containing the candle data.
 
         Returns:
             List[Candle]: A list of `Candle` object's.
@@ -288,7 +473,15 @@ class Candle:
         return [cls.from_list(candle) for candle in candles]
 
     def clean_copy(self) -> Candle:
-        candle = Candle.from_list(self.as_list())
+        candle = Candle(
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            self.timestamp,
+            self.timeframe,
+        )
         candle.aggregation_factor = self.aggregation_factor
         return candle
 
@@ -298,9 +491,17 @@ class Candle:
         self.timestamp = timestamp
 
     def reset_candle(self):
-        self.indicators = {}
-        self.sub_indicators = {}
-        self.refs = {}
+        if self._refs:
+            for derived in self._refs.values():
+                for candle in derived or []:
+                    candle.detach()
+
+        if self._table is not None:
+            self._table.clear(self._slot)
+        else:
+            self._indicators = None
+            self._sub_indicators = None
+        self._refs = None
         self.tag = None
 
     def merge(self, candle: Candle):
@@ -360,7 +561,7 @@ class Candle:
         elif (
             self._start_timestamp
             and self._end_timestamp
-            and self._start_timestamp > candle.timestamp > self._end_timestamp
+            and self._start_timestamp < candle.timestamp < self._end_timestamp
         ):
             pass
         else:
@@ -372,3 +573,18 @@ class Candle:
         self.aggregation_factor += candle.aggregation_factor
 
         self.reset_candle()
+
+
+def _restore_candle(
+    candle: list,
+    tag: Optional[str],
+    aggregation_factor: int,
+    start_timestamp: Optional[datetime],
+    end_timestamp: Optional[datetime],
+) -> Candle:
+    candle_ = Candle.from_list(candle)
+    candle_.tag = tag
+    candle_.aggregation_factor = aggregation_factor
+    candle_._start_timestamp = start_timestamp
+    candle_._end_timestamp = end_timestamp
+    return candle_
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone, tzinfo
+from itertools import repeat
+from typing import Any, Dict, List, Optional
+
+from hexital.core.candle import Candle, shared_timeframe
+from hexital.exceptions import InvalidConfiguration
+from hexital.utils.timeframe import TimeFramesSource
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+TIME_NAMES = ("timestamp", "time", "date", "datetime")
+EPOCH_DTYPES = {
+    "s": "datetime64[s]",
+    "ms": "datetime64[ms]",
+    "us": "datetime64[us]",
+    "ns": "datetime64[ns]",
+}
+
+
+def is_array_like(candles: Any) -> bool:
+    """Checks if the given Candles are a bulk block of arrays, such as a NumPy array, structured
+    array, pandas DataFrame or `CandleArrays`, rather than Candle's, dicts or lists"""
+    if isinstance(candles, CandleArrays):
+        return True
+    if isinstance(candles, (list, tuple, dict)):
+        return False
+    return hasattr(candles, "dtype") or hasattr(candles, "dtypes")
+
+
+class CandleArrays:
+    """A block of Candles held as one NumPy array per field, used to load Candles in bulk without
+    building a dict or list per row.
+
+    Can be created directly from separate OHLCV arrays, or with `CandleArrays.load` from a 2D
+    NumPy array, a structured array, or a pandas DataFrame. Requires NumPy, which is only imported
+    once used.
+
+    Args:
+        open: Open prices
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes, integer arrays keep integer volumes
+        timestamp: Optional `datetime64` array, or epoch numbers read in `epoch_unit`
+        timeframe: Optional timeframe of every Candle
+        epoch_unit: Unit of numeric timestamps, 's', 'ms', 'us' or 'ns'
+        timestamp_format: A `datetime.strptime` format for string timestamps, otherwise string
+            timestamps are read as ISO 8601
+    """
+
+    open: Any
+    high: Any
+    low: Any
+    close: Any
+    volume: Any
+    timestamp: Any  # datetime64[us], UTC when tzinfo is set
+    timeframe: Optional[timedelta] = None
+    tzinfo: Optional[tzinfo] = None
+
+    def __init__(
+        self,
+        open: Any,
+        high: Any,
+        low: Any,
+        close: Any,
+        volume: Any,
+        timestamp: Any = None,
+        timeframe: Optional[TimeFramesSource] = None,
+        epoch_unit: str = "s",
+        timestamp_format: Optional[str] = None,
+    ):
+        import numpy as np
+
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        volume = np.asarray(volume)
+        self.volume = volume if volume.dtype.kind in "iu" else volume.astype(np.float64)
+        self.timestamp = None
+        self.timeframe = shared_timeframe(timeframe)
+        self.tzinfo = None
+
+        if timestamp is not None:
+            self.timestamp = self._to_datetime64(timestamp, epoch_unit, timestamp_format)
+
+        length = len(self.open)
+        for values in (self.high, self.low, self.close, self.volume, self.timestamp):
+            if values is not None and len(values) != length:
+                raise InvalidConfiguration("CandleArrays fields must all be the same length")
+
+    def __len__(self) -> int:
+        return len(self.open)
+
+    def _to_datetime64(
+        self, timestamp: Any, epoch_unit: str, timestamp_format: Optional[str]
+    ) -> Any:
+        import numpy as np
+
+        tz = getattr(getattr(timestamp, "dtype", None), "tz", None)
+        if tz is not None:
+            # pandas timezone aware Series or DatetimeIndex, held as UTC
+            self.tzinfo = tz
+            timestamp = getattr(timestamp, "dt", timestamp).tz_convert("UTC").tz_localize(None)
+
+        timestamp = np.asarray(timestamp)
+        if timestamp.dtype.kind == "M":
+            return timestamp.astype("datetime64[us]")
+        if timestamp.dtype.kind in "iuf":
+            if epoch_unit not in EPOCH_DTYPES:
+                raise InvalidConfiguration(f"Unknown epoch_unit: {epoch_unit}")
+            epoch = timestamp.astype(np.int64).astype(EPOCH_DTYPES[epoch_unit])
+            return epoch.astype("datetime64[us]")
+        if timestamp_format:
+            return np.array(
+                [datetime.strptime(str(t), timestamp_format) for t in timestamp.tolist()],
+                dtype="datetime64[us]",
+            )
+        return timestamp.astype("datetime64[us]")
+
+    @classmethod
+    def load(
+        cls,
+        candles: Any,
+        keys: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[Optional[str]]] = None,
+        epoch_unit: Optional[str] = None,
+        timestamp_format: Optional[str] = None,
+        timeframe: Optional[TimeFramesSource] = None,
+    ) -> CandleArrays:
+        """Loads a 2D NumPy array, a structured array or a pandas DataFrame.
+
+        Named fields are found by `keys`, mapping each Candle field to it's name, otherwise by
+        the Candle field name in either case. A DataFrame without a timestamp column uses it's
+        DatetimeIndex. A 2D array's `columns` give the Candle field of each column, by default
+        `open, high, low, close, volume`, with a leading timestamp when it has 6 columns.
+        Timestamps are read as in `CandleArrays`.
+        """
+        if isinstance(candles, CandleArrays):
+            return candles
+
+        read = (timeframe, epoch_unit or "s", timestamp_format)
+
+        if hasattr(candles, "columns") and hasattr(candles, "index"):
+            fields = cls._find_fields(list(candles.columns), keys)
+            index = candles.index
+            if "timestamp" in fields or getattr(index.dtype, "kind", "") != "M":
+                index = None
+            return cls._from_fields(candles, fields, index, *read)
+
+        if candles.dtype.names:
+            fields = cls._find_fields(list(candles.dtype.names), keys)
+            return cls._from_fields(candles, fields, None, *read)
+
+        if candles.ndim != 2:
+            raise InvalidConfiguration("CandleArrays.load expects a 2D array of Candles")
+
+        if columns is None:
+            columns = list(OHLCV_FIELDS)
+            if candles.shape[1] > len(columns):
+                columns.insert(0, "timestamp")
+
+        fields = {name: idx for idx, name in enumerate(columns) if name}
+        return cls._from_fields(candles.T, fields, None, *read)
+
+    @staticmethod
+    def _find_fields(names: List[Any], keys: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if keys:
+            return {field: key for field, key in keys.items() if key in names}
+
+        lowered = {str(name).lower(): name for name in names}
+        fields = {
+            field: lowered[field] for field in OHLCV_FIELDS + ("timeframe",) if field in lowered
+        }
+        for name in TIME_NAMES:
+            if name in lowered:
+                fields["timestamp"] = lowered[name]
+                break
+        return fields
+
+    @classmethod
+    def _from_fields(
+        cls,
+        candles: Any,
+        fields: Dict[str, Any],
+        timestamp: Any,
+        timeframe: Optional[TimeFramesSource],
+        epoch_unit: str,
+        timestamp_format: Optional[str],
+    ) -> CandleArrays:
+        missing = [field for field in OHLCV_FIELDS if field not in fields]
+        if missing:
+            raise InvalidConfiguration(f"Candle arrays missing required fields: {missing}")
+
+        if "timestamp" in fields:
+            timestamp = candles[fields["timestamp"]]
+        if not timeframe and "timeframe" in fields:
+            timeframe = next(iter(candles[fields["timeframe"]]), None)
+
+        return cls(
+            *(candles[fields[field]] for field in OHLCV_FIELDS),
+            timestamp=timestamp,
+            timeframe=timeframe,
+            epoch_unit=epoch_unit,
+            timestamp_format=timestamp_format,
+        )
+
+    def timestamps(self) -> List[Any]:
+        """The timestamps as a list of datetime's, None when missing"""
+        if self.timestamp is None:
+            return [None] * len(self)
+
+        timestamps = self.timestamp.tolist()
+        if self.tzinfo is None:
+            return timestamps
+
+        tz = self.tzinfo
+        return [
+            t.replace(tzinfo=timezone.utc).astimezone(tz) if t is not None else None
+            for t in timestamps
+        ]
+
+    def to_candles(self) -> List[Candle]:
+        """Creates a Candle per row"""
+        return list(
+            map(
+                Candle,
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+                self.timestamps(),
+                repeat(self.timeframe, len(self)),
+            )
+        )
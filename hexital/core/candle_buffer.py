@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from operator import index as as_index
+from typing import Any, Callable, Generator, List, Optional, SupportsIndex
+
+from hexital.core.candle import Candle
+
+
+class CandleBuffer(list):
+    """Ring buffer storage for Candles, used by CandleManager's with a retention limit.
+
+    Behaves as a list of `Candle`'s, with indexes always counting from the oldest held Candle.
+    Removing from the front or back, and appending or prepending are O(1), allowing old Candles
+    to be expired without shifting every remaining Candle. Any other insertion or removal falls
+    back to re-building the buffer, the same cost as a list.
+
+    The buffer grows as needed, `capacity` only sets how many Candles are preallocated.
+    """
+
+    _buffer: List[Optional[Candle]]
+    _head: int
+    _size: int
+
+    def __init__(self, candles: Optional[Iterable[Candle]] = None, capacity: int = 16):
+        list.__init__(self)
+        self._buffer = [None] * max(capacity, 1)
+        self._head = 0
+        self._size = 0
+
+        if candles:
+            self.extend(candles)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def reserve(self, capacity: int):
+        """Grows the buffer to hold at least `capacity` Candles without re-allocating"""
+        if capacity > len(self._buffer):
+            self._rebuild(self._items(), capacity)
+
+    def _items(self) -> List[Candle]:
+        end = self._head + self._size
+        if end <= len(self._buffer):
+            return self._buffer[self._head : end]  # type: ignore
+        return self._buffer[self._head :] + self._buffer[: end - len(self._buffer)]  # type: ignore
+
+    def _rebuild(self, candles: List[Candle], capacity: Optional[int] = None):
+        capacity = max(capacity or len(self._buffer), len(candles), 1)
+        self._buffer = candles + [None] * (capacity - len(candles))  # type: ignore
+        self._head = 0
+        self._size = len(candles)
+
+    def _position(self, index: SupportsIndex) -> int:
+        index_ = as_index(index)
+        if index_ < 0:
+            index_ += self._size
+        if not 0 <= index_ < self._size:
+            raise IndexError("CandleBuffer index out of range")
+        return (self._head + index_) % len(self._buffer)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx: slice | SupportsIndex) -> Any:
+        if isinstance(idx, slice):
+            capacity = len(self._buffer)
+            return [
+                self._buffer[(self._head + index) % capacity]
+                for index in range(*idx.indices(self._size))
+            ]
+        return self._buffer[self._position(idx)]
+
+    def __setitem__(self, idx: slice | SupportsIndex, candles: Any):
+        if not isinstance(idx, slice):
+            self._buffer[self._position(idx)] = candles
+            return
+
+        start, stop, step = idx.indices(self._size)
+        if step == 1 and start == stop == self._size:
+            self.extend(candles)
+            return
+
+        items = self._items()
+        items[idx] = candles
+        self._rebuild(items)
+
+    def __delitem__(self, idx: slice | SupportsIndex):
+        if not isinstance(idx, slice):
+            self.pop(idx)
+            return
+
+        start, stop, step = idx.indices(self._size)
+        if step == 1 and start == 0:
+            for _ in range(stop):
+                self.popleft()
+        elif step == 1 and stop == self._size:
+            for _ in range(max(stop - start, 0)):
+                self.pop()
+        else:
+            items = self._items()
+            del items[idx]
+            self._rebuild(items)
+
+    def __iter__(self) -> Generator[Candle, None, None]:
+        capacity = len(self._buffer)
+        for index in range(self._size):
+            yield self._buffer[(self._head + index) % capacity]  # type: ignore
+
+    def __reversed__(self) -> Generator[Candle, None, None]:
+        capacity = len(self._buffer)
+        for index in range(self._size - 1, -1, -1):
+            yield self._buffer[(self._head + index) % capacity]  # type: ignore
+
+    def __contains__(self, candle: object) -> bool:
+        return any(candle == candle_ for candle_ in self)
+
+    def __eq__(self, obj: object) -> bool:
+        if not isinstance(obj, Sequence) or len(obj) != self._size:
+            return False
+        return all(candle == obj[index] for index, candle in enumerate(self))
+
+    def __ne__(self, obj: object) -> bool:
+        return not self == obj
+
+    def __repr__(self) -> str:
+        return "CandleBuffer(%r)" % self._items()
+
+    def __add__(self, candles: Iterable[Candle]) -> CandleBuffer:
+        buffer = CandleBuffer(self, self._size)
+        buffer.extend(candles)
+        return buffer
+
+    def __iadd__(self, candles: Iterable[Candle]) -> CandleBuffer:
+        self.extend(candles)
+        return self
+
+    def append(self, candle: Candle):
+        if self._size == len(self._buffer):
+            self.reserve(len(self._buffer) * 2)
+
+        self._buffer[(self._head + self._size) % len(self._buffer)] = candle
+        self._size += 1
+
+    def appendleft(self, candle: Candle):
+        if self._size == len(self._buffer):
+            self.reserve(len(self._buffer) * 2)
+
+        self._head = (self._head - 1) % len(self._buffer)
+        self._buffer[self._head] = candle
+        self._size += 1
+
+    def extend(self, candles: Iterable[Candle]):
+        candles = list(candles)
+        self.reserve(self._size + len(candles))
+        for candle in candles:
+            self.append(candle)
+
+    def insert(self, index: SupportsIndex, candle: Candle):
+        index_ = as_index(index)
+        if index_ < 0:
+            index_ = max(index_ + self._size, 0)
+
+        if index_ == 0:
+            self.appendleft(candle)
+        elif index_ >= self._size:
+            self.append(candle)
+        else:
+            items = self._items()
+            items.insert(index_, candle)
+            self._rebuild(items)
+
+    def popleft(self) -> Candle:
+        if not self._size:
+            raise IndexError("pop from empty CandleBuffer")
+
+        candle = self._buffer[self._head]
+        self._buffer[self._head] = None
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+        return candle  # type: ignore
+
+    def pop(self, index: SupportsIndex = -1) -> Candle:
+        if not self._size:
+            raise IndexError("pop from empty CandleBuffer")
+
+        position = self._position(index)
+        if position == self._head:
+            return self.popleft()
+
+        if position == (self._head + self._size - 1) % len(self._buffer):
+            candle = self._buffer[position]
+            self._buffer[position] = None
+            self._size -= 1
+            return candle  # type: ignore
+
+        items = self._items()
+        candle = items.pop(index)
+        self._rebuild(items)
+        return candle
+
+    def remove(self, candle: Candle):
+        items = self._items()
+        items.remove(candle)
+        self._rebuild(items)
+
+    def clear(self):
+        self._buffer = [None] * len(self._buffer)
+        self._head = 0
+        self._size = 0
+
+    def index(self, candle: Candle, *args) -> int:
+        return self._items().index(candle, *args)
+
+    def count(self, candle: Candle) -> int:
+        return self._items().count(candle)
+
+    def reverse(self):
+        self._rebuild(self._items()[::-1])
+
+    def sort(self, *, key: Optional[Callable] = None, reverse: bool = False):
+        self._rebuild(sorted(self._items(), key=key, reverse=reverse))  # type: ignore
+
+    def copy(self) -> CandleBuffer:
+        return CandleBuffer(self, len(self._buffer))
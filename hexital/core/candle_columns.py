@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from itertools import repeat
+from typing import Any, Callable, Dict, Generator, List, Optional, SupportsIndex
+
+from hexital.core.candle import Candle
+from hexital.core.candle_arrays import CandleArrays
+from hexital.core.reading_table import ReadingTable
+from hexital.utils.timeframe import EPOCH, EPOCH_UTC, MICROSECOND
+
+NO_TIME = -(2**63)
+
+
+class CandleColumns(list):
+    """Columnar storage for Candles.
+
+    Stores the core Candle values in contiguous typed arrays instead of one `Candle` object per
+    row. `Candle`'s are only created as lightweight `CandleView`'s when requested, which read and
+    write straight through to the columns.
+
+    Readings are held in a positional `ReadingTable`, shifted along with the Candles. Anything
+    uncommon to a Candle (refs, tag) is stored sparsely, and only allocated once it's used.
+
+    Note:
+        `CandleView`'s are positional, they remain valid when Candles are added or removed from
+        the front or end of the columns, but not when Candles are inserted or removed in the
+        middle. Use `clean_copy` to keep a detached `Candle`.
+    """
+
+    open: array
+    high: array
+    low: array
+    close: array
+    volume: array
+    timestamp: array  # Microseconds since epoch
+    timeframe: array  # Microseconds
+    aggregation_factor: array
+    start_timestamp: array
+    end_timestamp: array
+    extras: List[Optional[Dict[str, Any]]]
+    readings: ReadingTable
+
+    _base: int
+    _tzinfo: Any
+    _volume_int: bool
+    _timedeltas: Dict[int, timedelta]
+
+    def __init__(self, candles: Optional[Iterable[Candle]] = None):
+        list.__init__(self)
+        self.open = array("d")
+        self.high = array("d")
+        self.low = array("d")
+        self.close = array("d")
+        self.volume = array("d")
+        self.timestamp = array("q")
+        self.timeframe = array("q")
+        self.aggregation_factor = array("q")
+        self.start_timestamp = array("q")
+        self.end_timestamp = array("q")
+        self.extras = []
+        self.readings = ReadingTable()
+
+        self._base = 0
+        self._tzinfo = None
+        self._volume_int = True
+        self._timedeltas = {}
+
+        if candles:
+            self.extend(candles)
+
+    @property
+    def _arrays(self) -> tuple:
+        return (
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            self.timestamp,
+            self.timeframe,
+            self.aggregation_factor,
+            self.start_timestamp,
+            self.end_timestamp,
+        )
+
+    def __len__(self) -> int:
+        return len(self.open)
+
+    def __getitem__(self, index: SupportsIndex | slice) -> Any:
+        if isinstance(index, slice):
+            return [self.view(idx) for idx in range(*index.indices(len(self)))]
+
+        idx = index.__index__()
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("CandleColumns index out of range")
+
+        return self.view(idx)
+
+    def __setitem__(self, index: SupportsIndex | slice, candles: Candle | Iterable[Candle]):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("CandleColumns only supports continuous slices")
+            stop = max(start, stop)
+
+            candles = list(candles)  # type: ignore
+            rows = [self._to_row(candle) for candle in candles]
+            for col, column in enumerate(self._arrays):
+                column[start:stop] = array(column.typecode, (row[col] for row in rows))
+            self.extras[start:stop] = [row[-1] for row in rows]
+
+            self.readings.delete_rows(start, stop)
+            self.readings.insert_rows(start, len(rows))
+            self.readings.set_rows(start, [self._to_readings(candle) for candle in candles])
+
+            if start == 0:
+                self._base -= len(rows) - (stop - start)
+            return
+
+        idx = self._abs_index(index.__index__())
+        row = self._to_row(candles)  # type: ignore
+        for column, value in zip(self._arrays, row):
+            column[idx] = value
+        self.extras[idx] = row[-1]
+
+        self.readings.clear(idx)
+        self.readings.set_rows(idx, [self._to_readings(candles)])  # type: ignore
+
+    def __delitem__(self, index: SupportsIndex | slice):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("CandleColumns only supports continuous slices")
+            stop = max(start, stop)
+        else:
+            start = self._abs_index(index.__index__())
+            stop = start + 1
+
+        for column in self._arrays:
+            del column[start:stop]
+        del self.extras[start:stop]
+        self.readings.delete_rows(start, stop)
+
+        if start == 0:
+            self._base += stop - start
+
+    def __iter__(self) -> Generator[CandleView, None, None]:
+        for idx in range(len(self)):
+            yield self.view(idx)
+
+    def __reversed__(self) -> Generator[CandleView, None, None]:
+        for idx in range(len(self) - 1, -1, -1):
+            yield self.view(idx)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return all(candle == other[idx] for idx, candle in enumerate(self))
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return f"CandleColumns({list(self)!r})"
+
+    def __contains__(self, candle: object) -> bool:
+        return any(candle == cdl for cdl in self)
+
+    def __add__(self, other: Iterable[Candle]) -> List[Candle]:
+        return list(self) + list(other)
+
+    def __iadd__(self, other: Iterable[Candle]) -> CandleColumns:
+        self.extend(other)
+        return self
+
+    def copy(self) -> List[Candle]:
+        """Returns a list of detached `Candle`'s"""
+        return [self.materialise(idx) for idx in range(len(self))]
+
+    def _abs_index(self, index: int) -> int:
+        idx = index + len(self) if index < 0 else index
+        if not 0 <= idx < len(self):
+            raise IndexError("CandleColumns index out of range")
+        return idx
+
+    def view(self, index: int) -> CandleView:
+        """Creates a `CandleView` of the Candle at the given positive index"""
+        return CandleView(self, self._base + index)
+
+    def insert(self, index: int, candle: Candle):
+        index = min(len(self), index + len(self) if index < 0 else index)
+
+        row = self._to_row(candle)
+        for column, value in zip(self._arrays, row):
+            column.insert(index, value)
+        self.extras.insert(index, row[-1])
+
+        self.readings.insert_rows(index)
+        self.readings.set_rows(index, [self._to_readings(candle)])
+
+        if index == 0:
+            self._base -= 1
+
+    def append(self, candle: Candle):
+        row = self._to_row(candle)
+        for column, value in zip(self._arrays, row):
+            column.append(value)
+        self.extras.append(row[-1])
+        self.readings.set_rows(len(self) - 1, [self._to_readings(candle)])
+
+    def append_values(self, candle: Candle):
+        """Appends only the Candle's values, without it's readings, tag or refs, as appending a
+        `clean_copy` of it, without creating the copy"""
+        if self._volume_int and not isinstance(candle.volume, int):
+            self._volume_int = False
+
+        self.open.append(candle.open)
+        self.high.append(candle.high)
+        self.low.append(candle.low)
+        self.close.append(candle.close)
+        self.volume.append(candle.volume)
+        self.timestamp.append(self.to_time(candle.timestamp))
+        self.timeframe.append(candle.timeframe // MICROSECOND if candle.timeframe else 0)
+        self.aggregation_factor.append(candle.aggregation_factor)
+        self.start_timestamp.append(NO_TIME)
+        self.end_timestamp.append(NO_TIME)
+        self.extras.append(None)
+
+    def extend(self, candles: Iterable[Candle]):
+        self[len(self) : len(self)] = list(candles)
+
+    def extend_arrays(self, candles: CandleArrays):
+        """Appends a block of `CandleArrays` by copying each array straight into it's column,
+        without creating a Candle per row"""
+        import numpy as np
+
+        count = len(candles)
+        if not count:
+            return
+        if candles.volume.dtype.kind not in "iu":
+            self._volume_int = False
+        if candles.tzinfo is not None and self._tzinfo is None:
+            self._tzinfo = candles.tzinfo
+
+        if candles.timestamp is not None:
+            timestamps = candles.timestamp.astype("datetime64[us]").view(np.int64)
+        else:
+            timestamps = np.full(count, NO_TIME, dtype=np.int64)
+        timeframe = candles.timeframe // MICROSECOND if candles.timeframe else 0
+
+        for column, values in (
+            (self.open, candles.open),
+            (self.high, candles.high),
+            (self.low, candles.low),
+            (self.close, candles.close),
+            (self.volume, candles.volume),
+        ):
+            column.frombytes(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+        self.timestamp.frombytes(np.ascontiguousarray(timestamps).tobytes())
+        self.timeframe.extend(repeat(timeframe, count))
+        self.aggregation_factor.extend(repeat(1, count))
+        self.start_timestamp.extend(repeat(NO_TIME, count))
+        self.end_timestamp.extend(repeat(NO_TIME, count))
+        self.extras.extend(repeat(None, count))
+
+    def pop(self, index: int = -1) -> Candle:
+        """Removes the Candle at the index, returning it as a detached `Candle`"""
+        idx = self._abs_index(index)
+        candle = self.materialise(idx)
+        del self[idx]
+        return candle
+
+    def clear(self):
+        del self[:]
+
+    def sort(self, key: Optional[Callable[[Candle], Any]] = None, reverse: bool = False):
+        """Sorts the Candles in place, the order is computed on `CandleView`'s and then applied
+        to every column at once."""
+        views = list(self)
+        order = sorted(
+            range(len(views)),
+            key=(lambda idx: key(views[idx])) if key else (lambda idx: views[idx]),  # type: ignore
+            reverse=reverse,
+        )
+
+        for column in self._arrays:
+            column[:] = array(column.typecode, (column[idx] for idx in order))
+        self.extras[:] = [self.extras[idx] for idx in order]
+        self.readings.permute(order)
+
+    def materialise(self, index: int) -> Candle:
+        """Generates a detached `Candle` object from the given positive index, including readings"""
+        extras = self.extras[index] or {}
+
+        candle = Candle(
+            self.open[index],
+            self.high[index],
+            self.low[index],
+            self.close[index],
+            self.get_volume(index),
+            timestamp=self.get_time(self.timestamp[index]),
+            timeframe=self.get_timeframe(index),
+            indicators=self.readings.row(index),
+            sub_indicators=self.readings.row(index, True),
+        )
+        candle.aggregation_factor = self.aggregation_factor[index]
+        candle.tag = extras.get("tag")
+        candle._refs = extras.get("refs")
+
+        if (start := self.get_time(self.start_timestamp[index])) is not None:
+            candle._start_timestamp = start
+        if (end := self.get_time(self.end_timestamp[index])) is not None:
+            candle._end_timestamp = end
+
+        return candle
+
+    def get_volume(self, index: int) -> float | int:
+        volume = self.volume[index]
+        return int(volume) if self._volume_int else volume
+
+    def set_volume(self, index: int, volume: float | int):
+        if self._volume_int and not isinstance(volume, int):
+            self._volume_int = False
+        self.volume[index] = volume
+
+    def get_time(self, micros: int) -> Optional[datetime]:
+        if micros == NO_TIME:
+            return None
+        if self._tzinfo is None:
+            return EPOCH + micros * MICROSECOND
+        return (EPOCH_UTC + micros * MICROSECOND).astimezone(self._tzinfo)
+
+    def to_time(self, timestamp: Optional[datetime | str]) -> int:
+        if timestamp is None:
+            return NO_TIME
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+
+        if timestamp.tzinfo is None:
+            return (timestamp - EPOCH) // MICROSECOND
+
+        if self._tzinfo is None:
+            self._tzinfo = timestamp.tzinfo
+        return (timestamp - EPOCH_UTC) // MICROSECOND
+
+    def get_timeframe(self, index: int) -> Optional[timedelta]:
+        micros = self.timeframe[index]
+        if not micros:
+            return None
+
+        timeframe = self._timedeltas.get(micros)
+        if timeframe is None:
+            timeframe = self._timedeltas[micros] = micros * MICROSECOND
+        return timeframe
+
+    def get_extra(self, index: int, name: str) -> Any:
+        extras = self.extras[index]
+        if extras is None:
+            extras = self.extras[index] = {}
+
+        value = extras.get(name)
+        if value is None:
+            value = extras[name] = {}
+        return value
+
+    def set_extra(self, index: int, name: str, value: Any):
+        extras = self.extras[index]
+        if extras is None:
+            if value is None:
+                return
+            extras = self.extras[index] = {}
+        extras[name] = value
+
+    def _to_row(self, candle: Candle) -> tuple:
+        if self._volume_int and not isinstance(candle.volume, int):
+            self._volume_int = False
+
+        if isinstance(candle, CandleView):
+            columns = candle._columns
+            index = candle._index
+            extras = columns.extras[index]
+            return (
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume,
+                self.to_time(candle.timestamp),
+                columns.timeframe[index],
+                columns.aggregation_factor[index],
+                self.to_time(columns.get_time(columns.start_timestamp[index])),
+                self.to_time(columns.get_time(columns.end_timestamp[index])),
+                dict(extras) if extras else None,
+            )
+
+        extras = {}
+        if candle._refs:
+            extras["refs"] = candle._refs
+        if candle.tag is not None:
+            extras["tag"] = candle.tag
+
+        return (
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+            self.to_time(candle.timestamp),
+            candle.timeframe // MICROSECOND if candle.timeframe else 0,
+            candle.aggregation_factor,
+            self.to_time(candle._start_timestamp),
+            self.to_time(candle._end_timestamp),
+            extras if extras else None,
+        )
+
+    @staticmethod
+    def _to_readings(candle: Candle) -> tuple:
+        return (candle.indicators, candle.sub_indicators)
+
+
+class CandleView(Candle):
+    """A `Candle` which reads and writes it's values directly from a `CandleColumns` row"""
+
+    __slots__ = ("_columns", "_row")
+
+    _columns: CandleColumns
+    _row: int
+
+    def __init__(self, columns: CandleColumns, row: int):
+        self._columns = columns
+        self._row = row
+
+    @property
+    def _index(self) -> int:
+        return self._row - self._columns._base
+
+    @property
+    def open(self) -> float:
+        return self._columns.open[self._row - self._columns._base]
+
+    @open.setter
+    def open(self, value: float):
+        self._columns.open[self._row - self._columns._base] = value
+
+    @property
+    def high(self) -> float:
+        return self._columns.high[self._row - self._columns._base]
+
+    @high.setter
+    def high(self, value: float):
+        self._columns.high[self._row - self._columns._base] = value
+
+    @property
+    def low(self) -> float:
+        return self._columns.low[self._row - self._columns._base]
+
+    @low.setter
+    def low(self, value: float):
+        self._columns.low[self._row - self._columns._base] = value
+
+    @property
+    def close(self) -> float:
+        return self._columns.close[self._row - self._columns._base]
+
+    @close.setter
+    def close(self, value: float):
+        self._columns.close[self._row - self._columns._base] = value
+
+    @property
+    def volume(self) -> float | int:
+        return self._columns.get_volume(self._row - self._columns._base)
+
+    @volume.setter
+    def volume(self, value: float | int):
+        self._columns.set_volume(self._row - self._columns._base, value)
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        columns = self._columns
+        return columns.get_time(columns.timestamp[self._row - columns._base])
+
+    @timestamp.setter
+    def timestamp(self, value: Optional[datetime | str]):
+        columns = self._columns
+        columns.timestamp[self._row - columns._base] = columns.to_time(value)
+
+    @property
+    def timeframe(self) -> Optional[timedelta]:
+        return self._columns.get_timeframe(self._row - self._columns._base)
+
+    @timeframe.setter
+    def timeframe(self, value: Optional[timedelta]):
+        self._columns.timeframe[self._row - self._columns._base] = (
+            value // MICROSECOND if value else 0
+        )
+
+    @property
+    def aggregation_factor(self) -> int:
+        return self._columns.aggregation_factor[self._row - self._columns._base]
+
+    @aggregation_factor.setter
+    def aggregation_factor(self, value: int):
+        self._columns.aggregation_factor[self._row - self._columns._base] = value
+
+    @property
+    def _start_timestamp(self) -> Optional[datetime]:
+        columns = self._columns
+        return columns.get_time(columns.start_timestamp[self._row - columns._base])
+
+    @_start_timestamp.setter
+    def _start_timestamp(self, value: Optional[datetime]):
+        columns = self._columns
+        columns.start_timestamp[self._row - columns._base] = columns.to_time(value)
+
+    @property
+    def _end_timestamp(self) -> Optional[datetime]:
+        columns = self._columns
+        return columns.get_time(columns.end_timestamp[self._row - columns._base])
+
+    @_end_timestamp.setter
+    def _end_timestamp(self, value: Optional[datetime]):
+        columns = self._columns
+        columns.end_timestamp[self._row - columns._base] = columns.to_time(value)
+
+    @property
+    def tag(self) -> Optional[str]:
+        extras = self._columns.extras[self._row - self._columns._base]
+        return extras.get("tag") if extras else None
+
+    @tag.setter
+    def tag(self, value: Optional[str]):
+        self._columns.set_extra(self._row - self._columns._base, "tag", value)
+
+    @property
+    def refs(self) -> Dict[str, Sequence | None]:
+        return self._columns.get_extra(self._row - self._columns._base, "refs")
+
+    @refs.setter
+    def refs(self, value: Dict[str, Sequence | None]):
+        self._columns.set_extra(self._row - self._columns._base, "refs", value)
+
+    @property
+    def _refs(self) -> Optional[Dict[str, Sequence | None]]:  # type: ignore
+        extras = self._columns.extras[self._row - self._columns._base]
+        return extras.get("refs") if extras else None
+
+    @property
+    def _table(self) -> ReadingTable:  # type: ignore
+        return self._columns.readings
+
+    @property
+    def _slot(self) -> int:  # type: ignore
+        return self._row - self._columns._base
+
+    def detach(self):
+        for derived in (self._refs or {}).values():
+            for candle in derived or []:
+                candle.detach()
+
+    def reset_candle(self):
+        self.detach()
+        index = self._row - self._columns._base
+        self._columns.readings.clear(index)
+        self._columns.extras[index] = None
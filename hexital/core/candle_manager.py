@@ -1,46 +1,139 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from functools import cmp_to_key
-from typing import List, Optional, Set, TypeAlias
+from typing import Any, List, Optional, Sequence, Set, Tuple, TypeAlias
 
-from hexital.core.candle import Candle
+from hexital.core.candle import Candle, shared_timeframe
+from hexital.core.candle_arrays import CandleArrays, is_array_like
+from hexital.core.candle_buffer import CandleBuffer
+from hexital.core.candle_columns import CandleColumns
+from hexital.core.candle_schema import CandleSchema
 from hexital.core.candlestick_type import CandlestickType
-from hexital.exceptions import InvalidCandleOrder
+from hexital.core.reading_table import ReadingTable
+from hexital.core.shared_candles import SharedCandleColumns, SharedCandles
+from hexital.exceptions import InvalidCandleOrder, InvalidConfiguration
 from hexital.utils.candles import reading_by_candle
 from hexital.utils.common import CalcMode
 from hexital.utils.timeframe import (
+    MICROSECOND,
     on_timeframe,
     round_down_timestamp,
     timedelta_to_str,
+    to_epoch,
     trim_timestamp,
 )
 
-Candles: TypeAlias = Candle | List[Candle] | dict | List[dict] | list | List[list]
+Candles: TypeAlias = (
+    Candle
+    | List[Candle]
+    | dict
+    | List[dict]
+    | list
+    | List[list]
+    | tuple
+    | List[tuple]
+    | CandleArrays
+    | Any
+)
 
 DEFAULT_CANDLES = "default"
 
 
+def _first_candle(candles: Candles) -> Optional[Candle]:
+    if isinstance(candles, Candle):
+        return candles
+    if isinstance(candles, (list, tuple)) and candles and isinstance(candles[0], Candle):
+        return candles[0]
+    return None
+
+
+def _compare_epochs(time_one: int, time_two: int, timeframe: int) -> int:
+    """Compares epoch microsecond timestamps, see `CandleManager._sort_comparison`"""
+    if timeframe and (
+        (time_two % timeframe and not time_one % timeframe and time_two > time_one - timeframe)
+        or (time_one % timeframe and not time_two % timeframe and time_one > time_two - timeframe)
+    ):
+        return 1
+    return time_one - time_two
+
+
+class _SortKey:
+    """Sort key of a Candle's epoch timestamp, ordering as `CandleManager._sort_comparison`
+    without converting the timestamp on every comparison"""
+
+    __slots__ = ("epoch", "timeframe")
+
+    def __init__(self, epoch: int, timeframe: int):
+        self.epoch = epoch
+        self.timeframe = timeframe
+
+    def __lt__(self, other: _SortKey) -> bool:
+        return _compare_epochs(self.epoch, other.epoch, self.timeframe) < 0
+
+
+def _cascade_copy(candle: Candle) -> Candle:
+    """Copies a resampled Candle to be resampled again into a higher timeframe. The copy is
+    timestamped at the latest Candle merged into it, so it resamples as those Candles would."""
+    copy = candle.clean_copy()
+    copy._start_timestamp = candle._start_timestamp
+    copy._end_timestamp = candle._end_timestamp
+    copy.timestamp = candle._end_timestamp or candle._start_timestamp or candle.timestamp
+    return copy
+
+
+def is_single_candle(candles: Candles) -> bool:
+    """Checks the given Candles are a single Candle, rather than a list of Candles"""
+    if isinstance(candles, (Candle, dict)):
+        return True
+    return isinstance(candles, (list, tuple)) and bool(candles) and not isinstance(
+        candles[0], (Candle, dict, list, tuple)
+    )
+
+
 class CandleManager:
     _name: Optional[str] = None
-    _candles: List[Candle]
+    _candles: List[Candle] | CandleBuffer | CandleColumns
+    _rolled: Optional[Tuple[List[Candle], int]] = None
+    # Changed whenever Candles are added or removed other than appending or trimming, positions
+    # counting every Candle ever trimmed, `_trimmed + index`, are comparable within a generation
+    _generation: int = 0
+    _trimmed: int = 0
     candle_life: Optional[timedelta]
     timeframe: Optional[timedelta] = None
     timeframe_fill: bool = False
     candlestick: Optional[CandlestickType] = None
+    max_candles: Optional[int] = None
+    columnar: bool = False
+    copy_candles: bool = True
+    schema: Optional[CandleSchema] = None
+    readings: ReadingTable
 
     def __init__(
         self,
-        candles: Optional[List[Candle]] = None,
+        candles: Optional[List[Candle] | SharedCandles] = None,
         candle_life: Optional[timedelta] = None,
         timeframe: Optional[timedelta] = None,
         timeframe_fill: bool = False,
         candlestick: Optional[CandlestickType] = None,
+        max_candles: Optional[int] = None,
+        columnar: bool = False,
+        copy_candles: bool = True,
+        schema: Optional[CandleSchema] = None,
     ):
+        if max_candles is not None and max_candles < 1:
+            raise InvalidConfiguration(f"max_candles must be at least 1: {max_candles}")
+
         self.candle_life = candle_life
-        self.timeframe = timeframe
+        self.max_candles = max_candles
+        self.timeframe = shared_timeframe(timeframe)
         self.timeframe_fill = timeframe_fill
-        self._candles = candles if candles else []
+        self.columnar = columnar
+        self.copy_candles = copy_candles
+        self.schema = schema
+        self.readings = ReadingTable()
+
+        self._candles = self._store_candles(candles)
 
         if candlestick:
             self.candlestick = candlestick
@@ -53,7 +146,16 @@ class CandleManager:
         if not isinstance(other, CandleManager):
             return False
 
-        for key in ["candle_life", "timeframe", "timeframe_fill", "candlestick"]:
+        for key in [
+            "candle_life",
+            "timeframe",
+            "timeframe_fill",
+            "candlestick",
+            "max_candles",
+            "columnar",
+            "copy_candles",
+            "schema",
+        ]:
             if getattr(self, key) != getattr(other, key):
                 return False
 
@@ -76,8 +178,24 @@ class CandleManager:
     def name(self, name: str):
         self._name = name
 
+    def _store_candles(
+        self, candles: Optional[List[Candle] | SharedCandles]
+    ) -> List[Candle] | CandleBuffer | CandleColumns:
+        """Wraps the Candles in the storage this manager uses, Candles expiring by candle_life or
+        max_candles are kept in a ring buffer, so expiring costs O(1). `SharedCandles` are read in
+        place, whatever the storage"""
+        if isinstance(candles, SharedCandles):
+            return candles.columns()
+        elif self.columnar:
+            return CandleColumns(candles)
+        elif self.max_candles is not None:
+            return CandleBuffer(candles, self.max_candles + 1)
+        elif self.candle_life is not None:
+            return CandleBuffer(candles)
+        return candles if candles else []
+
     @property
-    def candles(self) -> List[Candle]:
+    def candles(self) -> List[Candle] | CandleBuffer | CandleColumns:
         if self.candlestick:
             return self.candlestick.derived_candles
         return self._candles
@@ -85,10 +203,25 @@ class CandleManager:
     @candles.setter
     def candles(self, candles: List[Candle]):
         """Set the Candles in Candlestick manager and reset transformed Candles"""
-        self._candles = candles
+        self._candles = self._store_candles(candles)
+        self._generation += 1
         if self.candlestick:
+            self.candlestick.set_candle_refs(self._candles)
             self.candlestick.derived_candles.reset()
 
+    def retain(self, max_candles: Optional[int]):
+        """Changes `max_candles` and trims the Candles to the new cap. The Candle storage is kept
+        as is, as Indicators hold a reference to it"""
+        if max_candles is not None and max_candles < 1:
+            raise InvalidConfiguration(f"max_candles must be at least 1: {max_candles}")
+
+        self.max_candles = max_candles
+
+        if max_candles is not None and isinstance(self._candles, CandleBuffer):
+            self._candles.reserve(max_candles + 1)
+
+        self.trim_candles()
+
     def _candle_tasks(
         self,
         mode: CalcMode = CalcMode.INSERT,
@@ -107,11 +240,16 @@ class CandleManager:
     def _parse_candles(self, candles: Candles) -> List[Candle]:
         candles_ = []
 
+        if is_array_like(candles):
+            return self.load_arrays(candles).to_candles()
+        if self.schema and _first_candle(candles) is None:
+            return self.schema.parse(candles)
+
         if isinstance(candles, Candle):
             candles_.append(candles)
         elif isinstance(candles, dict):
             candles_.append(Candle.from_dict(candles))
-        elif isinstance(candles, list) and candles:
+        elif isinstance(candles, (list, tuple)) and candles:
             candle_ = candles[0]
             if isinstance(candle_, Candle):
                 candles_.extend(candles)
@@ -119,62 +257,327 @@ class CandleManager:
                 candles_.extend(Candle.from_dicts(candles))
             elif isinstance(candle_, (float, int, datetime)):
                 candles_.append(Candle.from_list(candles))
-            elif isinstance(candle_, list):
+            elif isinstance(candle_, (list, tuple)):
                 candles_.extend(Candle.from_lists(candles))
             else:
                 raise TypeError
 
         return candles_
 
-    def prepend(self, candles: Candles):
+    def load_arrays(self, candles: Any) -> CandleArrays:
+        """Loads a NumPy array, structured array or pandas DataFrame of Candles, using this
+        manager's schema if it has one"""
+        if self.schema:
+            return self.schema.load_arrays(candles)
+        return CandleArrays.load(candles)
+
+    def _ingest_candles(self, candles: Candles) -> List[Candle]:
+        """Parses the given Candles into Candle's owned by this manager. Raw dicts, lists and
+        tuples are read straight into new Candles, Candle objects are copied unless
+        `copy_candles` is disabled, in which case the manager takes ownership of them as is.
+        Candles of another manager's `CandleColumns` are views into it's columns, always copied."""
         candles_ = self._parse_candles(candles)
 
-        for candle in reversed(candles_):
-            if self.timeframe and candle.timeframe and candle.timeframe > self.timeframe:
-                continue
-            self._candles.insert(0, candle.clean_copy())
-
-        self._candle_tasks(CalcMode.PREPEND)
+        if self.copy_candles and candles_ and (
+            isinstance(candles, CandleColumns) or candles_[0] is _first_candle(candles)
+        ):
+            return [candle.clean_copy() for candle in candles_]
+        return candles_
 
-    def append(self, candles: Candles):
-        candles_ = self._parse_candles(candles)
+    def prepend(self, candles: Candles) -> List[int]:
+        """Prepends Candles in chronological order, splicing them onto the front in one block and
+        re-sampling only the prepended Candles, up to the first existing Candle.
+        Returns the indexes of the Candles changed by the prepend, every following Candle is only
+        moved along, keeping it's readings."""
+        candles_ = [
+            candle
+            for candle in self._ingest_candles(candles)
+            if not (self.timeframe and candle.timeframe and candle.timeframe > self.timeframe)
+        ]
+        existing = len(self._candles)
+        merges = self._candles[0].aggregation_factor if existing else 0
+
+        self._candles[0:0] = candles_
+        self._generation += 1
+        self._candle_tasks(CalcMode.PREPEND, 0)
+
+        # The prepended Candles left after trimming by candle_life or max_candles, followed by the
+        # first existing Candle, which is only changed if merged into or following on from them
+        count = len(self._candles) - existing
+        if count < 0 or (count == 0 and self._candles[0].aggregation_factor == merges):
+            return []
+        return list(range(min(count + 1, len(self._candles))))
+
+    def append(self, candles: Candles) -> bool:
+        """Appends Candles in chronological order. Returns True if any Candle was added, or
+        merged into the latest Candle, False if every Candle was skipped"""
+        if isinstance(self._candles, CandleColumns) and is_array_like(candles):
+            index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+            self._rolled = None
+            appended = self._append_arrays(self.load_arrays(candles))
+            self._candle_tasks(CalcMode.APPEND, index)
+            return appended
+
+        return self._append_candles(self._ingest_candles(candles))
+
+    def _append_candles(self, candles_: List[Candle]) -> bool:
+        """Appends Candles already owned by this manager"""
         index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+        self._rolled = None
+
+        if self._roll_candles(candles_):
+            self.candlestick_conversion(CalcMode.APPEND, index)
+            self.trim_candles()
+            return True
 
+        appended = False
         for candle in candles_:
             if self.timeframe and candle.timeframe and candle.timeframe > self.timeframe:
                 continue
 
-            self._candles.append(candle.clean_copy())
+            self._candles.append(candle)
+            appended = True
 
         self._candle_tasks(CalcMode.APPEND, index)
+        return appended
 
-    def insert(self, candles: Candles):
-        candles_ = self._parse_candles(candles)
+    def _can_roll(self, candles: List[Candle]) -> bool:
+        """Whether the Candles are raw Candles in chronological order, following on from the
+        latest resampled Candle, which can be rolled in place rather than resampled"""
+        if not self.timeframe or self.timeframe_fill or not self._candles or not candles:
+            return False
+
+        latest = self._candles[-1]
+        if (
+            latest.timeframe != self.timeframe
+            or not latest.timestamp
+            or not on_timeframe(latest.timestamp, self.timeframe)
+        ):
+            return False
+
+        first = candles[0].timestamp
+        if not first or trim_timestamp(first) <= latest.timestamp - self.timeframe:
+            return False
+
+        previous = first
+        for candle in candles:
+            if (
+                not candle.timestamp
+                or candle.timestamp < previous
+                or (candle.timeframe and candle.timeframe >= self.timeframe)
+            ):
+                return False
+            previous = candle.timestamp
+
+        return True
+
+    def _roll_candles(self, candles: List[Candle]) -> bool:
+        """Resamples Candles appended in order in constant time each, merging each Candle into
+        the open resampled Candle, or rolling it into the next one, as `resample_candles` would
+        without removing and re-inserting the latest Candles. Returns False, changing nothing,
+        if the Candles need `resample_candles`, such as when out of order."""
+        if not self._can_roll(candles):
+            return False
+
+        timeframe: timedelta = self.timeframe  # type: ignore
+        latest = self._candles[-1]
+        merged = []
+        count = 0
+
+        for candle in candles:
+            timestamp = trim_timestamp(candle.timestamp)  # type: ignore
+            candle.timestamp = timestamp
+            candle.timeframe = timeframe
+
+            if latest.timestamp - timeframe < timestamp <= latest.timestamp:
+                latest.merge(candle)
+                candle.detach()
+                if not count:
+                    merged.append(candle)
+                continue
+
+            if on_timeframe(timestamp, timeframe):
+                candle.set_resampled_timestamp(timestamp)
+            else:
+                candle.set_resampled_timestamp(
+                    round_down_timestamp(timestamp, timeframe) + timeframe
+                )
+
+            self._candles.append(candle)
+            latest = self._candles[-1]
+            count += 1
+
+        self._rolled = (merged, count)
+        return True
+
+    def _cascade_candles(self) -> Optional[List[Candle]]:
+        """The Candles to feed a higher timeframe in place of the Candles last appended, when
+        they were rolled in order: the Candles merged into the already open Candle, followed by
+        a copy of each new Candle. None if they were resampled by `resample_candles`."""
+        if self._rolled is None:
+            return None
+
+        merged, count = self._rolled
+        length = len(self._candles)
+        if count > length:
+            return None
+
+        return merged + [_cascade_copy(self._candles[i]) for i in range(length - count, length)]
+
+    def _cascade_history(self) -> List[Candle]:
+        """A copy of every Candle to feed a higher timeframe in place of the Candles they
+        were resampled from"""
+        return [_cascade_copy(candle) for candle in self._candles]
+
+    def _append_arrays(self, candles: CandleArrays) -> bool:
+        """Columnar storage only, copies the arrays straight into the Candle columns"""
+        if self.timeframe and candles.timeframe and candles.timeframe > self.timeframe:
+            return False
+        self._candles.extend_arrays(candles)  # type: ignore
+        return len(candles) > 0
+
+    def sync(self, managers: Sequence[CandleManager] = ()) -> int:
+        """Shared Candles only, extends the Candles to those appended to the `SharedCandles`
+        since, returning the number of new Candles. The new Candles are appended to the given
+        CandleManagers before this manager trims it's Candles.
+
+        Args:
+            managers: Other CandleManagers to append the new Candles to
+        """
+        if not isinstance(self._candles, SharedCandleColumns):
+            raise InvalidConfiguration(f"CandleManager '{self.name}' isn't reading SharedCandles")
+
+        index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+        count = self._candles.sync()
+        if not count:
+            return 0
+
+        candles = self._candles[-count:]
+        for manager in managers:
+            manager.append(candles)
+
+        self._candle_tasks(CalcMode.APPEND, index)
+        return count
+
+    def append_tick(self, timestamp: datetime, price: float, size: float | int = 0) -> bool:
+        """Adds a single trade to the latest Candle, only updating the forming Candle in place
+        rather than resampling. Trades must be in chronological order, use `insert` otherwise.
+        Returns True if the trade opened a new Candle, closing the previous one.
+
+        Args:
+            timestamp: Time of the trade
+            price: Price of the trade
+            size: Size of the trade, added to the Candle's volume
+        """
+        index = len(self._candles) - 1 if len(self._candles) > 0 else 0
+
+        if not self.timeframe:
+            self._candles.append(Candle(price, price, price, price, size, timestamp=timestamp))
+            self._candle_tasks(CalcMode.APPEND, index)
+            return True
+
+        timestamp = trim_timestamp(timestamp)
+        candle = self._candles[-1] if self._candles else None
+        if (
+            candle is not None
+            and candle.timeframe == self.timeframe
+            and candle.timestamp - self.timeframe < timestamp <= candle.timestamp
+        ):
+            candle.high = max(candle.high, price)
+            candle.low = min(candle.low, price)
+            candle.close = price
+            candle.volume += size
+            candle.aggregation_factor += 1
+            start = candle._start_timestamp
+            if start and timestamp > (candle._end_timestamp or start):
+                candle._end_timestamp = timestamp
+            candle.reset_candle()
+
+            self.candlestick_conversion(CalcMode.APPEND, index)
+            return False
+
+        if on_timeframe(timestamp, self.timeframe):
+            end_time = timestamp
+        else:
+            end_time = round_down_timestamp(timestamp, self.timeframe) + self.timeframe
+
+        new_candle = Candle(price, price, price, price, size, timestamp, self.timeframe)
+        new_candle.set_resampled_timestamp(end_time)
+
+        candles = [new_candle]
+        if self.timeframe_fill and candle is not None and candle.timestamp:
+            candles = self._fill_timeframe_candles([candle, new_candle], self.timeframe)[1:]
+        for candle_ in candles:
+            self._candles.append(candle_)
+
+        self.candlestick_conversion(CalcMode.APPEND, index)
+        self.trim_candles()
+        return True
+
+    def insert(self, candles: Candles) -> List[int]:
+        """Inserts Candles in any order, placing each with a binary search and re-sampling from
+        the earliest placed.
+        Returns the indexes of the Candles changed by the insert, earliest first, every Candle
+        between them is only moved along, keeping it's readings."""
+        candles_ = self._ingest_candles(candles)
 
         self.sort_candles(candles_)
 
-        to_sort = False
-        last_timestamp = self._candles[-1].timestamp if self._candles else None
+        start_index = len(self._candles)
+        timestamps = []
+        self._generation += 1
 
         for candle in candles_:
             if self.timeframe and candle.timeframe and candle.timeframe > self.timeframe:
                 continue
-            elif last_timestamp and candle.timestamp < last_timestamp:
-                to_sort = True
 
-            self._candles.append(candle.clean_copy())
+            index = self._insert_index(candle)
+            self._candles.insert(index, candle)
+            start_index = min(start_index, index)
+            timestamps.append(trim_timestamp(candle.timestamp))
 
-        if to_sort:
-            self.sort_candles()
+        self._candle_tasks(CalcMode.INSERT, max(start_index - 1, 0))
+        return self._changed_indexes(timestamps)
 
-        self._candle_tasks(CalcMode.INSERT)
+    def _insert_index(self, candle: Candle) -> int:
+        """Binary searches for where the Candle sorts within the Candles, as `sort_candles` orders
+        them, comparing epoch timestamps. Columnar storage is searched on it's timestamp column."""
+        if isinstance(self._candles, CandleColumns):
+            candles, epoch_of = self._candles.timestamp, None
+        else:
+            candles, epoch_of = self._candles, lambda candle_: to_epoch(candle_.timestamp)
+
+        epoch = to_epoch(candle.timestamp)
+        if not self.timeframe:
+            return bisect_right(candles, epoch, key=epoch_of)  # type: ignore
+
+        timeframe = self.timeframe // MICROSECOND
+        return bisect_right(
+            candles,  # type: ignore
+            _SortKey(epoch, timeframe),
+            key=lambda item: _SortKey(epoch_of(item) if epoch_of else item, timeframe),
+        )
+
+    def _changed_indexes(self, timestamps: List[datetime]) -> List[int]:
+        """Indexes of the Candles holding the given timestamps, the resampled Candle they were
+        merged into when resampling"""
+        changed = {
+            bisect_left(self._candles, timestamp, key=lambda candle: candle.timestamp)
+            for timestamp in timestamps
+        }
+        return sorted(index for index in changed if index < len(self._candles))
 
     def sort_candles(self, candles: Optional[List[Candle]] = None):
         """Sorts Candles in order of timestamp, accounts for collapsing"""
-        if candles:
-            candles.sort(key=cmp_to_key(self._sort_comparison))
+        candles_ = candles if candles else self._candles
+        if candles_ is self._candles:
+            self._generation += 1
+
+        if not self.timeframe:
+            candles_.sort(key=lambda candle: to_epoch(candle.timestamp))
         else:
-            self._candles.sort(key=cmp_to_key(self._sort_comparison))
+            timeframe = self.timeframe // MICROSECOND
+            candles_.sort(key=lambda candle: _SortKey(to_epoch(candle.timestamp), timeframe))
 
     def _sort_comparison(self, candle_one: Candle, candle_two: Candle) -> int:
         """Sort's Candles in order but if timeframe exists, sorts with collapsing in mind.
@@ -183,37 +586,35 @@ class CandleManager:
             No Timeframe : [09:05:00 09:02:00 09:10:00] > [09:02:00 09:05:00 09:10:00]
             T5 Timeframe : [09:05:00 09:02:00 09:10:00] > [09:05:00 09:02:00 09:10:00]
         """
-        time_one = candle_one.timestamp.timestamp()
-        time_two = candle_two.timestamp.timestamp()
-
-        if not self.timeframe:
-            return int(time_one - time_two)
+        return _compare_epochs(
+            to_epoch(candle_one.timestamp),
+            to_epoch(candle_two.timestamp),
+            self.timeframe // MICROSECOND if self.timeframe else 0,
+        )
 
-        timeframe = self.timeframe.total_seconds()
+    def trim_candles(self):
+        if not self._candles:
+            return
 
-        if (
-            time_two % timeframe
-            and not time_one % timeframe
-            and candle_two.timestamp > candle_one.timestamp - self.timeframe
-        ) or (
-            time_one % timeframe
-            and not time_two % timeframe
-            and candle_one.timestamp > candle_two.timestamp - self.timeframe
-        ):
-            return 1
+        count = 0
+        if self.max_candles is not None:
+            count = max(len(self._candles) - self.max_candles, 0)
 
-        return int(time_one - time_two)
+        if self.candle_life is not None and self._candles[-1].timestamp:
+            expiry = self._candles[-1].timestamp - self.candle_life
+            for index in range(count, len(self._candles)):
+                timestamp = self._candles[index].timestamp
+                if not timestamp or timestamp >= expiry:
+                    break
+                count += 1
 
-    def trim_candles(self):
-        if self.candle_life is None or not self._candles:
+        if not count:
             return
 
-        while (
-            self._candles[0].timestamp
-            and self._candles[-1].timestamp
-            and self._candles[0].timestamp < self._candles[-1].timestamp - self.candle_life
-        ):
-            self._candles.pop(0)
+        for candle in self._candles[:count]:
+            candle.detach()
+        del self._candles[:count]
+        self._trimmed += count
 
     def resample_candles(
         self,
@@ -223,10 +624,10 @@ class CandleManager:
         """resamples the given list of candles into specific timeframe candles.
         This can re-ran with same list to resample latest candles.
         This method is destructive, generating a new list for the resampled candles"""
-        if mode == CalcMode.INSERT:
-            start_index = 0
-        elif index is not None:
+        if index is not None:
             start_index = index
+        elif mode == CalcMode.INSERT:
+            start_index = 0
         else:
             start_index = self._find_resample_index()
 
@@ -234,12 +635,20 @@ class CandleManager:
             return
 
         end_index = len(self._candles)
+        # Candles are read from `position` on and replaced in one splice, rather than popped one
+        # at a time, columnar Candles are read as detached Candles as `pop` would give
+        if isinstance(self._candles, CandleColumns):
+            take = self._candles.materialise
+        else:
+            take = self._candles.__getitem__
 
-        candles_ = [self._candles.pop(start_index)]
+        candles_ = [take(start_index)]
+        position = start_index + 1
 
         init_candle = candles_[0]
         init_candle.timeframe = self.timeframe
         if not init_candle.timestamp:
+            del self._candles[start_index:position]
             return
 
         start_time = round_down_timestamp(init_candle.timestamp, self.timeframe)
@@ -248,20 +657,21 @@ class CandleManager:
         if not on_timeframe(init_candle.timestamp, self.timeframe):
             init_candle.set_resampled_timestamp(end_time)
 
-        for _ in range(abs(end_index - start_index)):
-            if len(self._candles) <= start_index:
-                break
-
-            candle = self._candles.pop(start_index)
+        while position < end_index:
+            candle = take(position)
+            position += 1
             prev_candle = candles_[-1]
 
             if not candle.timestamp:
+                del self._candles[start_index:position]
                 return
 
+            # Prepended Candles can end within the first resampled Candle, which is merged
             if (
                 mode != CalcMode.INSERT
                 and candle.timeframe == self.timeframe
                 and prev_candle.timeframe == self.timeframe
+                and (mode != CalcMode.PREPEND or candle.timestamp != prev_candle.timestamp)
             ):
                 candles_.append(candle)
                 break
@@ -272,11 +682,13 @@ class CandleManager:
 
             if start_time < candle.timestamp <= end_time and prev_candle.timestamp == end_time:
                 prev_candle.merge(candle)
+                candle.detach()
             elif (
                 start_time - self.timeframe < candle.timestamp <= start_time
                 and prev_candle.timestamp == start_time
             ):
                 prev_candle.merge(candle)
+                candle.detach()
             elif start_time < candle.timestamp <= end_time:
                 candle.set_resampled_timestamp(end_time)
                 candles_.append(candle)
@@ -306,7 +718,7 @@ class CandleManager:
                 candles_, self.timeframe, start_index, end_index
             )
 
-        self._candles[start_index:start_index] = candles_
+        self._candles[start_index:position] = candles_
 
     def _find_resample_index(self) -> int:
         """Optimisation method, to find where to start calculating the indicator from
@@ -378,7 +790,16 @@ class CandleManager:
         if isinstance(indicator, str):
             indicator = {indicator}
 
+        self._generation += 1
+        tables = set()
         for candle in self.candles:
+            if candle._table is not None:
+                tables.add(candle._table)
+                continue
+
             for name in indicator:
                 candle.indicators.pop(name, None)
                 candle.sub_indicators.pop(name, None)
+
+        for table in tables:
+            table.drop(indicator)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from hexital.core.candle import Candle, shared_timeframe
+from hexital.core.candle_arrays import CandleArrays
+from hexital.exceptions import InvalidConfiguration
+from hexital.utils.timeframe import TimeFramesSource
+
+SCHEMA_FIELDS = ("timestamp", "open", "high", "low", "close", "volume", "timeframe")
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UNITS = {
+    "s": ("seconds", 1),
+    "ms": ("milliseconds", 1),
+    "us": ("microseconds", 1),
+    "ns": ("microseconds", 1000),
+}
+
+
+class CandleSchema:
+    """Declares the layout of raw list or dict Candle data once, compiling a parser that reads
+    each row straight into a Candle, skipping the per-row key probing and type checks done by
+    `Candle.from_list` and `Candle.from_dict`.
+
+    Args:
+        columns: The Candle field held at each position of a list row, in order. `None` skips
+            that position. Defaults to `timestamp, open, high, low, close, volume`.
+        keys: Dict rows only, maps each Candle field to it's key within the row. Defaults to the
+            names in `columns`.
+        timestamp_format: A `datetime.strptime` format for string timestamps, otherwise string
+            timestamps are read with `datetime.fromisoformat`.
+        epoch_unit: Reads timestamps as epoch numbers of 's', 'ms', 'us' or 'ns'. Converted to
+            naive UTC datetime's.
+        timeframe: Timeframe given to every Candle, when not a column.
+    """
+
+    columns: Sequence[Optional[str]]
+    keys: Dict[str, Any]
+    timestamp_format: Optional[str] = None
+    epoch_unit: Optional[str] = None
+    timeframe: Optional[timedelta] = None
+
+    _list_parser: Callable[[Sequence], Candle]
+    _dict_parser: Callable[[Dict[str, Any]], Candle]
+
+    def __init__(
+        self,
+        columns: Sequence[Optional[str]] = ("timestamp", "open", "high", "low", "close", "volume"),
+        keys: Optional[Dict[str, Any]] = None,
+        timestamp_format: Optional[str] = None,
+        epoch_unit: Optional[str] = None,
+        timeframe: Optional[TimeFramesSource] = None,
+    ):
+        for column in columns:
+            if column is not None and column not in SCHEMA_FIELDS:
+                raise InvalidConfiguration(f"Unknown CandleSchema column: {column}")
+        if keys is None:
+            keys = {column: column for column in columns if column}
+        for field in OHLCV_FIELDS:
+            if field not in columns or field not in keys:
+                raise InvalidConfiguration(f"CandleSchema missing required column: {field}")
+        if epoch_unit is not None and epoch_unit not in EPOCH_UNITS:
+            raise InvalidConfiguration(f"Unknown CandleSchema epoch_unit: {epoch_unit}")
+        if epoch_unit and timestamp_format:
+            raise InvalidConfiguration("CandleSchema takes either epoch_unit or timestamp_format")
+
+        self.columns = tuple(columns)
+        self.keys = dict(keys)
+        self.timestamp_format = timestamp_format
+        self.epoch_unit = epoch_unit
+        self.timeframe = shared_timeframe(timeframe)
+
+        self._list_parser = self._compile(
+            {column: index for index, column in enumerate(self.columns) if column}
+        )
+        self._dict_parser = self._compile(self.keys)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CandleSchema):
+            return False
+        return all(
+            getattr(self, key) == getattr(other, key)
+            for key in ["columns", "keys", "timestamp_format", "epoch_unit", "timeframe"]
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CandleSchema(columns={self.columns}, keys={self.keys}, "
+            f"timestamp_format={self.timestamp_format}, epoch_unit={self.epoch_unit}, "
+            f"timeframe={self.timeframe})"
+        )
+
+    def __reduce__(self) -> tuple:
+        # Rebuilt from it's arguments, the compiled parsers can't be pickled
+        return (
+            CandleSchema,
+            (self.columns, self.keys, self.timestamp_format, self.epoch_unit, self.timeframe),
+        )
+
+    def _timestamp_converter(self) -> Optional[Callable[[Any], datetime]]:
+        if self.epoch_unit:
+            unit, divisor = EPOCH_UNITS[self.epoch_unit]
+            if divisor == 1:
+                return lambda value: EPOCH + timedelta(**{unit: value})
+            return lambda value: EPOCH + timedelta(**{unit: value / divisor})
+        if self.timestamp_format:
+            format_ = self.timestamp_format
+            return lambda value: datetime.strptime(value, format_)
+        return None
+
+    def _compile(self, locations: Dict[str, Any]) -> Callable[[Any], Candle]:
+        """Builds a parser reading each field from it's location, an index or key, in a row"""
+        ohlcv = itemgetter(*(locations[field] for field in OHLCV_FIELDS))
+        timestamp_at = locations.get("timestamp")
+        timeframe_at = locations.get("timeframe")
+        convert = self._timestamp_converter()
+        timeframe = self.timeframe
+
+        def parse(row) -> Candle:
+            timestamp = row[timestamp_at] if timestamp_at is not None else None
+            if convert and timestamp is not None:
+                timestamp = convert(timestamp)
+            return Candle(
+                *ohlcv(row),
+                timestamp=timestamp,
+                timeframe=row[timeframe_at] if timeframe_at is not None else timeframe,
+            )
+
+        return parse
+
+    def parse_row(self, row: Sequence | Dict[str, Any]) -> Candle:
+        """Parses a single list, tuple or dict row into a Candle"""
+        if isinstance(row, dict):
+            return self._dict_parser(row)
+        return self._list_parser(row)
+
+    def parse_rows(self, rows: Sequence[Sequence] | Sequence[Dict[str, Any]]) -> List[Candle]:
+        """Parses rows all of the same type, lists/tuples or dicts, into Candles"""
+        if not rows:
+            return []
+        parser = self._dict_parser if isinstance(rows[0], dict) else self._list_parser
+        return list(map(parser, rows))
+
+    def parse(self, candles: Any) -> List[Candle]:
+        """Parses either a single row or a sequence of rows into Candles"""
+        if isinstance(candles, dict):
+            return [self._dict_parser(candles)]
+        if candles and isinstance(candles[0], (dict, list, tuple)):
+            return self.parse_rows(candles)
+        return [self._list_parser(candles)] if candles else []
+
+    def load_arrays(self, candles: Any) -> CandleArrays:
+        """Loads a 2D NumPy array, structured array or pandas DataFrame using this schema's
+        columns, keys and timestamp format, see `CandleArrays.load`"""
+        return CandleArrays.load(
+            candles,
+            keys=self.keys,
+            columns=list(self.columns),
+            epoch_unit=self.epoch_unit,
+            timestamp_format=self.timestamp_format,
+            timeframe=self.timeframe,
+        )
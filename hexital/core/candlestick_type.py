@@ -58,14 +58,21 @@ class CandlestickType(ABC):
 
             # None Candles never added to derived
             if not candles:
+                self._release_derived(candle)
                 candle.refs[self.acronym] = None
                 continue
 
             if candles := self._insert_derived_candles(candles):
+                self._release_derived(candle)
                 candle.refs[self.acronym] = candles
             else:
                 break
 
+    def _release_derived(self, candle: Candle):
+        """Detach's the Candle's previously derived Candles, freeing their reading slots"""
+        for derived in candle.refs.get(self.acronym) or []:
+            derived.detach()
+
     def _insert_derived_candles(self, candles: Candle | Sequence[Candle]) -> Sequence:
         candle_ = candles if isinstance(candles, Sequence) else [candles]
 
@@ -1,18 +1,25 @@
 from copy import copy
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import wraps
 from importlib import import_module
-from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
 
 from hexital.core import Reading
 from hexital.core.candle import Candle
+from hexital.core.candle_arrays import CandleArrays, is_array_like
+from hexital.core.candle_columns import CandleColumns
 from hexital.core.candle_manager import DEFAULT_CANDLES, CandleManager, Candles
+from hexital.core.candle_schema import CandleSchema
 from hexital.core.candlestick_type import CandlestickType
 from hexital.core.indicator import Indicator, NestedSource, Source
 from hexital.core.indicator_collection import IndicatorCollection
-from hexital.exceptions import InvalidAnalysis, InvalidIndicator
+from hexital.core.shared_candles import SharedCandles
+from hexital.core.snapshot import HexitalSnapshot
+from hexital.exceptions import InvalidAnalysis, InvalidConfiguration, InvalidIndicator
 from hexital.indicators.amorph import Amorph
 from hexital.utils.candles import reading_by_candle, reading_by_index
 from hexital.utils.candlesticks import validate_candlesticktype
+from hexital.utils.rwlock import ReadWriteLock
 from hexital.utils.timeframe import (
     TimeFramesSource,
     convert_timeframe_to_timedelta,
@@ -20,29 +27,86 @@ from hexital.utils.timeframe import (
     timeframe_validation,
 )
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _writes(method: F) -> F:
+    """Runs the method as the single writer of a `thread_safe` Hexital, publishing a new
+    snapshot once the outermost write is done"""
+
+    @wraps(method)
+    def wrapper(self: "Hexital", *args, **kwargs):
+        if self._lock is None:
+            return method(self, *args, **kwargs)
+
+        with self._lock.write:
+            self._writing += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._writing -= 1
+                if not self._writing:
+                    self._publish()
+
+    return wrapper  # type: ignore
+
+
+def _reads(method: F) -> F:
+    """Runs the method between writes of a `thread_safe` Hexital, alongside any other reads"""
+
+    @wraps(method)
+    def wrapper(self: "Hexital", *args, **kwargs):
+        if self._lock is None:
+            return method(self, *args, **kwargs)
+
+        with self._lock.read:
+            return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore
+
 
 class Hexital:
     name: str
     description: Optional[str] = None
     timeframe_fill: bool = False
     candle_life: Optional[timedelta] = None
+    max_candles: Optional[int] = None
     candlestick: Optional[CandlestickType]
+    columnar: bool = False
+    auto_trim: bool = False
+    convergence: int = 50
+    copy_candles: bool = True
+    schema: Optional[CandleSchema] = None
+    batch: bool = False
+    thread_safe: bool = False
 
     _candle_map: Dict[str, CandleManager]
+    _auto_trimmed: Set[str]
     _indicators: Dict[str, Indicator]
     _timeframe: Optional[timedelta]
     _default_name: str
+    _lock: Optional[ReadWriteLock] = None
+    _writing: int = 0
+    _snapshot: Optional[HexitalSnapshot] = None
 
     def __init__(
         self,
         name: str,
-        candles: Sequence[Candle],
+        candles: Sequence[Candle] | SharedCandles,
         indicators: Optional[Sequence[Dict[str, Any] | Indicator] | IndicatorCollection] = None,
         description: Optional[str] = None,
         timeframe: Optional[TimeFramesSource] = None,
         timeframe_fill: bool = False,
         candle_life: Optional[timedelta] = None,
         candlestick: Optional[CandlestickType | str] = None,
+        columnar: bool = False,
+        max_candles: Optional[int] = None,
+        auto_trim: bool = False,
+        convergence: int = 50,
+        copy_candles: bool = True,
+        schema: Optional[CandleSchema] = None,
+        batch: bool = False,
+        thread_safe: bool = False,
     ):
         self.name = name
         self.description = description
@@ -50,17 +114,52 @@ class Hexital:
         self._timeframe = convert_timeframe_to_timedelta(timeframe)
         self.timeframe_fill = timeframe_fill
         self.candle_life = candle_life
+        self.max_candles = max_candles
+        self.columnar = columnar
+        self.auto_trim = auto_trim
+        self.convergence = convergence
+        self.copy_candles = copy_candles
+        self.schema = schema
+        self.batch = batch
+        self.thread_safe = thread_safe
+        self._auto_trimmed = set()
+        self._lock = ReadWriteLock() if thread_safe else None
+        self._writing = 0
 
         self.candlestick = validate_candlesticktype(candlestick) if candlestick else None
 
+        if isinstance(candles, SharedCandles) and (self._timeframe or self.candlestick):
+            raise InvalidConfiguration(
+                "SharedCandles are read in place, they can't be resampled by a default timeframe "
+                "or transformed by a candlestick, set these on the Indicators instead"
+            )
+
+        arrays = self._load_arrays(candles) if is_array_like(candles) else None
+        if arrays is not None:
+            candles = []
+        elif (
+            schema
+            and candles
+            and not isinstance(candles, SharedCandles)
+            and not isinstance(candles[0], Candle)
+        ):
+            candles = schema.parse_rows(candles)  # type: ignore
+
         manager = CandleManager(
-            candles if isinstance(candles, list) else [],
+            candles if isinstance(candles, (list, SharedCandles)) else [],
             candle_life=self.candle_life,
             timeframe=self._timeframe,
             timeframe_fill=self.timeframe_fill,
             candlestick=self.candlestick,
+            max_candles=self.max_candles,
+            columnar=self.columnar,
+            copy_candles=self.copy_candles,
+            schema=self.schema,
         )
 
+        if arrays is not None:
+            manager.append(arrays)
+
         self._default_name = manager.name
         self._candle_map = {manager.name: manager}
 
@@ -71,6 +170,20 @@ class Hexital:
         else:
             self._indicators = self._validate_indicators(indicators)
 
+        self._trim_to_lookback()
+        self._snapshot = None
+        if self._lock is not None:
+            self._publish()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = ReadWriteLock() if self.thread_safe else None
+
     @property
     def timeframe(self) -> str | None:
         return timedelta_to_str(self._timeframe) if self._timeframe else None
@@ -94,24 +207,59 @@ class Hexital:
             return any(v is not None for v in value.values())
         return value is not None
 
+    @_reads
     def candles(self, name: Optional[TimeFramesSource] = None) -> List[Candle]:
-        """Get a set of candles by using either a Timeframe or Indicator name"""
+        """Get a set of candles by using either a Timeframe or Indicator name.
+        When `thread_safe`, returns detached copies of the Candles, with their readings"""
         name_ = name if name else self._default_name
         timeframe_name = self._parse_timeframe(name)
 
         name_ = timeframe_name if timeframe_name else name_
 
         if isinstance(name_, str) and self._candle_map.get(name_, False):
-            return self._candle_map[name_].candles
+            return self._shared_candles(self._candle_map[name_])
         elif isinstance(name_, str):
             for manager in self._candle_map.values():
                 if manager.find_indicator(name_):
-                    return manager.candles
+                    return self._shared_candles(manager)
 
         return []
 
+    @_reads
     def get_candles(self) -> Dict[str, List[Candle]]:
-        return {name: manager.candles for name, manager in self._candle_map.items()}
+        return {name: self._shared_candles(manager) for name, manager in self._candle_map.items()}
+
+    def _shared_candles(self, manager: CandleManager) -> List[Candle]:
+        """The manager's Candles, copied with their readings when `thread_safe`, so they aren't
+        changed by the writer as they're being read"""
+        candles = manager.candles
+        if self._lock is None:
+            return candles
+        if isinstance(candles, CandleColumns):
+            return candles.copy()
+        return [copy(candle) for candle in candles]
+
+    def snapshot(self) -> HexitalSnapshot:
+        """A consistent copy of the latest Candle and each Indicator's latest reading. When
+        `thread_safe` this is the snapshot published by the last write, read without locking,
+        otherwise it's created when called."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._create_snapshot()
+        return snapshot
+
+    def _create_snapshot(self, generation: int = 0) -> HexitalSnapshot:
+        candles = self._candle_map[self._default_name].candles
+        return HexitalSnapshot(
+            generation,
+            candles[-1].clean_copy() if candles else None,
+            {name: self._find_reading(name) for name in self._indicators},
+        )
+
+    def _publish(self):
+        """Publishes a new snapshot, replacing the previous one in a single assignment"""
+        generation = self._snapshot.generation + 1 if self._snapshot else 0
+        self._snapshot = self._create_snapshot(generation)
 
     @property
     def settings(self) -> dict:
@@ -120,6 +268,12 @@ class Hexital:
         for name, value in self.__dict__.items():
             if name in ["candles", "timeframe_fill"]:
                 continue
+            if name in ["columnar", "auto_trim", "batch", "thread_safe"] and not value:
+                continue
+            if name == "convergence" and not self.auto_trim:
+                continue
+            if name == "copy_candles" and value:
+                continue
             if name == "candlestick" and value:
                 output[name] = value.acronym if value.acronym else value.name
             elif not name.startswith("_") and value is not None:
@@ -194,21 +348,81 @@ class Hexital:
     def reading(self, source: Source, index: int = -1) -> Reading:
         """Attempts to retrieve a reading with a given Indicator name.
         `name` can use '.' to find nested reading, E.G `MACD_12_26_9.MACD`
+        When `thread_safe`, the latest reading is read from the published snapshot, without locking
         """
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and index == -1
+            and isinstance(source, str)
+            and source.partition(".")[0] in snapshot.readings
+            and not self._lock.is_writer()  # type: ignore
+        ):
+            return snapshot.reading(source)
+        return self._reading(source, index)
+
+    @_reads
+    def _reading(self, source: Source, index: int) -> Reading:
         return self._find_reading(source, index)
 
+    @_reads
     def prev_reading(self, source: Source) -> Reading:
         return self._find_reading(source, -2)
 
+    @_reads
     def readings(self) -> Dict[str, List[Reading]]:
         """Returns a Dictionary of all the Indicators and there results in a list format."""
         return {name: indicator.readings() for name, indicator in self._indicators.items()}
 
+    @_reads
+    def readings_as_arrays(self) -> Dict[str, Any]:
+        """Exports every Indicator's readings as NumPy float64 arrays, NaN where there's no
+        reading. One array per output, multi value Indicators are split into `name.output`
+        arrays, E.G `MACD_12_26_9.MACD`. Requires NumPy."""
+        arrays = {}
+        for indicator in self._indicators.values():
+            arrays.update(indicator.readings_as_arrays())
+        return arrays
+
+    @_reads
+    def readings_as_frame(self, timeframe: Optional[TimeFramesSource] = None) -> Any:
+        """Assembles a pandas DataFrame of the OHLCV values and Indicator readings of a
+        timeframe's Candles, indexed by timestamp. Defaults to the Hexital timeframe, only
+        Indicators on that timeframe are included. Requires pandas."""
+        import numpy as np
+        import pandas as pd
+
+        timeframe_name = self._parse_timeframe(timeframe)
+        manager = self._candle_map.get(timeframe_name or self._default_name)
+        if manager is None:
+            return pd.DataFrame()
+
+        candles = manager.candles
+        if isinstance(candles, CandleColumns):
+            data = {
+                field: np.array(getattr(candles, field), dtype=np.float64)
+                for field in ["open", "high", "low", "close", "volume"]
+            }
+        else:
+            data = {
+                field: np.array([getattr(candle, field) for candle in candles], dtype=np.float64)
+                for field in ["open", "high", "low", "close", "volume"]
+            }
+        for indicator in self._indicators.values():
+            if indicator.candle_manager is manager:
+                data.update(indicator.readings_as_arrays())
+
+        return pd.DataFrame(
+            data, index=pd.DatetimeIndex([candle.timestamp for candle in candles], name="timestamp")
+        )
+
+    @_reads
     def reading_as_list(self, source: Source) -> List[Reading]:
         """Find given indicator and returns the readings as a list
         Full Name of the indicator E.G `EMA_12` OR `MACD_12_26_9.MACD`"""
         return self._find_readings(source)
 
+    @_writes
     def add_indicator(
         self, indicator: Indicator | List[Indicator | Dict[str, Any]] | Dict[str, Any]
     ):
@@ -221,6 +435,9 @@ class Hexital:
         for name, valid_indicator in self._validate_indicators(indicators).items():
             self._indicators[name] = valid_indicator
 
+        self._trim_to_lookback()
+
+    @_writes
     def remove_indicator(self, source: Source):
         """Removes an indicator from running within hexital"""
         indicator = self._find_indicator(source)
@@ -229,76 +446,194 @@ class Hexital:
 
         indicator.purge()
         self._indicators.pop(indicator.name)
+        self._trim_to_lookback()
+
+    def _load_arrays(self, candles: Any) -> CandleArrays:
+        """Loads bulk array Candles once, rather than in every CandleManager"""
+        if self.schema:
+            return self.schema.load_arrays(candles)
+        return CandleArrays.load(candles)
+
+    def _feed_order(self) -> List[CandleManager]:
+        """CandleManagers in the order to feed them new Candles. The default CandleManager is fed
+        last, as with `copy_candles` disabled it takes ownership of the given Candles, every other
+        CandleManager must copy them before they are modified"""
+        managers = [m for n, m in self._candle_map.items() if n != self._default_name]
+        managers.append(self._candle_map[self._default_name])
+        return managers
+
+    def _cascade_order(self) -> List[CandleManager]:
+        """The `_feed_order`, with the other CandleManagers from the lowest timeframe up, so a
+        timeframe's source is always fed before it"""
+        managers = self._feed_order()
+        managers[:-1] = sorted(managers[:-1], key=lambda m: m.timeframe or timedelta())
+        return managers
+
+    def _cascade_source(
+        self, manager: CandleManager, history: bool = False
+    ) -> CandleManager | None:
+        """The CandleManager with the nearest lower timeframe, dividing the given CandleManager's
+        timeframe, whose resampled Candles can be resampled again in place of the default Candles.
+        Only timeframes up to a day cascade, with `history` the source must also hold every
+        Candle, without `max_candles` or `candle_life`."""
+        if (
+            self.timeframe_fill
+            or not manager.timeframe
+            or manager.timeframe > timedelta(days=1)
+            or manager.name == self._default_name
+        ):
+            return None
+
+        source = None
+        for name, lower in self._candle_map.items():
+            if (
+                name == self._default_name
+                or not lower.timeframe
+                or lower.timeframe >= manager.timeframe
+                or manager.timeframe % lower.timeframe
+            ):
+                continue
+            if history and (lower.max_candles is not None or lower.candle_life is not None):
+                continue
+            if source is None or lower.timeframe > source.timeframe:  # type: ignore
+                source = lower
+
+        return source
 
+    @_writes
     def prepend(
         self,
         candles: Candles,
         timeframe: Optional[TimeFramesSource] = None,
     ):
-        """Prepends a Candle or a chronological ordered list of Candle's to the front of the Hexital Candle's. This will only re-sample and re-calculate the new Candles, with minor overlap.
+        """Prepends a Candle or a chronological ordered list of Candle's to the front of the Hexital Candle's. This will only re-sample the new Candles, with minor overlap, re-calculating from them until the readings re-converge.
 
         Args:
             candles: The Candle or List of Candle's to prepend.
             timeframe: A specific timeframe to insert Candle's into
         """
         timeframe_name = self._parse_timeframe(timeframe)
+        if is_array_like(candles):
+            candles = self._load_arrays(candles)
 
+        calculated_until = {
+            name: indicator._calculated_until() for name, indicator in self._indicators.items()
+        }
+        changed: Dict[str, List[int]] = {}
         if timeframe_name and self._candle_map.get(timeframe_name):
-            self._candle_map[timeframe_name].prepend(candles)
+            changed[timeframe_name] = self._candle_map[timeframe_name].prepend(candles)
         else:
-            for candle_manager in self._candle_map.values():
-                candle_manager.prepend(candles)
+            for candle_manager in self._feed_order():
+                changed[candle_manager.name] = candle_manager.prepend(candles)
 
-        self.calculate()
+        for name, indicator in self._indicators.items():
+            if indicator.candle_manager.name in changed:
+                indicator.recalculate_changed(
+                    changed[indicator.candle_manager.name], calculated_until[name]
+                )
 
+    @_writes
     def append(
         self,
         candles: Candles,
         timeframe: Optional[TimeFramesSource] = None,
     ):
-        """append a Candle or a chronological ordered list of Candle's to the end of the Hexital Candle's. This wil only re-sample and re-calculate the new Candles, with minor overlap.
+        """append a Candle or a chronological ordered list of Candle's to the end of the Hexital Candle's. This wil only re-sample and re-calculate the new Candles, with minor overlap, only calculating the Indicators of the timeframes given Candles.
 
         Args:
             candles: The Candle or List of Candle's to prepend.
             timeframe: A specific timeframe to insert Candle's into
         """
         timeframe_name = self._parse_timeframe(timeframe)
+        if is_array_like(candles):
+            candles = self._load_arrays(candles)
 
+        changed: List[CandleManager] = []
         if timeframe_name and self._candle_map.get(timeframe_name):
-            self._candle_map[timeframe_name].append(candles)
+            if self._candle_map[timeframe_name].append(candles):
+                changed.append(self._candle_map[timeframe_name])
         else:
-            for candle_manager in self._candle_map.values():
-                candle_manager.append(candles)
+            for candle_manager in self._cascade_order():
+                source = self._cascade_source(candle_manager)
+                cascaded = source._cascade_candles() if source else None
+                if cascaded is None:
+                    appended = candle_manager.append(candles)
+                else:
+                    appended = candle_manager._append_candles(cascaded)
+
+                if appended:
+                    changed.append(candle_manager)
+
+        # Indicators of timeframes given no Candles are already calculated
+        for indicator in self._indicators.values():
+            manager = indicator.candle_manager
+            if any(manager is changed_ for changed_ in changed) or indicator._uncalculated():
+                indicator.calculate()
 
-        self.calculate()
+    @_writes
+    def append_tick(self, timestamp: datetime, price: float, size: float | int = 0) -> bool:
+        """Adds a single trade to the forming Candle of every timeframe, in chronological order,
+        without calculating, see `TickAggregator`. Returns True if any timeframe's Candle closed.
+
+        Args:
+            timestamp: Time of the trade
+            price: Price of the trade
+            size: Size of the trade, added to the Candle's volume
+        """
+        closed = False
+        for candle_manager in self._feed_order():
+            closed |= candle_manager.append_tick(timestamp, price, size)
+        return closed
 
+    @_writes
     def insert(
         self,
         candles: Candles,
         timeframe: Optional[TimeFramesSource] = None,
     ):
-        """insert a Candle or a list of Candle's to the Hexital Candles. This accepts any order or placement. This will sort, re-sample and re-calculate all Candles.
+        """insert a Candle or a list of Candle's to the Hexital Candles. This accepts any order or placement. This will sort and re-sample the Candles, re-calculating from the changed Candles until the readings re-converge.
 
         Args:
             candles: The Candle or List of Candle's to prepend.
             timeframe: A specific timeframe to insert Candle's into
         """
         timeframe_name = self._parse_timeframe(timeframe)
+        if is_array_like(candles):
+            candles = self._load_arrays(candles)
 
+        calculated_until = {
+            name: indicator._calculated_until() for name, indicator in self._indicators.items()
+        }
+        changed: Dict[str, List[int]] = {}
         if timeframe_name and self._candle_map.get(timeframe_name):
-            self._candle_map[timeframe_name].insert(candles)
+            changed[timeframe_name] = self._candle_map[timeframe_name].insert(candles)
         else:
-            for candle_manager in self._candle_map.values():
-                candle_manager.insert(candles)
+            for candle_manager in self._feed_order():
+                changed[candle_manager.name] = candle_manager.insert(candles)
 
-        self.calculate_index(index=0, end_index=-1)
+        for name, indicator in self._indicators.items():
+            if indicator.candle_manager.name in changed:
+                indicator.recalculate_changed(
+                    changed[indicator.candle_manager.name], calculated_until[name]
+                )
+
+    @_writes
+    def sync(self):
+        """Picks up the Candles appended to this Hexital's `SharedCandles` since it was created or
+        last synced, feeding them to every timeframe and calculating the new readings."""
+        default = self._candle_map[self._default_name]
+        default.sync(self._feed_order()[:-1])
+
+        self.calculate()
 
+    @_writes
     def calculate(self, name: Optional[str] = None):
         """Calculates all the missing indicator readings."""
         for indicator_name, indicator in self._indicators.items():
             if name is None or indicator_name == name:
                 indicator.calculate()
 
+    @_writes
     def calculate_index(
         self, name: Optional[str] = None, index: int = -1, end_index: Optional[int] = None
     ):
@@ -307,6 +642,7 @@ class Hexital:
             if name is None or indicator_name == name:
                 indicator.calculate_index(index, end_index)
 
+    @_writes
     def recalculate(self, source: Optional[Source] = None):
         """Purge's all indicator reading's and re-calculates them all,
         ideal for changing an indicator parameters midway."""
@@ -318,6 +654,7 @@ class Hexital:
             indicator.purge()
             indicator.calculate()
 
+    @_writes
     def purge(self, source: Optional[Source] = None):
         """Takes Indicator name and removes all readings for said indicator.
         Indicator name must be exact"""
@@ -360,7 +697,12 @@ class Hexital:
             new_indicator = self._build_indicator(indicator)
             valid_indicators[new_indicator.name] = new_indicator
 
+        created: List[CandleManager] = []
+
         for indicator in valid_indicators.values():
+            if self.batch:
+                indicator.batch = True
+
             if indicator.candle_manager.name in self._candle_map:
                 indicator.candle_manager = self._candle_map[indicator.candle_manager.name]
             elif indicator.candle_manager.name == DEFAULT_CANDLES:
@@ -374,14 +716,48 @@ class Hexital:
                     candlestick=indicator.candlestick
                     if indicator.candlestick
                     else self.candlestick,
+                    max_candles=indicator.max_candles
+                    if indicator.max_candles
+                    else self.max_candles,
+                    columnar=self.columnar,
+                    schema=self.schema,
                 )
 
-                manager.append(self._candle_map[self._default_name].candles)
+                created.append(manager)
                 self._candle_map[manager.name] = manager
                 indicator.candle_manager = manager
 
+        default = self._candle_map[self._default_name]
+        for manager in sorted(created, key=lambda m: m.timeframe or timedelta()):
+            source = None if default.candlestick else self._cascade_source(manager, history=True)
+            if source is None:
+                manager.append(default.candles)
+            else:
+                manager._append_candles(source._cascade_history())
+
         return valid_indicators
 
+    def _trim_to_lookback(self):
+        """With `auto_trim`, caps each CandleManager to the Candles it's Indicators need to
+        keep calculating, see `Indicator.lookback`. CandleManagers with their own `max_candles`
+        are left as is, and those without any Indicators keep the largest cap."""
+        if not self.auto_trim or not self._indicators:
+            return
+
+        lookbacks: Dict[str, int] = {}
+        for indicator in self._indicators.values():
+            name = indicator.candle_manager.name
+            lookbacks[name] = max(lookbacks.get(name, 1), indicator.lookback(self.convergence))
+
+        largest = max(lookbacks.values())
+
+        for name, manager in self._candle_map.items():
+            if manager.max_candles is not None and name not in self._auto_trimmed:
+                continue
+
+            self._auto_trimmed.add(name)
+            manager.retain(lookbacks.get(name, largest))
+
     def _build_indicator(self, raw_indicator: dict) -> Indicator:
         indicator = copy(raw_indicator)
 
@@ -456,6 +832,14 @@ class HexitalCol(Generic[T], Hexital):
         timeframe_fill: bool = False,
         candle_life: Optional[timedelta] = None,
         candlestick: Optional[CandlestickType | str] = None,
+        columnar: bool = False,
+        max_candles: Optional[int] = None,
+        auto_trim: bool = False,
+        convergence: int = 50,
+        copy_candles: bool = True,
+        schema: Optional[CandleSchema] = None,
+        batch: bool = False,
+        thread_safe: bool = False,
     ):
         self.collection = indicators
 
@@ -468,4 +852,12 @@ class HexitalCol(Generic[T], Hexital):
             timeframe_fill,
             candle_life,
             candlestick,
+            columnar,
+            max_candles,
+            auto_trim,
+            convergence,
+            copy_candles,
+            schema,
+            batch,
+            thread_safe,
         )
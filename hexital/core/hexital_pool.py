@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+from collections import deque
+from copy import deepcopy
+from datetime import timedelta
+from itertools import repeat
+from operator import attrgetter, gt, itemgetter, setitem
+from typing import Any, Dict, List, Optional, Sequence
+
+from hexital.core import Reading
+from hexital.core.candle import Candle
+from hexital.core.candle_columns import CandleColumns
+from hexital.core.candle_manager import CandleManager, Candles, is_single_candle
+from hexital.core.candle_schema import CandleSchema
+from hexital.core.candlestick_type import CandlestickType
+from hexital.core.hexital import Hexital
+from hexital.core.indicator import Indicator, Managed, Source
+from hexital.core.indicator_collection import IndicatorCollection
+from hexital.core.reading_table import ReadingTable
+from hexital.utils.batch import NUMPY_AVAILABLE
+from hexital.utils.timeframe import TimeFramesSource
+
+STEP_VALUES = ("open", "high", "low", "close", "volume")
+
+
+class HexitalPool:
+    """Runs one strategy over many symbols, such as the same Indicators across thousands of
+    instruments, updated a tick of one Candle per symbol at a time.
+
+    Every symbol has it's own `Hexital`, all built from the same Indicators and settings, so each
+    symbol's Candles and readings work as in any `Hexital`. On `append`, Indicators that support
+    it (EMA, RMA, RSI, ATR, TR and OBV, on a Candle value source) are calculated for every ticking
+    symbol at once, as NumPy operations over arrays holding each symbol's state, rather than
+    through each symbol's Indicator. Any other Indicator, and symbols still warming up, are
+    calculated per symbol. Requires NumPy for the cross-sectional calculation, otherwise every
+    symbol is calculated as it's own `Hexital`.
+
+    The symbol's `Hexital`s are owned by the pool, Candles should be added through the pool, so it
+    knows which symbols cross-sectional state is out of date.
+
+    Args:
+        name: Name of the strategy
+        candles: Candles per symbol, or a list of symbols to start without Candles
+        indicators: The Indicators given to every symbol's `Hexital`
+
+    Remaining arguments are those of `Hexital`, given to every symbol's `Hexital`.
+    """
+
+    name: str
+    _strategy: Hexital
+    _hexitals: Dict[str, Hexital]
+    _positions: Dict[str, int]
+    _stepped: List[str]
+    _states: Dict[str, Dict[str, Any]]
+    _valid: Dict[str, Any]
+
+    def __init__(
+        self,
+        name: str,
+        candles: Dict[str, Candles] | Sequence[str],
+        indicators: Sequence[Dict[str, Any] | Indicator] | IndicatorCollection,
+        description: Optional[str] = None,
+        timeframe: Optional[TimeFramesSource] = None,
+        timeframe_fill: bool = False,
+        candle_life: Optional[timedelta] = None,
+        candlestick: Optional[CandlestickType | str] = None,
+        columnar: bool = False,
+        max_candles: Optional[int] = None,
+        auto_trim: bool = False,
+        convergence: int = 50,
+        copy_candles: bool = True,
+        schema: Optional[CandleSchema] = None,
+        batch: bool = False,
+    ):
+        self.name = name
+        self._strategy = Hexital(
+            name,
+            [],
+            indicators,
+            description,
+            timeframe,
+            timeframe_fill,
+            candle_life,
+            candlestick,
+            columnar,
+            max_candles,
+            auto_trim,
+            convergence,
+            copy_candles,
+            schema,
+            batch,
+        )
+        self._hexitals = {}
+        self._positions = {}
+        self._states = {}
+        self._valid = {}
+
+        default = self._strategy._candle_map[self._strategy._default_name]
+        self._stepped = [
+            name
+            for name, indicator in self._strategy.indicators.items()
+            if NUMPY_AVAILABLE and indicator.candle_manager is default and indicator._can_step()
+        ]
+        for name in self._stepped:
+            self._strategy.indicators[name].check_initialised()
+
+        if isinstance(candles, dict):
+            for symbol, symbol_candles in candles.items():
+                self.add_symbol(symbol, symbol_candles)
+        else:
+            for symbol in candles:
+                self.add_symbol(symbol)
+
+    def __len__(self) -> int:
+        return len(self._hexitals)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._hexitals
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._hexitals)
+
+    @property
+    def indicators(self) -> Dict[str, Indicator]:
+        """The strategy's Indicators, as given to every symbol"""
+        return self._strategy.indicators
+
+    def hexital(self, symbol: str) -> Hexital | None:
+        """The `Hexital` of the given symbol"""
+        return self._hexitals.get(symbol)
+
+    def add_symbol(self, symbol: str, candles: Optional[Candles] = None):
+        """Adds a new symbol running the strategy, with optional starting Candles"""
+        hexital = deepcopy(self._strategy)
+        hexital.name = symbol
+        if candles is not None:
+            hexital.append(candles)
+
+        self._hexitals[symbol] = hexital
+        self._positions[symbol] = len(self._positions)
+
+        if self._valid:
+            import numpy as np
+
+            for name, valid in self._valid.items():
+                self._valid[name] = np.append(valid, False)
+                for key, values in self._states.get(name, {}).items():
+                    self._states[name][key] = np.append(values, np.nan)
+
+    def remove_symbol(self, symbol: str):
+        """Removes a symbol and it's Candles from the pool"""
+        if symbol not in self._hexitals:
+            return
+
+        position = self._positions.pop(symbol)
+        self._hexitals.pop(symbol)
+        for symbol_, position_ in self._positions.items():
+            if position_ > position:
+                self._positions[symbol_] = position_ - 1
+
+        if self._valid:
+            import numpy as np
+
+            for name, valid in self._valid.items():
+                self._valid[name] = np.delete(valid, position)
+                for key, values in self._states.get(name, {}).items():
+                    self._states[name][key] = np.delete(values, position)
+
+    def _invalidate(self, symbol: str):
+        """Marks a symbol's cross-sectional state as out of date, re-read from it's Candles
+        next time it ticks"""
+        position = self._positions[symbol]
+        for valid in self._valid.values():
+            valid[position] = False
+
+    def append(self, candles: Dict[str, Candles]):
+        """Appends a tick of Candles, a Candle per symbol. Symbols can be missing from a tick,
+        and a symbol can be given a list of Candles, which is appended as in `Hexital.append`.
+
+        Args:
+            candles: The Candles to append, by symbol
+        """
+        ticked = []
+
+        for symbol, symbol_candles in candles.items():
+            hexital = self._hexitals[symbol]
+
+            if not self._stepped or not is_single_candle(symbol_candles):
+                hexital.append(symbol_candles)
+                self._invalidate(symbol)
+            elif self._feed(hexital, symbol_candles):
+                ticked.append(symbol)
+            else:
+                hexital.calculate()
+                self._invalidate(symbol)
+
+        if ticked:
+            self._calculate_tick(ticked)
+
+    def prepend(self, candles: Dict[str, Candles]):
+        """Prepends Candles to each symbol, as in `Hexital.prepend`"""
+        for symbol, symbol_candles in candles.items():
+            self._hexitals[symbol].prepend(symbol_candles)
+            self._invalidate(symbol)
+
+    def insert(self, candles: Dict[str, Candles]):
+        """Inserts Candles into each symbol, as in `Hexital.insert`"""
+        for symbol, symbol_candles in candles.items():
+            self._hexitals[symbol].insert(symbol_candles)
+            self._invalidate(symbol)
+
+    def calculate(self):
+        """Calculates all the missing indicator readings of every symbol"""
+        for hexital in self._hexitals.values():
+            hexital.calculate()
+
+    def reading(self, symbol: str, source: Source, index: int = -1) -> Reading:
+        """A symbol's reading, as `Hexital.reading`"""
+        hexital = self._hexitals.get(symbol)
+        return hexital.reading(source, index) if hexital else None
+
+    def readings(self, source: Source, index: int = -1) -> Dict[str, Reading]:
+        """The reading of every symbol at the given index, by symbol"""
+        return {
+            symbol: hexital.reading(source, index) for symbol, hexital in self._hexitals.items()
+        }
+
+    def _feed(self, hexital: Hexital, candle: Candles) -> bool:
+        """Appends a single Candle to each of the symbol's CandleManagers without calculating.
+        Returns True if there was a previous Candle to step from, stepped Indicators are only
+        on the default CandleManager without a timeframe, where every Candle is appended"""
+        default = hexital._candle_map[hexital._default_name]
+        stepping = bool(default.candles)
+
+        if len(hexital._candle_map) > 1:
+            for candle_manager in hexital._feed_order()[:-1]:
+                candle_manager.append(candle)
+        if isinstance(candle, Candle):
+            _append_latest(default, candle)
+        else:
+            default.append(candle)
+
+        return stepping
+
+    def _calculate_tick(self, symbols: List[str]):
+        """Calculates each Indicator of the ticked symbols, in strategy order. Stepped Indicators
+        are calculated across all symbols with a valid state at once"""
+        import numpy as np
+
+        hexitals = [self._hexitals[symbol] for symbol in symbols]
+        managers = [hexital._candle_map[hexital._default_name] for hexital in hexitals]
+        latest = [_bind_latest(manager) for manager in managers]
+        tables = [candle._table for candle in latest]
+        columns = [table.columns for table in tables]
+        slots = [candle._slot for candle in latest]
+        index = [len(manager.candles) - 1 for manager in managers]
+        # Every stepped Indicator is on the default CandleManager, as `_mark_calculated`
+        calculated = [(m._generation, m._trimmed + i + 1) for m, i in zip(managers, index)]
+        positions = np.array([self._positions[symbol] for symbol in symbols])
+
+        candle = {
+            name: np.fromiter(map(attrgetter(name), latest), np.float64, len(latest))
+            for name in STEP_VALUES[:4]
+        }
+        candle["volume"] = np.array(list(map(attrgetter("volume"), latest)))
+        if candle["volume"].dtype.kind not in "iuf":
+            candle["volume"] = candle["volume"].astype(np.float64)
+
+        symbol_indicators = [hexital._indicators for hexital in hexitals]
+
+        for name, template in self._strategy.indicators.items():
+            indicators = list(map(itemgetter(name), symbol_indicators))
+
+            if name not in self._stepped:
+                for indicator in indicators:
+                    indicator.calculate()
+                continue
+
+            valid = self._valid.setdefault(name, np.zeros(len(self._positions), dtype=bool))
+            stepping = np.flatnonzero(valid[positions])
+
+            if len(stepping):
+                state = {
+                    key: values[positions[stepping]]
+                    for key, values in self._states[name].items()
+                }
+                readings = template._step_readings(
+                    state, {key: values[stepping] for key, values in candle.items()}
+                )
+
+                for key, values in state.items():
+                    self._states[name][key][positions[stepping]] = values
+
+                offsets = None if len(stepping) == len(symbols) else stepping.tolist()
+                tables_, columns_, slots_ = (_take(v, offsets) for v in (tables, columns, slots))
+                for reading_name, values in readings.items():
+                    sub = reading_name != name
+                    _set_column(tables_, columns_, slots_, reading_name, values, sub)
+
+                stepped = _take(indicators, offsets)
+                index_ = _take(index, offsets)
+                _set_each(stepped, "_active_index", index_)
+                for managed_name, managed in template.managed_indicators.items():
+                    if isinstance(managed, Managed):
+                        managed_ = [i.managed_indicators[managed_name] for i in stepped]
+                        _set_each(managed_, "_active_index", index_)
+                _set_each(stepped, "_calculated", _take(calculated, offsets))
+
+            for offset in np.flatnonzero(~valid[positions]).tolist():
+                indicators[offset].calculate()
+                self._read_state(name, indicators[offset], positions[offset])
+
+    def _read_state(self, name: str, indicator: Indicator, position: int):
+        """Reads a symbol's Indicator state from it's latest Candle"""
+        state = indicator._step_state()
+        if state is None:
+            return
+
+        import numpy as np
+
+        states = self._states.setdefault(name, {})
+        for key, value in state.items():
+            if key not in states:
+                states[key] = np.full(len(self._positions), np.nan)
+            states[key][position] = value
+        self._valid[name][position] = True
+
+
+def _append_latest(manager: CandleManager, candle: Candle):
+    """Appends a tick's Candle straight onto the CandleManager's Candles, as `append` does
+    without a timeframe or candlestick, skipping parsing and resampling"""
+    if manager.timeframe or manager.candlestick:
+        manager.append(candle)
+        return
+
+    candles = manager._candles
+    if not manager.copy_candles:
+        candles.append(candle)
+    elif isinstance(candles, CandleColumns) and type(candle) is Candle:
+        candles.append_values(candle)
+    else:
+        candles.append(candle.clean_copy())
+    manager._rolled = None
+    if manager.max_candles is not None or manager.candle_life is not None:
+        manager.trim_candles()
+
+
+def _bind_latest(manager: CandleManager) -> Candle:
+    """The latest Candle of the CandleManager, bound to it's reading table"""
+    candle = manager.candles[-1]
+    if candle._table is None:
+        manager.readings.bind(candle)
+    return candle
+
+
+def _take(values: List[Any], offsets: Optional[List[int]]) -> List[Any]:
+    return values if offsets is None else [values[offset] for offset in offsets]
+
+
+def _set_each(objects: List[Any], name: str, values: List[Any]):
+    """Sets the attribute of each object to it's value, in a single pass over them"""
+    deque(map(setattr, objects, repeat(name), values), maxlen=0)
+
+
+def _set_column(
+    tables: List[ReadingTable],
+    columns: List[Dict[str, List[Any]]],
+    slots: List[int],
+    name: str,
+    readings: Any,
+    sub: bool,
+):
+    """Sets a reading of each symbol's latest Candle, at it's slot of each reading table. Where
+    every table already has the column, the readings are appended, or set, in a single pass over
+    the columns, otherwise they're set through each table"""
+    column = list(map(dict.get, columns, repeat(name)))
+
+    if None not in column:
+        lengths = list(map(len, column))
+        if lengths == slots:
+            deque(map(list.append, column, readings), maxlen=0)
+            return
+        if all(map(gt, lengths, slots)):
+            deque(map(setitem, column, slots, readings), maxlen=0)
+            return
+
+    for table, slot, reading in zip(tables, slots, readings):
+        table.set(slot, name, reading, sub)
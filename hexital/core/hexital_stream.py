@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, List, Optional
+
+from hexital.core.candle_manager import Candles, is_single_candle
+from hexital.core.hexital import Hexital
+from hexital.core.snapshot import HexitalSnapshot
+from hexital.exceptions import InvalidConfiguration
+
+_CLOSE = object()
+
+
+class HexitalSubscription:
+    """An async iterator of the `HexitalSnapshot`'s published by a `HexitalStream`, ending once
+    the stream closes. Snapshots wait in a bounded queue, when it's full the stream waits for
+    the subscriber to catch up."""
+
+    _stream: HexitalStream
+    _queue: asyncio.Queue
+
+    def __init__(self, stream: HexitalStream, max_size: int):
+        self._stream = stream
+        self._queue = asyncio.Queue(max_size)
+
+    def __aiter__(self) -> HexitalSubscription:
+        return self
+
+    async def __anext__(self) -> HexitalSnapshot:
+        snapshot = await self._queue.get()
+        if snapshot is _CLOSE:
+            raise StopAsyncIteration
+        return snapshot
+
+    def unsubscribe(self):
+        """Stops receiving snapshots, any already received can still be iterated"""
+        self._stream._unsubscribe(self)
+
+
+class HexitalStream:
+    """An asyncio front end to a `Hexital`, streaming Candles in and readings out.
+
+    Candles given to `put`, or consumed from an async iterable or `asyncio.Queue` with `run`, are
+    gathered into batches by the flush policy, each batch is appended to the `Hexital` in a
+    single `append` run in an executor, off the event loop. Once a batch is calculated a
+    `HexitalSnapshot` of the latest readings is published to every subscriber.
+
+    Backpressure is bounded at every step, `put` waits while `max_pending` Candles are waiting to
+    be flushed, and publishing waits on any subscriber with a full queue, so a slow subscriber
+    slows the stream down to it's pace rather than growing any queue.
+
+    If appending a batch fails, such as an `InvalidCandleOrder`, the error is raised from the next
+    `put` and from `close`, any Candles still waiting are dropped.
+
+    Args:
+        hexital: The `Hexital` to stream Candles into. As it's appended to from the executor's
+            threads, use a `thread_safe` Hexital when also reading it directly from elsewhere
+        batch_size: Flushes once this many Candles are waiting
+        flush_interval: Flushes any waiting Candles this many seconds after the first arrived,
+            only flushing by `batch_size` if not given
+        max_pending: Maximum Candles waiting to be flushed before `put` waits
+        executor: Executor to append in, defaults to the event loop's default executor
+    """
+
+    hexital: Hexital
+    batch_size: int
+    flush_interval: Optional[float]
+    max_pending: int
+    executor: Optional[Executor]
+
+    _pending: Optional[asyncio.Queue]
+    _flusher: Optional[asyncio.Task]
+    _subscribers: List[HexitalSubscription]
+    _error: Optional[Exception]
+
+    def __init__(
+        self,
+        hexital: Hexital,
+        batch_size: int = 1,
+        flush_interval: Optional[float] = None,
+        max_pending: int = 1000,
+        executor: Optional[Executor] = None,
+    ):
+        if batch_size < 1:
+            raise InvalidConfiguration(f"batch_size must be at least 1: {batch_size}")
+        if max_pending < batch_size:
+            raise InvalidConfiguration(
+                f"max_pending must be at least batch_size {batch_size}: {max_pending}"
+            )
+
+        self.hexital = hexital
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.executor = executor
+
+        self._pending = None
+        self._flusher = None
+        self._subscribers = []
+        self._error = None
+
+    def subscribe(self, max_size: int = 100) -> HexitalSubscription:
+        """Subscribes to the snapshots published after each flush.
+
+        Args:
+            max_size: Maximum snapshots waiting to be read before the stream waits
+        """
+        subscription = HexitalSubscription(self, max_size)
+        self._subscribers.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: HexitalSubscription):
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+
+    def _start(self) -> asyncio.Queue:
+        if self._pending is None:
+            self._pending = asyncio.Queue(self.max_pending)
+            self._flusher = asyncio.create_task(self._flush_loop())
+        return self._pending
+
+    async def put(self, candles: Candles):
+        """Adds a Candle, or a list of Candles, to be flushed into the `Hexital`, waiting while
+        the stream is full. Raises the error of a failed flush"""
+        pending = self._start()
+        self._raise_error()
+        if is_single_candle(candles):
+            await pending.put(candles)
+        else:
+            for candle in candles:
+                await pending.put(candle)
+        self._raise_error()
+
+    async def run(self, source: AsyncIterable[Candles] | asyncio.Queue):
+        """Streams Candles from an async iterable, or from an `asyncio.Queue` until it gives
+        `None`, then flushes the remaining Candles and closes the stream."""
+        try:
+            if isinstance(source, asyncio.Queue):
+                while (candles := await source.get()) is not None:
+                    await self.put(candles)
+            else:
+                async for candles in source:
+                    await self.put(candles)
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Flushes any waiting Candles and ends every subscription. Raises the error of a
+        failed flush"""
+        if self._flusher is None:
+            await self._publish(_CLOSE)
+            return
+
+        await self._start().put(_CLOSE)
+        try:
+            await self._flusher
+        finally:
+            self._pending = None
+            self._flusher = None
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    async def _flush_loop(self):
+        pending = self._start()
+        loop = asyncio.get_running_loop()
+        batch: List[Any] = []
+        deadline = 0.0
+
+        try:
+            while True:
+                timeout = None
+                if batch and self.flush_interval is not None:
+                    timeout = max(deadline - loop.time(), 0)
+
+                try:
+                    candle = await asyncio.wait_for(pending.get(), timeout)
+                except asyncio.TimeoutError:
+                    candle = None
+
+                if candle is not None and candle is not _CLOSE:
+                    if not batch and self.flush_interval is not None:
+                        deadline = loop.time() + self.flush_interval
+                    batch.append(candle)
+                    if len(batch) < self.batch_size:
+                        continue
+
+                if batch:
+                    try:
+                        snapshot = await loop.run_in_executor(self.executor, self._append, batch)
+                    except Exception as error:
+                        self._error = error
+                        # Keeps taking Candles, so a waiting `put` gets to raise the error
+                        while candle is not _CLOSE:
+                            candle = await pending.get()
+                        break
+                    batch = []
+                    await self._publish(snapshot)
+
+                if candle is _CLOSE:
+                    break
+        finally:
+            await self._publish(_CLOSE)
+
+    def _append(self, candles: List[Any]) -> HexitalSnapshot:
+        """Appends a batch of Candles, run in the executor"""
+        self.hexital.append(candles)
+        return self.hexital.snapshot()
+
+    async def _publish(self, snapshot: Any):
+        for subscription in list(self._subscribers):
+            await subscription._queue.put(snapshot)
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from copy import copy
 from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import Enum, auto
-from typing import Dict, Generic, List, Optional, Tuple, TypeAlias, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+)
 
 from hexital.core import Reading
 from hexital.core.candle import Candle
 from hexital.core.candle_manager import CandleManager, Candles
 from hexital.core.candlestick_type import CandlestickType
+from hexital.core.reading_table import EMPTY
+from hexital.utils.batch import NUMPY_AVAILABLE
 from hexital.utils.candles import (
     candles_average,
     candles_sum,
@@ -19,6 +33,8 @@ from hexital.utils.candles import (
     reading_by_index,
     reading_count,
     reading_period,
+    readings_as_arrays,
+    readings_by_candles,
 )
 from hexital.utils.candlesticks import validate_candlesticktype
 from hexital.utils.common import round_values
@@ -32,6 +48,9 @@ from hexital.utils.timeframe import (
 T = TypeVar("T")
 V = TypeVar("V")
 
+BATCH_MIN_CANDLES = 64
+STEP_SOURCES = ("open", "high", "low", "close", "volume")
+
 
 class IndicatorMode(Enum):
     SOLO = auto()
@@ -46,8 +65,10 @@ class Indicator(Generic[V], ABC):
     timeframe: Optional[TimeFramesSource] = None
     timeframe_fill: bool = False
     candle_life: Optional[timedelta] = None
+    max_candles: Optional[int] = None
     candlestick: Optional[CandlestickType | str] = None
     rounding: Optional[int] = 4
+    batch: bool = False
 
     sub_indicators: Dict[str, Indicator] = field(init=False, default_factory=dict)
     managed_indicators: Dict[str, Managed | Indicator] = field(init=False, default_factory=dict)
@@ -55,12 +76,16 @@ class Indicator(Generic[V], ABC):
     _generated_name: bool = field(init=False, default=False)
     _calc_prior: bool = field(init=False, default=True)
     _active_index: int = field(init=False, default=0)
+    # The Candle manager's generation and position every Candle up to was calculated at
+    _calculated: Tuple[int, int] = field(init=False, default=(-1, 0))
 
     _name: str = field(init=False, default="")
     _timeframe: Optional[timedelta] = field(init=False)
     _candle_mngr: CandleManager = field(init=False)
 
     _initialised: bool = field(init=False, default=False)
+    _recursive: ClassVar[bool] = False
+    _stepped: ClassVar[bool] = False
 
     def __post_init__(self):
         self._validate_fields()
@@ -77,6 +102,7 @@ class Indicator(Generic[V], ABC):
             self._timeframe,
             self.timeframe_fill,
             self.candlestick,
+            self.max_candles,
         )
 
         self.candles = self._candle_mngr.candles
@@ -116,11 +142,13 @@ class Indicator(Generic[V], ABC):
         """The Candle Manager which controls TimeFrame, Trimming and collapsing,
         this will overwrite the Manager as well as the candles"""
         self._candle_mngr = manager
+        self._calculated = (-1, 0)
         self.candles = manager.candles
         self.timeframe = timedelta_to_str(manager.timeframe) if manager.timeframe else None
         self._timeframe = manager.timeframe
         self.timeframe_fill = manager.timeframe_fill
         self.candle_life = manager.candle_life
+        self.max_candles = manager.max_candles
         self.candlestick = manager.candlestick
 
     @property
@@ -148,6 +176,8 @@ class Indicator(Generic[V], ABC):
                 continue
             if name == "timeframe_fill" and self._timeframe is None:
                 continue
+            if name == "batch" and not value:
+                continue
 
             if name == "candlestick" and value:
                 output[name] = value.acronym if value.acronym else value.name
@@ -178,6 +208,24 @@ class Indicator(Generic[V], ABC):
         """
         return self._find_readings(name)
 
+    def readings_as_arrays(self, name: Optional[Source] = None) -> Dict[str, Any]:
+        """
+        Export the indicator readings as NumPy arrays, without creating a list or dict per
+        Candle. Requires NumPy.
+
+        Args:
+            name (Optional[str]): The name of the indicator to export.
+                                  Defaults to `self.name` if not provided.
+
+        Returns:
+            Dict[str, np.ndarray]: One float64 array per output, NaN where there's no reading.
+                                   Keyed by the indicator name, or `name.output` for each
+                                   output of multi value indicators, E.G `MACD_12_26_9.MACD`.
+        """
+        if isinstance(name, (Indicator, NestedSource)):
+            return name.readings_as_arrays()
+        return readings_as_arrays(self.candles, name if name else self.name)
+
     def prepend(self, candles: Candles):
         """Prepends a Candle or a chronological ordered list of Candle's to the front of the Indicator Candle's. This will only re-sample and re-calculate the new Candles, with minor overlap.
 
@@ -198,13 +246,56 @@ class Indicator(Generic[V], ABC):
         self.calculate()
 
     def insert(self, candles: Candles):
-        """insert a Candle or a list of Candle's to the Indicator Candles. This accepts any order or placement. This will sort, re-sample and re-calculate all Candles.
+        """insert a Candle or a list of Candle's to the Indicator Candles. This accepts any order or placement. This will sort and re-sample the Candles, re-calculating from the changed Candles until the readings re-converge.
 
         Args:
             candles: The Candle or List of Candle's to prepend.
         """
-        self._candle_mngr.insert(candles)
-        self.calculate_index(0, -1)
+        calculated_until = self._calculated_until()
+        self.recalculate_changed(self._candle_mngr.insert(candles), calculated_until)
+
+    def lookback(self, convergence: int = 0) -> int:
+        """
+        The minimum amount of Candles this Indicator needs to keep generating the same readings.
+
+        Covers the Indicator's own periods, any Indicator used as it's source and all of it's
+        sub and managed Indicators. Recursive smoothers (E.G EMA, RMA) depend on every prior
+        Candle, for those `convergence` Candles are added to allow their readings to settle.
+
+        Note:
+            Cumulative Indicators (E.G OBV, VWAP) never converge, they only need the previous
+            reading to carry on, but their readings can't be re-calculated from trimmed Candles.
+
+        Args:
+            convergence (int): Extra Candles added for each recursive smoother. Defaults to 0
+
+        Returns:
+            int: The amount of Candles required
+        """
+        lookback = self._chain_lookback(convergence)
+
+        for indicator in (*self.sub_indicators.values(), *self.managed_indicators.values()):
+            lookback = max(lookback, indicator.lookback(convergence))
+
+        return lookback
+
+    def _lookback(self, convergence: int) -> int:
+        """The Candles required by this Indicator's own calculation, by default it's `period`
+        plus the previous Candle"""
+        period = getattr(self, "period", None)
+        lookback = period + 1 if isinstance(period, int) else 2
+        return lookback + convergence if self._recursive else lookback
+
+    def _chain_lookback(self, convergence: int) -> int:
+        """Own lookback, extended by the lookback of an Indicator used as the source"""
+        source = getattr(self, "source", None)
+        if isinstance(source, NestedSource):
+            source = source.indicator
+
+        lookback = self._lookback(convergence)
+        if isinstance(source, Indicator):
+            lookback += source._chain_lookback(convergence) - 1
+        return lookback
 
     @property
     def prior_calc(self) -> bool:
@@ -235,7 +326,12 @@ class Indicator(Generic[V], ABC):
         where this indicator is missing"""
         self.check_initialised()
 
-        for index in range(self._find_calc_index(), len(self.candles)):
+        start_index = self._find_calc_index()
+        if self._calculate_batch(start_index):
+            self._mark_calculated()
+            return
+
+        for index in range(start_index, len(self.candles)):
             self._set_active_index(index)
             self._calculate_sub_indicators(True, index)
 
@@ -247,6 +343,8 @@ class Indicator(Generic[V], ABC):
             self._set_reading(reading, index)
             self._calculate_sub_indicators(False, index)
 
+        self._mark_calculated()
+
     def _reading_dup(self, reading: Reading | V, candle: Candle) -> bool:
         """Optimisation method for 'calculate'.
         if calculating and not on latest Candle, check if reading match's a pre-existing reading.
@@ -256,7 +354,7 @@ class Indicator(Generic[V], ABC):
         """
         if reading is None:
             return False
-        cur_reading = candle.indicators.get(self.name, candle.sub_indicators.get(self.name))
+        cur_reading = candle.get_reading(self.name)
 
         if cur_reading is None:
             return False
@@ -276,6 +374,9 @@ class Indicator(Generic[V], ABC):
         else:
             end_index = start_index
 
+        if end_index == len(self.candles) - 1 and self._calculate_batch(start_index):
+            return
+
         for index in range(start_index, end_index + 1):
             self._set_active_index(index)
             self._calculate_sub_indicators(True, index)
@@ -285,32 +386,237 @@ class Indicator(Generic[V], ABC):
             self._set_reading(reading, index)
             self._calculate_sub_indicators(False, index)
 
+    def recalculate_changed(self, changed: Sequence[int], calculated_until: Optional[int] = None):
+        """Re-calculates the readings after the given Candle indexes changed, such as by
+        `CandleManager.insert` or `CandleManager.prepend`. Calculating from each changed Candle
+        stops once the readings re-converge, on a Candle at least this Indicator's `lookback`
+        past the changed Candle where the new readings, including every sub and managed
+        Indicator's, match the stored readings. It then carries on from the next changed Candle.
+
+        `calculated_until` is the `_calculated_until` from before the Candles changed, if the
+        Indicator wasn't calculated on every Candle, it's calculated from the first Candle
+        missing it, or the first changed Candle, through to the latest without stopping early."""
+        self.check_initialised()
+
+        if not changed:
+            self.calculate()
+            return
+
+        index = changed[0] if calculated_until is None else min(changed[0], calculated_until)
+        if self._calculate_batch(index):
+            self._mark_calculated()
+            return
+
+        lookback = self.lookback()
+        last_index = len(self.candles) - 1
+        position = 0
+        # Readings are only compared once settled, never when some weren't calculated before
+        settled = last_index
+
+        while index <= last_index:
+            if position < len(changed) and changed[position] <= index:
+                position = bisect_right(changed, index)
+                if calculated_until is None:
+                    settled = index + lookback - 1
+
+            stored = self._state_readings(index) if settled <= index < last_index else None
+
+            self._set_active_index(index)
+            self._calculate_sub_indicators(True, index)
+            reading = round_values(self._calculate_reading(index=index), self.rounding)
+            self._set_reading(reading, index)
+            self._calculate_sub_indicators(False, index)
+
+            if stored is not None and stored == self._state_readings(index):
+                if position == len(changed):
+                    break
+                index = changed[position]
+                continue
+
+            index += 1
+
+        self.calculate()
+
+    def _state_readings(self, index: int) -> List[Reading]:
+        """The readings of this Indicator and every sub and managed Indicator at the index,
+        which together are the state the next reading is calculated from"""
+        candle = self.candles[index]
+        readings = []
+        indicators = [self]
+        while indicators:
+            indicator = indicators.pop()
+            reading = candle.get_reading(indicator.name)
+            readings.append(copy(reading) if isinstance(reading, dict) else reading)
+            indicators.extend(indicator.sub_indicators.values())
+            indicators.extend(indicator.managed_indicators.values())
+        return readings
+
+    def _calculate_batch(self, start_index: int) -> bool:
+        """Calculates every Candle from `start_index` in one batch, when `batch` is enabled and
+        enough Candles are uncalculated. Returns False if the Indicator can't be batch calculated,
+        leaving it to be calculated per Candle"""
+        if (
+            not self.batch
+            or not NUMPY_AVAILABLE
+            or len(self.candles) - start_index < BATCH_MIN_CANDLES
+        ):
+            return False
+
+        readings = self._batch_readings(start_index)
+        if readings is None:
+            return False
+
+        self._set_readings(readings, start_index)
+        self._set_active_index(len(self.candles) - 1)
+        return True
+
+    def _batch_readings(self, start_index: int) -> Optional[List[Reading | V]]:
+        """Batch calculation of the readings from `start_index` to the latest Candle, performing
+        the same calculation as `_calculate_reading` over lists of values. Rounded readings are
+        returned, while any sub or managed Indicator readings are set directly. Returns None if
+        the Indicator has no batch calculation."""
+        return None
+
+    def _batch_source(self, source: Source) -> List[Any]:
+        """All the values of the given source, for every Candle"""
+        name = source if isinstance(source, str) else source.name
+
+        if "." not in name and hasattr(Candle, name):
+            values = getattr(self.candles, name, None)
+            if values is not None and name != "volume":
+                return values.tolist()
+            return [getattr(candle, name) for candle in self.candles]
+
+        main_name, _, nested_name = name.partition(".")
+        readings = readings_by_candles(self.candles, main_name)
+        if nested_name:
+            return [r.get(nested_name) if isinstance(r, dict) else r for r in readings]
+        return readings
+
+    def _batch_prior(self, start_index: int) -> List[Reading | V]:
+        """This Indicator's readings before `start_index`, to continue a batch calculation from"""
+        return readings_by_candles(self.candles, self.name)[:start_index]
+
+    def _batch_prev(self, start_index: int) -> Reading | V:
+        """This Indicator's reading before `start_index`, None from the first Candle"""
+        if start_index == 0:
+            return None
+        return reading_by_index(self.candles, self.name, start_index - 1)
+
+    def _batch_sub(self, indicator: Indicator, start_index: int) -> List[Any]:
+        """Batch calculates a sub or managed Indicator, returning all of it's readings"""
+        indicator.check_initialised()
+        readings = indicator._batch_readings(start_index)
+        if readings is None:
+            raise ValueError(f"{indicator.name} has no batch calculation")
+
+        prior = indicator._batch_prior(start_index)
+        indicator._set_readings(readings, start_index)
+        indicator._set_active_index(len(self.candles) - 1)
+        return prior + readings
+
+    def _can_step(self) -> bool:
+        """If this Indicator can be calculated across many CandleManagers at once with
+        `_step_readings`, used by `HexitalPool`"""
+        source = getattr(self, "source", "close")
+        return (
+            self._stepped
+            and isinstance(source, str)
+            and source in STEP_SOURCES
+            and self._candle_mngr.timeframe is None
+        )
+
+    def _step_state(self) -> Optional[Dict[str, Any]]:
+        """The values `_step_readings` carries over from the latest Candle to the next. None if
+        the next reading can't be stepped from the latest Candle yet"""
+        return None
+
+    def _step_readings(
+        self, state: Dict[str, Any], candle: Dict[str, Any]
+    ) -> Dict[str, List[Reading]]:
+        """Cross-sectional calculation of the next reading for many CandleManagers at once, the
+        same calculation as `_calculate_reading`. `state` holds an array of each `_step_state`
+        value, and `candle` an array of each OHLCV value of the new Candles, one entry per
+        CandleManager. Updates `state` in place, returning the rounded readings to set by
+        Indicator name, including any sub or managed Indicators. Only Indicators that `_can_step`
+        implement it"""
+        raise ValueError(f"{self.name} has no stepped calculation")
+
     def _find_calc_index(self) -> int:
-        """Optimisation method, to find where to start calculating the indicator from
-        Searches from newest to oldest to find the first candle without the indicator
+        """Optimisation method, to find where to start calculating the indicator from.
+        Resumes from where it was last calculated, if the Candles have only been appended to or
+        trimmed since, otherwise searches from newest to oldest to find the first candle without
+        the indicator
         """
-        if not self.candles or (
-            self.name not in self.candles[0].indicators
-            and self.name not in self.candles[0].sub_indicators
-        ):
+        manager = self._candle_mngr
+        generation, position = self._calculated
+        if generation == manager._generation and manager.candlestick is None:
+            index = min(position - manager._trimmed, len(self.candles))
+            if index <= 0:
+                return 0
+            # The latest calculated Candle may since have had Candles merged into it
+            return index if self.candles[index - 1].has_reading(self.name) else index - 1
+
+        if not self.candles or not self.candles[0].has_reading(self.name):
             return 0
 
         for index in range(len(self.candles) - 1, -1, -1):
-            if (
-                self.name in self.candles[index].indicators
-                or self.name in self.candles[index].sub_indicators
-            ):
+            if self.candles[index].has_reading(self.name):
                 return index + 1
 
         return 0
 
+    def _uncalculated(self) -> bool:
+        """Whether the Indicator hasn't been calculated since it's Candles last changed, other
+        than by appending or trimming, such as a new Indicator"""
+        return self._calculated[0] != self._candle_mngr._generation
+
+    def _calculated_until(self) -> Optional[int]:
+        """The index of the first Candle the Indicator hasn't been calculated on, by the
+        calculated-until watermark, None if calculated on every Candle"""
+        if self._uncalculated():
+            return 0
+
+        manager = self._candle_mngr
+        position = self._calculated[1] - manager._trimmed
+        if manager.candlestick is not None or position >= len(self.candles):
+            return None
+        return max(position, 0)
+
+    def _mark_calculated(self):
+        """Records every Candle as calculated, as of the Candle manager's current generation"""
+        manager = self._candle_mngr
+        self._calculated = (manager._generation, manager._trimmed + len(self.candles))
+
     def _set_reading(self, reading: Reading, index: Optional[int] = None):
         index = index if index else self._active_index
+        candle = self.candles[index]
 
-        if self._mode != IndicatorMode.SOLO:
-            self.candles[index].sub_indicators[self.name] = reading
-        else:
-            self.candles[index].indicators[self.name] = reading
+        if candle._table is None:
+            self._candle_mngr.readings.bind(candle)
+
+        candle._table.set(candle._slot, self.name, reading, self._mode != IndicatorMode.SOLO)  # type: ignore
+
+    def _set_readings(self, readings: Sequence[Reading], start_index: int):
+        """Sets consecutive readings from `start_index`, `EMPTY` readings are left unset"""
+        sub = self._mode != IndicatorMode.SOLO
+        positional = getattr(self.candles, "readings", None)
+
+        if positional is not None:
+            column = positional.column(self.name, sub)
+            end_index = start_index + len(readings)
+            if len(column) < end_index:
+                column.extend([EMPTY] * (end_index - len(column)))
+            column[start_index:end_index] = readings
+            return
+
+        table = self._candle_mngr.readings
+        for candle, reading in zip(self.candles[start_index:], readings):
+            if reading is EMPTY:
+                continue
+            if candle._table is None:
+                table.bind(candle)
+            candle._table.set(candle._slot, self.name, reading, sub)  # type: ignore
 
     def _set_active_index(self, index: int):
         self._active_index = index
@@ -506,6 +812,9 @@ class Managed(Indicator):
 
     def _calculate_reading(self, index: int) -> Reading: ...
 
+    def _lookback(self, convergence: int) -> int:
+        return 1
+
     def set_reading(self, reading: Reading, index: Optional[int] = None):
         if index is None:
             index = self._active_index
@@ -548,6 +857,9 @@ class NestedSource:
             for v in self.indicator.readings()
         ]
 
+    def readings_as_arrays(self) -> Dict[str, Any]:
+        return readings_as_arrays(self.indicator.candles, self.name)
+
     def __str__(self):
         return f"{self.indicator.name}.{self.nested_name}"
 
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Set
+
+
+class _Empty:
+    def __repr__(self) -> str:
+        return "EMPTY"
+
+
+EMPTY: Any = _Empty()
+
+
+class ReadingTable:
+    """Dense reading columns, one list per Indicator name, indexed by a Candle's slot.
+
+    A Candle is bound to a table the first time a reading is set on it, being given a slot which
+    is an index into every column. Slots are handed out in order, so for Candles that are only
+    appended the slot matches the Candle's position. Column's are padded with `EMPTY` for any slot
+    without a reading, as `None` is a valid reading.
+
+    Positional tables (used by `CandleColumns`) skip slot allocation, the slot is the Candle's
+    position and the columns are shifted with the Candles via `insert_rows`/`delete_rows`.
+    """
+
+    columns: Dict[str, List[Any]]
+    sub_names: Set[str]
+    size: int
+    _free: List[int]
+
+    def __init__(self):
+        self.columns = {}
+        self.sub_names = set()
+        self.size = 0
+        self._free = []
+
+    def __repr__(self) -> str:
+        return f"ReadingTable({list(self.columns)})"
+
+    def column(self, name: str, sub: bool = False) -> List[Any]:
+        """Returns the column for the given name, creating it if needed"""
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = []
+            if sub:
+                self.sub_names.add(name)
+        return column
+
+    def get(self, slot: int, name: str) -> Any:
+        column = self.columns.get(name)
+        if column is None or slot >= len(column):
+            return None
+
+        reading = column[slot]
+        return None if reading is EMPTY else reading
+
+    def has(self, slot: int, name: str) -> bool:
+        column = self.columns.get(name)
+        return column is not None and slot < len(column) and column[slot] is not EMPTY
+
+    def set(self, slot: int, name: str, reading: Any, sub: bool = False):
+        column = self.columns.get(name)
+        if column is None:
+            column = self.column(name, sub)
+
+        if slot >= len(column):
+            column.extend([EMPTY] * (slot + 1 - len(column)))
+        column[slot] = reading
+
+    def pop(self, slot: int, name: str) -> Any:
+        reading = self.get(slot, name)
+        if self.has(slot, name):
+            self.columns[name][slot] = EMPTY
+        return reading
+
+    def row(self, slot: int, sub: bool = False) -> Dict[str, Any]:
+        """Returns the readings of a slot as a dict, either the main or sub indicators"""
+        return {
+            name: column[slot]
+            for name, column in self.columns.items()
+            if slot < len(column) and column[slot] is not EMPTY and (name in self.sub_names) == sub
+        }
+
+    def clear(self, slot: int, sub: bool | None = None):
+        """Clears the slot's readings, either all, or only main or sub indicators"""
+        for name, column in self.columns.items():
+            if slot < len(column) and (sub is None or (name in self.sub_names) == sub):
+                column[slot] = EMPTY
+
+    def drop(self, names: str | Iterable[str]):
+        """Removes the columns entirely"""
+        for name in [names] if isinstance(names, str) else names:
+            self.columns.pop(name, None)
+            self.sub_names.discard(name)
+
+    def bind(self, candle: Any) -> int:
+        """Allocates a slot for a Candle, moving it's own readings into the table"""
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self.size
+            self.size += 1
+
+        indicators, sub_indicators = candle._indicators, candle._sub_indicators
+        candle._table = self
+        candle._slot = slot
+        candle._indicators = None
+        candle._sub_indicators = None
+
+        if indicators:
+            for name, reading in indicators.items():
+                self.set(slot, name, reading)
+        if sub_indicators:
+            for name, reading in sub_indicators.items():
+                self.set(slot, name, reading, True)
+
+        return slot
+
+    def detach(self, candle: Any):
+        """Releases the Candle's slot, moving it's readings back onto the Candle"""
+        slot = candle._slot
+        candle._indicators = self.row(slot) or None
+        candle._sub_indicators = self.row(slot, True) or None
+        candle._table = None
+        candle._slot = -1
+
+        self.clear(slot)
+        self._free.append(slot)
+
+    def insert_rows(self, index: int, count: int = 1):
+        """Positional tables only, shifts every column down from index"""
+        for column in self.columns.values():
+            if index < len(column):
+                column[index:index] = [EMPTY] * count
+
+    def delete_rows(self, start: int, stop: int):
+        """Positional tables only, removes the rows between start and stop"""
+        for column in self.columns.values():
+            del column[start:stop]
+
+    def set_rows(self, start: int, rows: Sequence[tuple]):
+        """Positional tables only, sets the readings of `(indicators, sub_indicators)` rows"""
+        for offset, (indicators, sub_indicators) in enumerate(rows):
+            if indicators:
+                for name, reading in indicators.items():
+                    self.set(start + offset, name, reading)
+            if sub_indicators:
+                for name, reading in sub_indicators.items():
+                    self.set(start + offset, name, reading, True)
+
+    def permute(self, order: Sequence[int]):
+        """Positional tables only, re-orders every column to the given order"""
+        for column in self.columns.values():
+            column.extend([EMPTY] * (len(order) - len(column)))
+            column[:] = [column[idx] for idx in order]
+
+
+class ReadingsView(MutableMapping):
+    """A dict like view of a Candle's readings within a `ReadingTable`"""
+
+    _table: ReadingTable
+    _slot: int
+    _sub: bool
+
+    def __init__(self, table: ReadingTable, slot: int, sub: bool = False):
+        self._table = table
+        self._slot = slot
+        self._sub = sub
+
+    def _is_kind(self, name: str) -> bool:
+        return (name in self._table.sub_names) == self._sub
+
+    def __getitem__(self, name: str) -> Any:
+        if not self._is_kind(name) or not self._table.has(self._slot, name):
+            raise KeyError(name)
+        return self._table.columns[name][self._slot]
+
+    def __setitem__(self, name: str, reading: Any):
+        self._table.set(self._slot, name, reading, self._sub)
+
+    def __delitem__(self, name: str):
+        if not self._is_kind(name) or not self._table.has(self._slot, name):
+            raise KeyError(name)
+        self._table.columns[name][self._slot] = EMPTY
+
+    def __contains__(self, name: object) -> bool:
+        return (
+            isinstance(name, str) and self._is_kind(name) and self._table.has(self._slot, name)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.row(self._slot, self._sub))
+
+    def __len__(self) -> int:
+        return len(self._table.row(self._slot, self._sub))
+
+    def __repr__(self) -> str:
+        return repr(self._table.row(self._slot, self._sub))
+
+    def __copy__(self) -> Dict[str, Any]:
+        return self._table.row(self._slot, self._sub)
+
+    def copy(self) -> Dict[str, Any]:
+        return self._table.row(self._slot, self._sub)
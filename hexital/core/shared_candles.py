@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from array import array
+from datetime import timezone
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional
+
+from hexital.core.candle import Candle
+from hexital.core.candle_arrays import CandleArrays, is_array_like
+from hexital.core.candle_columns import CandleColumns
+from hexital.core.reading_table import ReadingTable
+from hexital.exceptions import InvalidConfiguration
+
+# Name and typecode of each shared column, in the order of `CandleColumns._arrays`
+COLUMNS = (
+    ("open", "d"),
+    ("high", "d"),
+    ("low", "d"),
+    ("close", "d"),
+    ("volume", "d"),
+    ("timestamp", "q"),
+    ("timeframe", "q"),
+    ("aggregation_factor", "q"),
+    ("start_timestamp", "q"),
+    ("end_timestamp", "q"),
+)
+HEADER_SIZE = 64
+LENGTH, CAPACITY, VOLUME_INT, UTC = range(4)
+
+
+class SharedCandles:
+    """Candles held in shared memory, written by one process and read by many.
+
+    The Candles are stored as fixed capacity columns within a `multiprocessing.shared_memory`
+    block, laid out as in `CandleColumns`. The process creating it is the single writer,
+    appending Candles, any other process attaches to it by name and reads the same memory,
+    without copying or sending the Candles between processes.
+
+    A `Hexital` given a `SharedCandles` as it's Candles reads the columns in place, keeping only
+    it's own readings, call `Hexital.sync` to pick up and calculate any Candles appended since.
+    Pickling a `SharedCandles`, such as sending it to a `multiprocessing.Pool` worker, attaches to
+    it in the receiving process.
+
+    Note:
+        The writer publishes the new length after the Candles are written, so readers never see
+        a partly written Candle. Timestamps with a timezone are read back in UTC. Before Python
+        3.13 every attaching process registers the memory with it's resource tracker, readers
+        should be started by the writer's process, so they share it's resource tracker, rather
+        than unrelated processes.
+    """
+
+    _memory: SharedMemory
+    _header: memoryview
+    _columns: Dict[str, memoryview]
+    _staging: Optional[CandleColumns]
+    _readers: List[weakref.ref]
+
+    def __init__(self, memory: SharedMemory, writer: bool = False):
+        self._memory = memory
+        buffer = memory.buf if writer else memory.buf.toreadonly()
+
+        self._header = memory.buf[:HEADER_SIZE].cast("q")
+        capacity = self._header[CAPACITY]
+        self._columns = {}
+        for position, (name, typecode) in enumerate(COLUMNS):
+            start = HEADER_SIZE + position * capacity * 8
+            self._columns[name] = buffer[start : start + capacity * 8].cast(typecode)
+
+        self._staging = CandleColumns() if writer else None
+        self._readers = []
+
+    @classmethod
+    def create(cls, capacity: int, name: Optional[str] = None) -> SharedCandles:
+        """Creates a new block of shared memory, holding up to `capacity` Candles. The calling
+        process is it's writer.
+
+        Args:
+            capacity: The maximum number of Candles
+            name: Name of the shared memory, a unique name is generated if not given
+        """
+        if capacity < 1:
+            raise InvalidConfiguration(f"capacity must be at least 1: {capacity}")
+
+        memory = SharedMemory(name, create=True, size=HEADER_SIZE + capacity * 8 * len(COLUMNS))
+        header = memory.buf[:HEADER_SIZE].cast("q")
+        header[LENGTH] = 0
+        header[CAPACITY] = capacity
+        header[VOLUME_INT] = 1
+        header[UTC] = 0
+        header.release()
+
+        return cls(memory, writer=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedCandles:
+        """Attaches to existing `SharedCandles` by name, to read it's Candles"""
+        if sys.version_info >= (3, 13):
+            return cls(SharedMemory(name, track=False))  # type: ignore
+        return cls(SharedMemory(name))
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self._header[CAPACITY]
+
+    @property
+    def volume_int(self) -> bool:
+        return bool(self._header[VOLUME_INT])
+
+    @property
+    def tzinfo(self) -> Any:
+        return timezone.utc if self._header[UTC] else None
+
+    def __len__(self) -> int:
+        return self._header[LENGTH]
+
+    def __reduce__(self):
+        return (SharedCandles.attach, (self.name,))
+
+    def __enter__(self) -> SharedCandles:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def append(self, candles: Candle | list | Any):
+        """Appends a Candle, a list of Candles, or a NumPy array, structured array or pandas
+        DataFrame of Candles. Only the writer can append Candles.
+
+        Args:
+            candles: The Candles to append, in chronological order
+        """
+        staging = self._staging
+        if staging is None:
+            raise InvalidConfiguration(
+                f"SharedCandles '{self.name}' can only be appended by it's writer"
+            )
+
+        if is_array_like(candles):
+            staging.extend_arrays(CandleArrays.load(candles))
+        elif isinstance(candles, Candle):
+            staging.append(candles)
+        else:
+            staging.extend(candles)
+
+        start = len(self)
+        stop = start + len(staging)
+        if stop > self.capacity:
+            staging.clear()
+            raise InvalidConfiguration(
+                f"SharedCandles '{self.name}' is full, capacity {self.capacity}: {stop}"
+            )
+
+        for column, values in zip(self._columns.values(), staging._arrays):
+            column[start:stop] = values
+        staging.clear()
+
+        self._header[VOLUME_INT] = int(staging._volume_int)
+        self._header[UTC] = int(staging._tzinfo is not None)
+        self._header[LENGTH] = stop
+
+    def columns(self) -> SharedCandleColumns:
+        """Creates `CandleColumns` reading the shared Candles in place"""
+        columns = SharedCandleColumns(self)
+        self._readers = [reader for reader in self._readers if reader() is not None]
+        self._readers.append(weakref.ref(columns))
+        return columns
+
+    def close(self):
+        """Closes this process's access to the shared memory. Any `SharedCandleColumns` still
+        reading it are detached first, left empty, as is any `Hexital` reading them"""
+        for reader in self._readers:
+            columns = reader()
+            if columns is not None:
+                columns.detach()
+        self._readers = []
+
+        for column in self._columns.values():
+            column.release()
+        self._header.release()
+        self._memory.close()
+
+    def unlink(self):
+        """Frees the shared memory, called once by the writer when every process is done"""
+        self._memory.unlink()
+
+
+class SharedCandleColumns(CandleColumns):
+    """`CandleColumns` over the columns of `SharedCandles`, read in place.
+
+    The Candle values are only ever appended by the writer, call `sync` to extend the columns to
+    the Candles written since. Readings are kept per reader, as in `CandleColumns`. Candles can
+    only be removed from the front, such as trimming by `max_candles`, which moves the start of
+    the columns without changing the shared Candles.
+    """
+
+    store: SharedCandles
+    _start: int
+
+    def __init__(self, store: SharedCandles):
+        list.__init__(self)
+        self.store = store
+        self.extras = []
+        self.readings = ReadingTable()
+
+        self._base = 0
+        self._start = 0
+        self._tzinfo = None
+        self._volume_int = True
+        self._timedeltas = {}
+
+        self._slice(0)
+        self.sync()
+
+    def _slice(self, stop: int):
+        for name, column in self.store._columns.items():
+            setattr(self, name, column[self._start : stop])
+
+    def detach(self):
+        """Releases the columns' views of the shared memory, leaving them empty, called by
+        `SharedCandles.close`"""
+        for name, typecode in COLUMNS:
+            column = getattr(self, name)
+            if isinstance(column, memoryview):
+                column.release()
+            setattr(self, name, array(typecode))
+
+        self.readings.delete_rows(0, len(self.extras))
+        self.extras.clear()
+
+    def sync(self) -> int:
+        """Extends the columns to every Candle the writer has appended, returning the number of
+        new Candles"""
+        length = len(self.store)
+        count = length - self._start - len(self)
+        if count <= 0:
+            return 0
+
+        self._slice(length)
+        self.extras.extend(repeat(None, count))
+        self._volume_int = self.store.volume_int
+        self._tzinfo = self.store.tzinfo
+        return count
+
+    def __delitem__(self, index: Any):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            stop = max(start, stop)
+        else:
+            start = self._abs_index(index.__index__())
+            stop, step = start + 1, 1
+
+        if start != 0 or step != 1:
+            raise TypeError("SharedCandleColumns can only remove Candles from the front")
+
+        end = self._start + len(self)
+        self._start += stop
+        self._slice(end)
+        del self.extras[:stop]
+        self.readings.delete_rows(0, stop)
+        self._base += stop
+
+    def __setitem__(self, *_):
+        raise TypeError("SharedCandleColumns are read only, Candles are added by the writer")
+
+    def insert(self, *_):
+        raise TypeError("SharedCandleColumns are read only, Candles are added by the writer")
+
+    def append(self, *_):
+        raise TypeError("SharedCandleColumns are read only, Candles are added by the writer")
+
+    def extend(self, *_):
+        raise TypeError("SharedCandleColumns are read only, Candles are added by the writer")
+
+    def extend_arrays(self, *_):
+        raise TypeError("SharedCandleColumns are read only, Candles are added by the writer")
+
+    def sort(self, *_, **__):
+        raise TypeError("SharedCandleColumns are read only, Candles are added by the writer")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from copy import copy
+from typing import Dict, Optional
+
+from hexital.core import Reading
+from hexital.core.candle import Candle
+
+
+class HexitalSnapshot:
+    """A consistent, read only copy of a `Hexital`'s latest Candle and readings, as of a single
+    point between writes.
+
+    Snapshots are never modified once created, a thread-safe `Hexital` publishes a new snapshot
+    after each write, so any number of threads can read one without locking or waiting on the
+    writer.
+
+    Args:
+        generation: The number of writes to the `Hexital` before this snapshot
+        candle: A detached copy of the latest Candle, without readings
+        readings: The latest reading of every Indicator, by Indicator name
+    """
+
+    generation: int
+    candle: Optional[Candle]
+    readings: Dict[str, Reading]
+
+    def __init__(self, generation: int, candle: Optional[Candle], readings: Dict[str, Reading]):
+        self.generation = generation
+        self.candle = candle
+        self.readings = {
+            name: copy(reading) if isinstance(reading, dict) else reading
+            for name, reading in readings.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"HexitalSnapshot({self.generation}, {self.candle!r}, {self.readings!r})"
+
+    def reading(self, source: str) -> Reading:
+        """The latest reading of an Indicator, `source` can use '.' to find a nested reading,
+        E.G `MACD_12_26_9.MACD`"""
+        name, _, nested = source.partition(".")
+        reading = self.readings.get(name)
+        if nested and isinstance(reading, dict):
+            return reading.get(nested)
+        return reading
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Optional, Sequence, Tuple
+
+from hexital.core.candle import Candle
+from hexital.core.hexital import Hexital
+from hexital.exceptions import InvalidConfiguration
+
+Tick = Tuple[datetime, float, float | int]
+
+
+class TickAggregator:
+    """Builds a `Hexital`'s Candles from raw trades, given as `(timestamp, price, size)` tuples.
+
+    Each trade only updates the forming Candle of every timeframe in place, see
+    `Hexital.append_tick`, rather than being wrapped in a Candle and resampled. Indicators
+    are calculated once a Candle closes, when a trade opens the next Candle of any timeframe, and
+    optionally on a partial cadence while a Candle is forming.
+
+    A trade older than the latest trade is inserted as a Candle through `Hexital.insert`, which
+    places it among the Candles and recalculates from it, so late trades are kept at a cost.
+
+    Args:
+        hexital: The `Hexital` to build Candles for, normally with a `timeframe`
+        partial_ticks: Also calculates every this many trades into a forming Candle
+        partial_interval: Also calculates once this much trade time has passed since the last
+            calculation within a forming Candle
+    """
+
+    hexital: Hexital
+    partial_ticks: Optional[int]
+    partial_interval: Optional[timedelta]
+
+    _last_tick: Optional[datetime]
+    _last_calculated: Optional[datetime]
+    _ticks: int
+
+    def __init__(
+        self,
+        hexital: Hexital,
+        partial_ticks: Optional[int] = None,
+        partial_interval: Optional[timedelta] = None,
+    ):
+        if partial_ticks is not None and partial_ticks < 1:
+            raise InvalidConfiguration(f"partial_ticks must be at least 1: {partial_ticks}")
+
+        self.hexital = hexital
+        self.partial_ticks = partial_ticks
+        self.partial_interval = partial_interval
+
+        self._last_tick = None
+        self._last_calculated = None
+        self._ticks = 0
+
+    def append(self, ticks: Tick | Sequence[Tick]) -> bool:
+        """Appends a trade, or a list of trades in chronological order, calculating when a
+        Candle closes or the partial cadence is due. Returns True if it calculated."""
+        if ticks and isinstance(ticks[0], datetime):
+            ticks = [ticks]  # type: ignore
+
+        calculated = False
+        for timestamp, price, size in ticks:  # type: ignore
+            calculated |= self._append_tick(timestamp, price, size)
+        return calculated
+
+    def _append_tick(self, timestamp: datetime, price: float, size: float | int) -> bool:
+        if self._last_tick is not None and timestamp < self._last_tick:
+            self.hexital.insert(Candle(price, price, price, price, size, timestamp=timestamp))
+            self._calculated(self._last_tick)
+            return True
+
+        if self._last_calculated is None:
+            self._last_calculated = timestamp
+        self._last_tick = timestamp
+        self._ticks += 1
+
+        if self.hexital.append_tick(timestamp, price, size) or self._partial_due(timestamp):
+            self.hexital.calculate()
+            self._calculated(timestamp)
+            return True
+        return False
+
+    def _partial_due(self, timestamp: datetime) -> bool:
+        if self.partial_ticks is not None and self._ticks >= self.partial_ticks:
+            return True
+        return (
+            self.partial_interval is not None
+            and self._last_calculated is not None
+            and timestamp - self._last_calculated >= self.partial_interval
+        )
+
+    def _calculated(self, timestamp: datetime):
+        self._last_calculated = timestamp
+        self._ticks = 0
+
+    def flush(self):
+        """Calculates the forming Candles, such as after the last trade"""
+        self.hexital.calculate()
+        if self._last_tick is not None:
+            self._calculated(self._last_tick)
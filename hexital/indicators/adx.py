@@ -69,6 +69,9 @@ class ADX(Indicator[dict]):
             ),
         )
 
+    def _lookback(self, convergence: int) -> int:
+        return self.period + self.period_signal + 1 + 2 * convergence  # type: ignore
+
     def _calculate_reading(self, index: int) -> dict:
         adx_positive = None
         adx_negative = None
@@ -66,5 +66,13 @@ class Amorph(Indicator):
         period = self._analysis_kwargs.get("period")
         return f"{name}_{period}" if period else name
 
+    def _lookback(self, convergence: int) -> int:
+        periods = [
+            value
+            for name, value in self._analysis_kwargs.items()
+            if name in ("length", "period") and isinstance(value, int)
+        ]
+        return max(periods) + 1 if periods else 2
+
     def _calculate_reading(self, index: int) -> float | dict | None:
         return self._analysis_method(candles=self.candles, index=index, **self._analysis_kwargs)
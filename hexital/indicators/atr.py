@@ -1,6 +1,15 @@
 from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from hexital.core.indicator import Indicator
+from hexital.utils.batch import (
+    as_float_array,
+    period_average,
+    period_ready,
+    round_array,
+    true_range,
+)
+from hexital.utils.common import round_values
 from hexital.indicators.tr import TR
 
 
@@ -21,6 +30,8 @@ class ATR(Indicator[float | None]):
     """
 
     _name: str = field(init=False, default="ATR")
+    _recursive = True
+    _stepped = True
     period: int = 14
 
     def _generate_name(self) -> str:
@@ -37,3 +48,35 @@ class ATR(Indicator[float | None]):
             return self.sub_tr.candles_average(self.period)
 
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | None]:
+        true_range = self._batch_sub(self.sub_tr, start_index)
+        prev = self._batch_prev(start_index)
+
+        readings = []
+        for index in range(start_index, len(true_range)):
+            if prev is not None:
+                prev = (prev * (self.period - 1) + true_range[index]) / self.period
+            elif period_ready(true_range, self.period, index):
+                prev = period_average(true_range, self.period, index)
+
+            prev = round_values(prev, self.rounding)
+            readings.append(prev)
+
+        return readings
+
+    def _step_state(self) -> Optional[Dict[str, Any]]:
+        reading = self.reading(index=-1)
+        if reading is None:
+            return None
+        return {"reading": reading, "close": self.candles[-1].close}
+
+    def _step_readings(self, state: Dict[str, Any], candle: Dict[str, Any]) -> Dict[str, list]:
+        tr = true_range(candle["high"], candle["low"], state["close"])
+        readings = round_array(
+            (state["reading"] * (self.period - 1) + tr) / self.period, self.rounding
+        )
+
+        state["reading"] = as_float_array(readings)
+        state["close"] = candle["close"]
+        return {self.name: readings, self.sub_tr.name: round_array(tr, self.sub_tr.rounding)}
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
+from typing import List
 
 from hexital.core.indicator import Indicator, Source
 from hexital.indicators.sma import SMA
 from hexital.indicators.stdev import STDEV
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -52,3 +54,29 @@ class BBANDS(Indicator[dict]):
             }
 
         return bbands
+
+    def _batch_readings(self, start_index: int) -> List[dict]:
+        stdevs = self._batch_sub(self.sub_stdev, start_index)
+        smas = self._batch_sub(self.sub_sma, start_index)
+        prev = self._batch_prev(start_index)
+        prev_exists = isinstance(prev, dict) and any(v is not None for v in prev.values())
+
+        readings = []
+        for sma, stdev in zip(smas[start_index:], stdevs[start_index:]):
+            bbands = {
+                "BBL": None,
+                "BBM": None,
+                "BBU": None,
+            }
+            if prev_exists or (sma is not None and stdev is not None):
+                bbands = {
+                    "BBM": sma,
+                    "BBL": sma - (stdev * self._std),
+                    "BBU": sma + (stdev * self._std),
+                }
+
+            bbands = round_values(bbands, self.rounding)
+            prev_exists = any(v is not None for v in bbands.values())
+            readings.append(bbands)
+
+        return readings
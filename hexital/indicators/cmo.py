@@ -23,6 +23,7 @@ class CMO(Indicator[float | None]):
     """
 
     _name: str = field(init=False, default="CMO")
+    _recursive = True
     period: int = 14
     source: Source = "close"
 
@@ -42,6 +42,9 @@ class HMA(Indicator[float | None]):
             False,
         )
 
+    def _lookback(self, convergence: int) -> int:
+        return self.period + int(math.sqrt(self.period)) + 1
+
     def _calculate_reading(self, index: int) -> float | None:
         raw_hma = None
         wma = self.sub_wma.reading()
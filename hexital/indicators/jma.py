@@ -24,6 +24,7 @@ class JMA(Indicator[float | None]):
     """
 
     _name: str = field(init=False, default="JMA")
+    _recursive = True
     period: int = 7
     source: Source = "close"
     phase: float = 0.0
@@ -57,6 +58,10 @@ class JMA(Indicator[float | None]):
         self._power_1 = max(self._length_1 - 2.0, 0.5)
         self._bet = self._length_2 / (self._length_2 + 1)
 
+    def _lookback(self, convergence: int) -> int:
+        # 65 Candle average of the 10 Candle volatility sums
+        return 65 + 10 + convergence
+
     def _calculate_reading(self, index: int) -> float | None:
         price = self.reading(self.source)
         uband = self.prev_reading(NestedSource(self.data, "uband"), price)
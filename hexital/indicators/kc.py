@@ -35,6 +35,9 @@ class KC(Indicator[dict]):
         self.sub_atr = self.add_sub_indicator(ATR(period=self.period))
         self.sub_ema = self.add_sub_indicator(EMA(source=self.source, period=self.period))
 
+    def _lookback(self, convergence: int) -> int:
+        return self.period + 1 + convergence
+
     def _calculate_reading(self, index: int) -> dict:
         atr_ = self.sub_atr.reading()
         ema_ = self.sub_ema.reading()
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
+from typing import List
 
 from hexital.core.indicator import Indicator, Managed, Source
+from hexital.core.reading_table import EMPTY
 from hexital.indicators import EMA
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -52,6 +55,9 @@ class MACD(Indicator[dict]):
             EMA(source=self.data, period=self.signal_period)
         )
 
+    def _lookback(self, convergence: int) -> int:
+        return self.slow_period + self.signal_period + 1 + 2 * convergence
+
     def _calculate_reading(self, index: int) -> dict:
         ema_slow = self.sub_emas.reading()
 
@@ -68,3 +74,32 @@ class MACD(Indicator[dict]):
                 return {"MACD": macd, "signal": signal, "histogram": histogram}
 
         return {"MACD": None, "signal": None, "histogram": None}
+
+    def _batch_readings(self, start_index: int) -> List[dict]:
+        emas_fast = self._batch_sub(self.sub_emaf, start_index)
+        emas_slow = self._batch_sub(self.sub_emas, start_index)
+
+        macds = [
+            fast - slow if slow is not None else EMPTY
+            for fast, slow in zip(emas_fast[start_index:], emas_slow[start_index:])
+        ]
+        self.data._set_readings(macds, start_index)
+
+        signals = self.sub_signal._batch_readings(start_index)
+        signals = [EMPTY if macd is EMPTY else sig for macd, sig in zip(macds, signals)]
+        self.sub_signal._set_readings(signals, start_index)
+        self.sub_signal._set_active_index(len(self.candles) - 1)
+
+        readings = []
+        for macd, signal in zip(macds, signals):
+            if macd is not EMPTY and signal is not None:
+                readings.append(
+                    round_values(
+                        {"MACD": macd, "signal": signal, "histogram": macd - signal},
+                        self.rounding,
+                    )
+                )
+            else:
+                readings.append({"MACD": None, "signal": None, "histogram": None})
+
+        return readings
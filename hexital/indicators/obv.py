@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from hexital.core.indicator import Indicator
+from hexital.utils.batch import as_float_array, round_array
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -18,6 +21,7 @@ class OBV(Indicator[float]):
     """
 
     _name: str = field(init=False, default="OBV")
+    _stepped = True
 
     def _generate_name(self) -> str:
         return self._name
@@ -32,3 +36,46 @@ class OBV(Indicator[float]):
             return self.prev_reading() - self.candles[index].volume
 
         return self.candles[index].volume
+
+    def _batch_readings(self, start_index: int) -> List[float]:
+        close = self._batch_source("close")
+        volume = self._batch_source("volume")
+        prev = self._batch_prev(start_index)
+
+        readings = []
+        for index in range(start_index, len(close)):
+            if prev is None:
+                prev = volume[index]
+            elif close[index] > close[index - 1]:
+                prev = prev + volume[index]
+            elif close[index] < close[index - 1]:
+                prev = prev - volume[index]
+
+            prev = round_values(prev, self.rounding)
+            readings.append(prev)
+
+        return readings
+
+    def _step_state(self) -> Optional[Dict[str, Any]]:
+        reading = self.reading(index=-1)
+        if reading is None:
+            return None
+        return {"reading": reading, "close": self.candles[-1].close}
+
+    def _step_readings(self, state: Dict[str, Any], candle: Dict[str, Any]) -> Dict[str, list]:
+        import numpy as np
+
+        close, volume, prev = candle["close"], candle["volume"], state["reading"]
+        readings = np.where(
+            close > state["close"],
+            prev + volume,
+            np.where(close < state["close"], prev - volume, prev),
+        )
+
+        if volume.dtype.kind in "iu":
+            readings = readings.astype(volume.dtype)
+        readings = round_array(readings, self.rounding)
+
+        state["reading"] = as_float_array(readings)
+        state["close"] = close
+        return {self.name: readings}
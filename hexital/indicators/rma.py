@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils.batch import as_float_array, period_ready, round_array
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -23,6 +26,8 @@ class RMA(Indicator[float | None]):
     """
 
     _name: str = field(init=False, default="RMA")
+    _recursive = True
+    _stepped = True
     period: int = 10
     source: Source = "close"
     _alpha: float = field(init=False, default=0)
@@ -56,3 +61,35 @@ class RMA(Indicator[float | None]):
             return values / divide_by
 
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | None]:
+        values = self._batch_source(self.source)
+        prev = self._batch_prev(start_index)
+
+        readings = []
+        for index in range(start_index, len(values)):
+            if prev is not None:
+                prev = float((self._alpha * values[index]) + ((1.0 - self._alpha) * prev))
+            elif period_ready(values, self.period, index):
+                period_to = index - self.period
+                prev = sum(
+                    ((1 - self._alpha) ** py) * values[i]
+                    for py, i in enumerate(range(index, period_to, -1))
+                ) / sum((1 - self._alpha) ** i for i in range(index, period_to, -1))
+
+            prev = round_values(prev, self.rounding)
+            readings.append(prev)
+
+        return readings
+
+    def _step_state(self) -> Optional[Dict[str, Any]]:
+        reading = self.reading(index=-1)
+        return {"reading": reading} if reading is not None else None
+
+    def _step_readings(self, state: Dict[str, Any], candle: Dict[str, Any]) -> Dict[str, list]:
+        readings = round_array(
+            (self._alpha * candle[self.source]) + ((1.0 - self._alpha) * state["reading"]),
+            self.rounding,
+        )
+        state["reading"] = as_float_array(readings)
+        return {self.name: readings}
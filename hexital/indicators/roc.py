@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import List
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils.batch import active_from, as_float_array, to_readings
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -40,3 +43,28 @@ class ROC(Indicator[float | None]):
 
             return ((self.reading(self.source) - period_n_back) / period_n_back) * 100
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | int | None]:
+        values = self._batch_source(self.source)
+        readings: List[float | int | None] = [None] * (len(values) - start_index)
+
+        active = active_from(
+            values, self.period + 1, start_index, self._batch_prev(start_index) is not None
+        )
+        if active is None:
+            return readings
+
+        import numpy as np
+
+        source = as_float_array(values)
+        current = source[active:]
+        period_n_back = source[active - self.period : len(source) - self.period]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roc = ((current - period_n_back) / period_n_back) * 100
+        for offset, reading in enumerate(to_readings(roc)):
+            if period_n_back[offset] == 0:
+                reading = -100
+            readings[active - start_index + offset] = round_values(reading, self.rounding)
+
+        return readings
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from hexital.core.indicator import Indicator, Managed, NestedSource, Source
+from hexital.utils.batch import as_float_array, period_ready, round_array
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -21,6 +24,8 @@ class RSI(Indicator[float | None]):
     """
 
     _name: str = field(init=False, default="RSI")
+    _recursive = True
+    _stepped = True
     period: int = 14
     source: Source = "close"
 
@@ -64,3 +69,76 @@ class RSI(Indicator[float | None]):
             return 100.0 - (100.0 / (1.0 + (gains / losses)))
 
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | None]:
+        values = self._batch_source(self.source)
+        prev = self._batch_prev(start_index)
+        prev_data = self.data._batch_prev(start_index) or {}
+        gains, losses = prev_data.get("gain"), prev_data.get("loss")
+
+        readings = []
+        data = []
+        for index in range(start_index, len(values)):
+            if prev is not None:
+                change = values[index - 1] - values[index]
+
+                change_gain = -1 * change if change < 0 else 0.0
+                change_loss = change if change > 0 else 0.0
+
+                gains = ((gains * (self.period - 1)) + change_gain) / self.period
+                losses = ((losses * (self.period - 1)) + change_loss) / self.period
+            elif period_ready(values, self.period + 1, index):
+                changes = [
+                    values[i] - values[i - 1] for i in range(index - (self.period - 1), index + 1)
+                ]
+
+                gains = sum(chng for chng in changes if chng > 0) / self.period
+                losses = sum(abs(chng) for chng in changes if chng < 0) / self.period
+            else:
+                gains, losses = None, None
+
+            data.append({"gain": gains, "loss": losses})
+
+            prev = None
+            if gains is not None and losses is not None:
+                prev = round_values(100.0 - (100.0 / (1.0 + (gains / losses))), self.rounding)
+            readings.append(prev)
+
+        self.data._set_readings(data, start_index)
+        return readings
+
+    def _step_state(self) -> Optional[Dict[str, Any]]:
+        reading = self.reading(index=-1)
+        data = self.data.reading(index=-1)
+        if reading is None or not isinstance(data, dict):
+            return None
+        return {
+            "reading": reading,
+            "gain": data["gain"],
+            "loss": data["loss"],
+            "source": getattr(self.candles[-1], self.source),
+        }
+
+    def _step_readings(self, state: Dict[str, Any], candle: Dict[str, Any]) -> Dict[str, list]:
+        import numpy as np
+
+        change = state["source"] - candle[self.source]
+
+        change_gain = np.where(change < 0, -1 * change, 0.0)
+        change_loss = np.where(change > 0, change, 0.0)
+
+        gains = ((state["gain"] * (self.period - 1)) + change_gain) / self.period
+        losses = ((state["loss"] * (self.period - 1)) + change_loss) / self.period
+
+        with np.errstate(divide="ignore"):
+            readings = round_array(100.0 - (100.0 / (1.0 + (gains / losses))), self.rounding)
+
+        state.update(
+            reading=as_float_array(readings), gain=gains, loss=losses, source=candle[self.source]
+        )
+        return {
+            self.name: readings,
+            self.data.name: [
+                {"gain": gain, "loss": loss} for gain, loss in zip(gains.tolist(), losses.tolist())
+            ],
+        }
@@ -50,6 +50,9 @@ class RVI(Indicator[float | None]):
             ),
         )
 
+    def _lookback(self, convergence: int) -> int:
+        return 2 * self.period + 1 + convergence
+
     def _calculate_reading(self, index: int) -> float | None:
         stdev_reading = self.sub_stdev.reading()
 
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import List
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils.batch import period_average, period_ready
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -39,3 +42,19 @@ class SMA(Indicator[float | None]):
             return self.candles_average(self.period, self.source)
 
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | None]:
+        values = self._batch_source(self.source)
+        prev = self._batch_prev(start_index)
+
+        readings = []
+        for index in range(start_index, len(values)):
+            if prev is not None:
+                prev = prev - (values[index - self.period] - values[index]) / self.period
+            elif period_ready(values, self.period, index):
+                prev = period_average(values, self.period, index)
+
+            prev = round_values(prev, self.rounding)
+            readings.append(prev)
+
+        return readings
@@ -1,7 +1,11 @@
 from dataclasses import dataclass, field
 from math import sqrt
+from typing import List
 
 from hexital.core.indicator import Indicator, Managed, NestedSource, Source
+from hexital.core.reading_table import EMPTY
+from hexital.utils.batch import period_ready
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -58,3 +62,46 @@ class STDEV(Indicator[float | None]):
 
         if self.prev_exists() or self.reading_period(self.period, self.source, index):
             return sqrt(variance) if variance > 0 else 0
+
+    def _batch_readings(self, start_index: int) -> List[float | int | None]:
+        values = self._batch_source(self.source)
+        prev = self._batch_prev(start_index)
+        prev_data = self.data._batch_prev(start_index) or {}
+        old_mean = prev_data.get("mean")
+        variance = prev_data.get("variance")
+
+        readings = []
+        data = []
+        for index in range(start_index, len(values)):
+            reading = values[index]
+
+            if reading is None:
+                data.append(EMPTY)
+                readings.append(None)
+                prev, old_mean, variance = None, None, None
+                continue
+
+            popped_reading = 0
+            if period_ready(values, self.period + 1, index):
+                popped_reading = values[index - self.period]
+
+            old_mean = old_mean if old_mean is not None else 0.0
+            variance = variance if variance is not None else 0.0
+
+            mean_ = old_mean + (reading - popped_reading) / self.period
+
+            variance += (
+                (reading - popped_reading)
+                * (reading - mean_ + popped_reading - old_mean)
+                / (self.period)
+            )
+
+            data.append({"mean": mean_, "variance": variance})
+            old_mean = mean_
+
+            if prev is not None or period_ready(values, self.period, index):
+                prev = round_values(sqrt(variance) if variance > 0 else 0, self.rounding)
+            readings.append(prev)
+
+        self.data._set_readings(data, start_index)
+        return readings
@@ -1,8 +1,12 @@
 from dataclasses import dataclass, field
+from typing import List
 
 from hexital.analysis import movement
 from hexital.core.indicator import Indicator, Managed, NestedSource, Source
+from hexital.core.reading_table import EMPTY
 from hexital.indicators.sma import SMA
+from hexital.utils.batch import as_float_array, period_ready, rolling_extreme, to_readings
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -60,6 +64,9 @@ class STOCH(Indicator[dict]):
             ),
         )
 
+    def _lookback(self, convergence: int) -> int:
+        return self.period + self.smoothing_k + self.slow_period
+
     def _calculate_reading(self, index: int) -> dict:
         stoch = None
         k = None
@@ -78,3 +85,45 @@ class STOCH(Indicator[dict]):
             self.sub_d.calculate_index(index)
 
         return {"stoch": stoch, "k": k, "d": self.sub_d.reading()}
+
+    def _batch_readings(self, start_index: int) -> List[dict]:
+        import numpy as np
+
+        values = self._batch_source(self.source)
+        ready = [period_ready(values, self.period, i) for i in range(start_index, len(values))]
+
+        lowest = rolling_extreme(as_float_array(self._batch_source("low")), self.period, False)
+        highest = rolling_extreme(as_float_array(self._batch_source("high")), self.period, True)
+        source = as_float_array(values)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stochs = to_readings(
+                ((source[start_index:] - lowest[start_index:]) / (highest - lowest)[start_index:])
+                * 100
+            )
+
+        data = [{"stoch": stoch} if ready_ else EMPTY for stoch, ready_ in zip(stochs, ready)]
+        self.data._set_readings(data, start_index)
+        k = self._batch_masked(self.sub_k, start_index, ready)
+
+        data = [
+            {"stoch": stoch, "k": k_} if ready_ else EMPTY
+            for stoch, k_, ready_ in zip(stochs, k, ready)
+        ]
+        self.data._set_readings(data, start_index)
+        d = self._batch_masked(self.sub_d, start_index, ready)
+
+        return [
+            round_values({"stoch": stoch, "k": k_, "d": d_}, self.rounding)
+            if ready_
+            else {"stoch": None, "k": None, "d": None}
+            for stoch, k_, d_, ready_ in zip(stochs, k, d, ready)
+        ]
+
+    def _batch_masked(self, indicator: SMA, start_index: int, ready: List[bool]) -> List:
+        readings = indicator._batch_readings(start_index)
+        indicator._set_readings(
+            [reading if ready_ else EMPTY for reading, ready_ in zip(readings, ready)],
+            start_index,
+        )
+        indicator._set_active_index(len(self.candles) - 1)
+        return readings
@@ -22,6 +22,7 @@ class Supertrend(Indicator[dict]):
     """
 
     _name: str = field(init=False, default="Supertrend")
+    _recursive = True
     period: int = 7
     source: Source = "close"
     multiplier: float = 3.0
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from hexital.core.indicator import Indicator
+from hexital.utils.batch import as_float_array, round_array, to_readings, true_range
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -17,6 +20,7 @@ class TR(Indicator[float | None]):
     """
 
     _name: str = field(init=False, default="TR")
+    _stepped = True
 
     def _generate_name(self) -> str:
         return self._name
@@ -29,3 +33,24 @@ class TR(Indicator[float | None]):
             return max(high - low, abs(high - close), abs(low - close))
 
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | None]:
+        start = max(start_index, 1)
+        high = as_float_array(self._batch_source("high"))[start:]
+        low = as_float_array(self._batch_source("low"))[start:]
+        close = as_float_array(self._batch_source("close"))[start - 1 : -1]
+
+        readings = [None] * (start - start_index)
+        return readings + [
+            round_values(r, self.rounding) for r in to_readings(true_range(high, low, close))
+        ]
+
+    def _step_state(self) -> Optional[Dict[str, Any]]:
+        if not self.candles:
+            return None
+        return {"close": self.candles[-1].close}
+
+    def _step_readings(self, state: Dict[str, Any], candle: Dict[str, Any]) -> Dict[str, list]:
+        readings = true_range(candle["high"], candle["low"], state["close"])
+        state["close"] = candle["close"]
+        return {self.name: round_array(readings, self.rounding)}
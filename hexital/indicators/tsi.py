@@ -61,6 +61,9 @@ class TSI(Indicator[float | None]):
             False,
         )
 
+    def _lookback(self, convergence: int) -> int:
+        return self.period + self.smooth_period + 2 + 2 * convergence  # type: ignore
+
     def _calculate_reading(self, index: int) -> float | None:
         prev_reading = self.prev_reading(self.source)
         if prev_reading is None:
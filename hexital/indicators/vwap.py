@@ -10,6 +10,7 @@ from hexital.utils.timeframe import (
     round_down_timestamp,
     timedelta_to_str,
     timeframe_validation,
+    to_epoch,
 )
 
 
@@ -47,7 +48,7 @@ class VWAP(Indicator[float]):
     def _calculate_reading(self, index: int) -> float:
         candle = self.candles[index]
 
-        current_anchor = round_down_timestamp(self.reading("timestamp"), self.anchor).timestamp()
+        current_anchor = to_epoch(round_down_timestamp(self.reading("timestamp"), self.anchor))
         prev_anchor = self.prev_reading(NestedSource(self.data, "active_anchor"))
         typical_price = (candle.high + candle.low + candle.close) / 3.0
 
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
+from typing import List
 
 from hexital.core.indicator import Indicator, Source
+from hexital.utils.batch import active_from, as_float_array, rolling_weighted, to_readings
+from hexital.utils.common import round_values
 
 
 @dataclass(kw_only=True)
@@ -38,3 +41,21 @@ class WMA(Indicator[float | None]):
             weight = (self.period * (self.period + 1)) / 2
             return values / weight
         return None
+
+    def _batch_readings(self, start_index: int) -> List[float | None]:
+        values = self._batch_source(self.source)
+        readings = [None] * (len(values) - start_index)
+
+        active = active_from(
+            values, self.period, start_index, self._batch_prev(start_index) is not None
+        )
+        if active is None:
+            return readings
+
+        weight = (self.period * (self.period + 1)) / 2
+        weighted = rolling_weighted(as_float_array(values), self.period)[active:] / weight
+
+        readings[active - start_index :] = [
+            round_values(reading, self.rounding) for reading in to_readings(weighted)
+        ]
+        return readings
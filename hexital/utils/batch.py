@@ -0,0 +1,103 @@
+from importlib.util import find_spec
+from typing import Any, List, Optional, Sequence
+
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
+
+def period_ready(values: Sequence[Any], period: int, index: int) -> bool:
+    """Batch version of `reading_period` over a list of values"""
+    period_ = period - 1
+    if index - period_ < 0:
+        return False
+
+    for point in [period_, period_ / 2, 0]:
+        if values[index - int(point)] is None:
+            return False
+    return True
+
+
+def period_average(values: Sequence[Any], length: int, index: int) -> float:
+    """Batch version of `candles_average` over a list of values"""
+    start = index + 1 - length
+    readings = [
+        value for value in values[start if start > 0 else 0 : index + 1]
+        if isinstance(value, (float, int))
+    ]
+    return sum(readings) / len(readings) if readings else 0
+
+
+def as_float_array(values: Sequence[Any]) -> Any:
+    """Converts a list of values to a NumPy float64 array, with NaN in place of None"""
+    import numpy as np
+
+    return np.array(values, dtype=np.float64)
+
+
+def active_from(
+    values: Sequence[Any], period: int, start: int, prev_exists: bool
+) -> Optional[int]:
+    """Finds the first index from `start` an Indicator is calculated, for Indicators that
+    calculate once the previous reading exists or `period` values exist. Returns None if it's
+    never calculated"""
+    if prev_exists:
+        return start
+    for index in range(start, len(values)):
+        if period_ready(values, period, index):
+            return index
+    return None
+
+
+def true_range(high: Any, low: Any, prev_close: Any) -> Any:
+    """Batch version of the True Range, over NumPy arrays of each Candle's high and low and the
+    previous Candle's close"""
+    import numpy as np
+
+    return np.maximum(
+        np.maximum(high - low, np.abs(high - prev_close)), np.abs(low - prev_close)
+    )
+
+
+def rolling_weighted(values: Any, period: int) -> Any:
+    """Sum of each window of `period` values, weighted `period` for the newest down to 1 for the
+    oldest. Summed newest first in the same order as a Python `sum`, index `i` holds the window
+    ending at `i`, the first `period - 1` are NaN"""
+    import numpy as np
+
+    totals = np.full(len(values), np.nan)
+    if len(values) < period:
+        return totals
+
+    window = slice(period - 1, None)
+    total = np.zeros(len(values) - period + 1)
+    for offset in range(period):
+        total = total + values[period - 1 - offset : len(values) - offset] * (period - offset)
+    totals[window] = total
+    return totals
+
+
+def rolling_extreme(values: Any, period: int, highest: bool) -> Any:
+    """Highest or lowest of each window of `period` values, index `i` holds the window ending at
+    `i`, the first `period - 1` are NaN"""
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    extremes = np.full(len(values), np.nan)
+    if len(values) < period:
+        return extremes
+
+    windows = sliding_window_view(values, period)
+    extremes[period - 1 :] = windows.max(axis=1) if highest else windows.min(axis=1)
+    return extremes
+
+
+def to_readings(values: Any) -> List[Optional[float]]:
+    """Converts a NumPy array to a list of readings, with None in place of NaN"""
+    return [None if value != value else value for value in values.tolist()]
+
+
+def round_array(values: Any, round_by: Optional[int]) -> List[Any]:
+    """Converts a NumPy array to a list of readings, rounding each as `round_values`"""
+    readings = values.tolist()
+    if round_by is None:
+        return readings
+    return [round(value, round_by) if isinstance(value, float) else value for value in readings]
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from hexital.core.candle import Candle
+from hexital.core.reading_table import EMPTY
 from hexital.utils.indexing import absindex, valid_index
 
 
@@ -21,30 +22,88 @@ def reading_by_candle(candle: Candle, name: str) -> float | dict | None:
         reading = _nested_indicator(candle, main_name, nested_name)
         return reading
 
+    table = candle._table
+    if table is not None and name in table.columns:
+        return table.get(candle._slot, name)
+
     attr = getattr(candle, name, None)
 
     if attr is not None:
         return attr
 
-    if name in candle.indicators:
-        return candle.indicators[name]
+    return candle.get_reading(name)
 
-    if name in candle.sub_indicators:
-        return candle.sub_indicators[name]
 
-    return None
+def _nested_indicator(candle: Candle, name: str, nested_name: str) -> float | None:
+    reading = candle.get_reading(name)
+    return reading.get(nested_name) if isinstance(reading, dict) else reading
 
 
-def _nested_indicator(candle: Candle, name: str, nested_name: str) -> float | None:
-    if name in candle.indicators:
-        reading = candle.indicators[name]
-        return reading.get(nested_name) if isinstance(reading, dict) else reading
+def readings_by_candles(candles: List[Candle], name: str) -> List[Any]:
+    """Gets the raw readings of the given indicator for every Candle, None when missing.
+    Reads straight from the reading table's column where the Candles are bound to one"""
+    if not candles:
+        return []
+
+    positional = getattr(candles, "readings", None)
+    table = positional if positional is not None else candles[0]._table
+    column = table.columns.get(name) if table is not None else None
+    if column is None:
+        return [candle.get_reading(name) for candle in candles]
 
-    if name in candle.sub_indicators:
-        reading = candle.sub_indicators[name]
-        return reading.get(nested_name) if isinstance(reading, dict) else reading
+    if positional is not None:
+        # Positional table, row `idx` is Candle `idx`
+        readings = column[: len(candles)]
+        readings.extend([None] * (len(candles) - len(readings)))
+        return [None if reading is EMPTY else reading for reading in readings]
 
-    return None
+    size = len(column)
+    readings = []
+    for candle in candles:
+        slot = candle._slot
+        if candle._table is table and 0 <= slot < size:
+            reading = column[slot]
+            readings.append(None if reading is EMPTY else reading)
+        else:
+            readings.append(candle.get_reading(name))
+    return readings
+
+
+def readings_as_arrays(candles: List[Candle], name: str) -> Dict[str, Any]:
+    """Exports the given indicator's readings as NumPy float64 arrays, with NaN for missing
+    readings. Returns one array per output, keyed `name` for single value indicators, or
+    `name.output` for each output of multi value indicators. Requires NumPy."""
+    import numpy as np
+
+    nested_name = None
+    if "." in name:
+        name, nested_name = name.split(".")
+
+    readings = readings_by_candles(candles, name)
+
+    outputs = None
+    for reading in reversed(readings):
+        if isinstance(reading, dict):
+            outputs = [nested_name] if nested_name else list(reading)
+            break
+
+    if outputs is None:
+        return {
+            f"{name}.{nested_name}" if nested_name else name: np.array(
+                readings, dtype=np.float64
+            )
+        }
+
+    return {
+        f"{name}.{output}": np.array(
+            [
+                reading.get(output) if isinstance(reading, dict) else None
+                for reading in readings
+            ],
+            dtype=np.float64,
+        )
+        for output in outputs
+    }
 
 
 def reading_count(candles: List[Candle], name: str, index: Optional[int] = None) -> int:
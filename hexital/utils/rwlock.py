@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from threading import Condition, Lock, get_ident, local
+from typing import Optional
+
+
+class ReadWriteLock:
+    """A lock held by any number of readers at once, or a single writer.
+
+    Writers are preferred, new readers wait while a writer is waiting, so a steady stream of
+    readers can't starve the writer. Both are re-entrant, the writer can read or write again
+    while holding the lock, and a reader can read again, but a reader can't become the writer.
+    """
+
+    _condition: Condition
+    _readers: int
+    _writer: Optional[int]
+    _writes: int
+    _waiting: int
+    _local: local
+
+    def __init__(self):
+        self._condition = Condition(Lock())
+        self._readers = 0
+        self._writer = None
+        self._writes = 0
+        self._waiting = 0
+        self._local = local()
+
+    def is_writer(self) -> bool:
+        """If the calling thread holds the lock as the writer"""
+        return self._writer == get_ident()
+
+    def acquire_read(self):
+        if self._writer == get_ident():
+            self._writes += 1
+            return
+
+        depth = getattr(self._local, "depth", 0)
+        if not depth:
+            with self._condition:
+                while self._writer is not None or self._waiting:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+
+    def release_read(self):
+        if self._writer == get_ident():
+            self._writes -= 1
+            return
+
+        self._local.depth -= 1
+        if not self._local.depth:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    def acquire_write(self):
+        ident = get_ident()
+        if self._writer == ident:
+            self._writes += 1
+            return
+        if getattr(self._local, "depth", 0):
+            raise RuntimeError("ReadWriteLock can't be written while it's being read")
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._writer = ident
+            self._writes = 1
+
+    def release_write(self):
+        self._writes -= 1
+        if not self._writes:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+    @property
+    def read(self) -> _Reading:
+        """Context manager holding the lock as a reader"""
+        return _Reading(self)
+
+    @property
+    def write(self) -> _Writing:
+        """Context manager holding the lock as the writer"""
+        return _Writing(self)
+
+
+class _Reading:
+    __slots__ = ("_lock",)
+
+    def __init__(self, lock: ReadWriteLock):
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire_read()
+
+    def __exit__(self, *_):
+        self._lock.release_read()
+
+
+class _Writing:
+    __slots__ = ("_lock",)
+
+    def __init__(self, lock: ReadWriteLock):
+        self._lock = lock
+
+    def __enter__(self):
+        self._lock.acquire_write()
+
+    def __exit__(self, *_):
+        self._lock.release_write()
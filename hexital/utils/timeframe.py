@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional, TypeAlias
 
@@ -8,6 +8,11 @@ from hexital.exceptions import InvalidTimeFrame
 
 VALID_TIMEFRAME_PREFIXES = ["S", "T", "H", "D"]
 
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+DAY = timedelta(days=1)
+
 
 class TimeFrame(Enum):
     """Pre-defined TimeFrame values"""
@@ -130,11 +135,11 @@ def round_down_timestamp(timestamp: datetime, timeframe: timedelta) -> datetime:
     Note: This method also calls trim_timestamp, removing microseconds
     """
     timestamp = trim_timestamp(timestamp)
-    if timeframe < timedelta(days=1):
-        return datetime.fromtimestamp(
-            timestamp.timestamp() // timeframe.total_seconds() * timeframe.total_seconds(),
-            tz=timestamp.tzinfo,
-        )
+    if timeframe < DAY:
+        since = since_epoch(timestamp)
+        if timestamp.tzinfo is None or timestamp.tzinfo is timezone.utc:
+            return timestamp - since % timeframe
+        return (EPOCH_UTC + since - since % timeframe).astimezone(timestamp.tzinfo)
     elif timeframe < timedelta(days=7):
         return timestamp.replace(hour=0, minute=0, second=0)
     else:
@@ -150,9 +155,20 @@ def within_timeframe(timestamp: datetime, within: datetime, timeframe: timedelta
 
 def on_timeframe(timestamp: datetime, timeframe: timedelta) -> bool:
     """Checks if timestamp is on a timeframe value"""
-    return timestamp.timestamp() % timeframe.total_seconds() == 0
+    return not since_epoch(timestamp) % timeframe
 
 
 def trim_timestamp(timestamp: datetime) -> datetime:
     """Removes Microseconds from the timestamp and returns it"""
-    return timestamp.replace(microsecond=0)
+    return timestamp.replace(microsecond=0) if timestamp.microsecond else timestamp
+
+
+def since_epoch(timestamp: datetime) -> timedelta:
+    """Time since the epoch, naive timestamps are taken as UTC. Timeframe math is done on this as
+    exact integer microseconds, rather than converting to and from float POSIX timestamps."""
+    return timestamp - (EPOCH if timestamp.tzinfo is None else EPOCH_UTC)
+
+
+def to_epoch(timestamp: datetime) -> int:
+    """Microseconds since the epoch, naive timestamps are taken as UTC"""
+    return since_epoch(timestamp) // MICROSECOND
@@ -0,0 +1,54 @@
+from functools import partial
+from typing import List
+
+import pytest
+from hexital import EMA, MACD, RSI, Candle, Hexital, backfill
+from hexital.core.backfill import calculate_readings
+
+
+def strategy() -> Hexital:
+    return Hexital("Test Stratergy", [], [EMA(), RSI(), MACD(), EMA(timeframe="T5")])
+
+
+def load_candles(candles: List[Candle], count: int) -> List[Candle]:
+    return candles[:count]
+
+
+class TestBackfill:
+    @pytest.mark.usefixtures("candles")
+    def test_calculate_readings(self, candles: List[Candle]):
+        expected = Hexital("Test Stratergy", candles, strategy().indicators.values())
+        expected.calculate()
+
+        assert calculate_readings(strategy().settings, candles) == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    def test_single_process(self, candles: List[Candle]):
+        sources = {"A": candles[:200], "B": partial(load_candles, candles, 300)}
+
+        readings = backfill(strategy().settings, sources, processes=1)
+
+        assert list(readings) == ["A", "B"]
+        assert readings["A"] == calculate_readings(strategy().settings, candles[:200])
+        assert readings["B"] == calculate_readings(strategy().settings, candles[:300])
+
+    @pytest.mark.usefixtures("candles")
+    def test_process_pool(self, candles: List[Candle]):
+        sources = {
+            f"S{count}": partial(load_candles, candles, count) for count in [100, 200, 300, 400]
+        }
+
+        readings = backfill(strategy().settings, sources, processes=2)
+
+        assert list(readings) == list(sources)
+        assert readings == backfill(strategy().settings, sources, processes=1)
+
+    @pytest.mark.usefixtures("candles")
+    def test_as_arrays(self, candles: List[Candle]):
+        pytest.importorskip("numpy")
+        readings = backfill(
+            strategy().settings, {"A": candles, "B": candles[:100]}, processes=2, as_arrays=True
+        )
+
+        assert readings["A"]["MACD_12_26_9.signal"].dtype.name == "float64"
+        assert len(readings["B"]["EMA_10"]) == 100
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from datetime import datetime, timedelta
 
 import pytest
@@ -601,3 +603,49 @@ class TestCandleMerge:
             main_candle.timestamp == datetime(2023, 10, 3, 9, 0, 30)
             and main_candle.close == 12536.019
         )
+
+
+class TestCandleCompact:
+    def test_slots(self, simple_candle):
+        assert not hasattr(simple_candle, "__dict__")
+
+        with pytest.raises(AttributeError):
+            simple_candle.unknown = 1
+
+    def test_lazy_fields(self, simple_candle):
+        assert simple_candle._refs is None
+        assert simple_candle._indicators is None
+        assert simple_candle == Candle(100, 120, 70, 90, 1)
+
+        simple_candle.indicators["EMA"] = 10
+        assert simple_candle.indicators == {"EMA": 10}
+        assert simple_candle != Candle(100, 120, 70, 90, 1)
+
+    def test_shared_timeframe(self):
+        candle_one = Candle(100, 120, 70, 90, 1, timeframe="T5")
+        candle_two = Candle(100, 120, 70, 90, 1, timeframe=timedelta(minutes=5))
+
+        assert candle_one.timeframe == timedelta(minutes=5)
+        assert candle_one.timeframe is candle_two.timeframe
+
+    def test_copy(self):
+        candle = Candle(
+            100,
+            120,
+            70,
+            90,
+            1,
+            timestamp=datetime(2023, 10, 3, 9, 5),
+            timeframe="T5",
+            indicators={"EMA": 10},
+        )
+        candle.aggregation_factor = 3
+        candle._start_timestamp = datetime(2023, 10, 3, 9, 1)
+
+        copied = copy.deepcopy(candle)
+
+        assert copied == candle
+        assert copied is not candle
+        assert copied.aggregation_factor == 3
+        assert copied.indicators == {"EMA": 10}
+        assert pickle.loads(pickle.dumps(candle)) == candle
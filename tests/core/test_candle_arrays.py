@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from hexital import EMA, Candle, CandleArrays, CandleSchema, Hexital
+from hexital.core.candle_manager import CandleManager
+from hexital.exceptions import InvalidConfiguration
+
+np = pytest.importorskip("numpy")
+
+
+def as_array(candles: List[Candle]):
+    return np.array(
+        [
+            [c.timestamp.replace(tzinfo=timezone.utc).timestamp()] + c.as_list()[1:6]
+            for c in candles
+        ]
+    )
+
+
+class TestCandleArrays:
+    def test_separate_arrays(self):
+        arrays = CandleArrays(
+            [1, 2],
+            [2, 3],
+            [0.5, 1.5],
+            [1.5, 2.5],
+            np.array([100, 200]),
+            timestamp=np.array(["2023-10-03T09:00", "2023-10-03T09:01"], dtype="datetime64[m]"),
+            timeframe="T1",
+        )
+
+        assert arrays.to_candles() == [
+            Candle(1, 2, 0.5, 1.5, 100, timestamp=datetime(2023, 10, 3, 9, 0), timeframe="T1"),
+            Candle(2, 3, 1.5, 2.5, 200, timestamp=datetime(2023, 10, 3, 9, 1), timeframe="T1"),
+        ]
+        assert isinstance(arrays.to_candles()[0].volume, int)
+
+    @pytest.mark.usefixtures("candles")
+    def test_2d_array(self, candles: List[Candle]):
+        loaded = CandleArrays.load(as_array(candles[:20])).to_candles()
+
+        assert loaded == candles[:20]
+
+    def test_structured_array(self):
+        records = np.array(
+            [(1696323600000, 1.0, 2.0, 0.5, 1.5, 100)],
+            dtype=[
+                ("Date", "i8"),
+                ("Open", "f8"),
+                ("High", "f8"),
+                ("Low", "f8"),
+                ("Close", "f8"),
+                ("Volume", "i8"),
+            ],
+        )
+
+        assert CandleArrays.load(records, epoch_unit="ms").to_candles() == [
+            Candle(1, 2, 0.5, 1.5, 100, timestamp=datetime(2023, 10, 3, 9, 0))
+        ]
+
+    def test_schema(self):
+        schema = CandleSchema(columns=["open", "high", "low", "close", "volume", "timestamp"])
+        rows = np.array([[1.0, 2.0, 0.5, 1.5, 100, 1696323600]])
+
+        assert schema.load_arrays(rows).to_candles()[0].timestamp == datetime(2023, 10, 3, 9)
+
+    def test_missing_field(self):
+        with pytest.raises(InvalidConfiguration):
+            CandleArrays.load(np.zeros(3, dtype=[("open", "f8"), ("close", "f8")]))
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(InvalidConfiguration):
+            CandleArrays([1, 2], [2, 3], [0.5], [1.5, 2.5], [100, 200])
+
+
+class TestArrayIngestion:
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_manager_append(self, candles: List[Candle], columnar: bool):
+        manager = CandleManager(columnar=columnar)
+        manager.append(as_array(candles[:10]))
+        manager.append(as_array(candles[10:20]))
+
+        assert manager.candles == candles[:20]
+
+    @pytest.mark.usefixtures("candles", "expected_ema")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_hexital(self, candles: List[Candle], expected_ema: list, columnar: bool):
+        array = as_array(candles)
+        indicators = [EMA(), EMA(timeframe="T5")]
+        strat = Hexital("Test Stratergy", array[:100], indicators, columnar=columnar)
+        strat.append(array[100:])
+
+        assert len(strat.candles()) == len(candles)
+        assert strat.reading_as_list("EMA_10") == pytest.approx(expected_ema)
+        assert strat.candles("T5")[0].timeframe == timedelta(minutes=5)
+
+    @pytest.mark.usefixtures("candles")
+    def test_dataframe(self, candles: List[Candle]):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(
+            {
+                "Open": [c.open for c in candles[:20]],
+                "High": [c.high for c in candles[:20]],
+                "Low": [c.low for c in candles[:20]],
+                "Close": [c.close for c in candles[:20]],
+                "Volume": [c.volume for c in candles[:20]],
+            },
+            index=pd.DatetimeIndex([c.timestamp for c in candles[:20]]),
+        )
+
+        strat = Hexital("Test Stratergy", frame, [EMA()])
+
+        assert strat.candles() == candles[:20]
@@ -0,0 +1,111 @@
+from datetime import timedelta
+from typing import List
+
+import pytest
+from hexital import EMA, Candle, Hexital
+from hexital.core.candle_buffer import CandleBuffer
+from hexital.core.candle_manager import CandleManager
+from hexital.exceptions import InvalidConfiguration
+
+
+class TestCandleBuffer:
+    @pytest.mark.usefixtures("candles")
+    def test_round_trip(self, candles: List[Candle]):
+        buffer = CandleBuffer(candles)
+
+        assert len(buffer) == len(candles)
+        assert buffer == candles
+        assert buffer[-1] is candles[-1]
+        assert buffer[5:10] == candles[5:10]
+
+    @pytest.mark.usefixtures("candles")
+    def test_wraps_around(self, candles: List[Candle]):
+        buffer = CandleBuffer(candles[:4], capacity=4)
+
+        for candle in candles[4:10]:
+            buffer.popleft()
+            buffer.append(candle)
+
+        assert buffer.capacity == 4
+        assert buffer == candles[6:10]
+        assert list(reversed(buffer)) == candles[6:10][::-1]
+
+    @pytest.mark.usefixtures("candles")
+    def test_front_slice_delete(self, candles: List[Candle]):
+        buffer = CandleBuffer(candles[:10])
+        del buffer[:3]
+
+        assert buffer == candles[3:10]
+        assert buffer[0] is candles[3]
+
+    @pytest.mark.usefixtures("candles")
+    def test_insert_and_pop(self, candles: List[Candle]):
+        buffer = CandleBuffer([candles[1], candles[3]], capacity=2)
+
+        buffer.insert(0, candles[0])
+        buffer.insert(2, candles[2])
+        buffer[4:4] = [candles[4]]
+
+        assert buffer == candles[:5]
+        assert buffer.pop(2) is candles[2]
+        assert buffer.pop() is candles[4]
+        assert buffer == [candles[0], candles[1], candles[3]]
+
+    def test_empty_pop(self):
+        with pytest.raises(IndexError):
+            CandleBuffer().pop()
+
+
+class TestRetention:
+    @pytest.mark.usefixtures("candles")
+    def test_trim(self, candles: List[Candle]):
+        manager = CandleManager(candle_life=timedelta(minutes=10))
+        for candle in candles[:50]:
+            manager.append(candle)
+
+        expiry = candles[49].timestamp - timedelta(minutes=10)
+        assert isinstance(manager.candles, CandleBuffer)
+        assert manager.candles == [c for c in candles[:50] if c.timestamp >= expiry]
+
+    @pytest.mark.usefixtures("candles", "expected_ema")
+    def test_indicator_across_evictions(self, candles: List[Candle], expected_ema: list):
+        strat = Hexital("Test Stratergy", [], [EMA()], candle_life=timedelta(minutes=30))
+        for candle in candles:
+            strat.append(candle)
+
+        readings = strat.readings()["EMA_10"]
+        assert len(readings) == 31
+        assert readings == pytest.approx(expected_ema[-31:])
+
+    @pytest.mark.usefixtures("candles")
+    def test_max_candles(self, candles: List[Candle]):
+        manager = CandleManager(max_candles=20)
+        for candle in candles:
+            manager.append(candle)
+
+        assert manager.candles == candles[-20:]
+        assert manager.candles.capacity == 21
+
+    @pytest.mark.usefixtures("candles")
+    def test_max_candles_no_timestamps(self, candles: List[Candle]):
+        manager = CandleManager(max_candles=5)
+        manager.append([Candle(c.open, c.high, c.low, c.close, c.volume) for c in candles[:10]])
+
+        assert len(manager.candles) == 5
+
+    def test_max_candles_invalid(self):
+        with pytest.raises(InvalidConfiguration):
+            CandleManager(max_candles=0)
+
+    @pytest.mark.usefixtures("candles", "expected_ema")
+    def test_max_candles_hexital(self, candles: List[Candle], expected_ema: list):
+        strat = Hexital(
+            "Test Stratergy", [], [EMA(), EMA(timeframe="T5", max_candles=5)], max_candles=50
+        )
+        for candle in candles:
+            strat.append(candle)
+
+        assert len(strat.candles()) == 50
+        assert len(strat.candles("T5")) == 5
+        assert strat.readings()["EMA_10"] == pytest.approx(expected_ema[-50:])
+        assert strat.settings["max_candles"] == 50
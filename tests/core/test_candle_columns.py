@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from hexital import EMA, Candle, Hexital
+from hexital.core.candle_columns import CandleColumns, CandleView
+from hexital.core.candle_manager import CandleManager
+
+
+class TestCandleColumns:
+    @pytest.mark.usefixtures("candles")
+    def test_round_trip(self, candles: List[Candle]):
+        columns = CandleColumns(candles)
+
+        assert len(columns) == len(candles)
+        assert columns == candles
+        assert isinstance(columns[-1], CandleView)
+
+    def test_view_write_through(self):
+        columns = CandleColumns([Candle(1, 2, 0.5, 1.5, 100, timestamp=datetime(2023, 10, 3, 9))])
+
+        view = columns[0]
+        view.close = 1.75
+        view.volume += 50
+        view.indicators["EMA"] = 10.0
+
+        assert columns.close[0] == 1.75
+        assert columns[0].volume == 150
+        assert columns[0].indicators == {"EMA": 10.0}
+
+    def test_lazy_extras(self):
+        columns = CandleColumns([Candle(1, 2, 0.5, 1.5, 100)])
+
+        assert columns.extras == [None]
+        assert columns[0].timestamp is None
+        assert columns[0].tag is None
+
+    def test_timezone(self):
+        timestamp = datetime(2023, 10, 3, 9, tzinfo=timezone.utc)
+        columns = CandleColumns([Candle(1, 2, 0.5, 1.5, 100, timestamp=timestamp)])
+
+        assert columns[0].timestamp == timestamp
+        assert columns[0].timestamp.tzinfo is not None
+
+    @pytest.mark.usefixtures("candles")
+    def test_pop_detaches(self, candles: List[Candle]):
+        columns = CandleColumns(candles[:3])
+        columns[0].indicators["EMA"] = 5.0
+
+        candle = columns.pop(0)
+
+        assert not isinstance(candle, CandleView)
+        assert candle.indicators == {"EMA": 5.0}
+        assert columns == candles[1:3]
+
+    @pytest.mark.usefixtures("candles")
+    def test_append_values(self, candles: List[Candle]):
+        candle = candles[1].clean_copy()
+        candle.tag = "tick"
+        candle.indicators["EMA"] = 5.0
+        columns = CandleColumns(candles[:1])
+        expected = CandleColumns(candles[:1])
+
+        columns.append_values(candle)
+        expected.append(candle.clean_copy())
+
+        assert columns == expected
+        assert columns[-1].tag is None
+        assert columns[-1].indicators == {}
+
+    @pytest.mark.usefixtures("candles")
+    def test_view_survives_front_changes(self, candles: List[Candle]):
+        columns = CandleColumns(candles[1:4])
+        view = columns[1]
+
+        columns.insert(0, candles[0])
+        assert view == candles[2]
+
+        columns.pop(0)
+        columns.pop(0)
+        assert view == candles[2]
+
+    @pytest.mark.usefixtures("candles")
+    def test_sort(self, candles: List[Candle]):
+        columns = CandleColumns([candles[2], candles[0], candles[1]])
+        columns.sort(key=lambda candle: candle.timestamp)
+
+        assert columns == candles[:3]
+
+
+class TestColumnarManager:
+    @pytest.mark.usefixtures("candles", "candles_T5")
+    def test_resample_t5(self, candles: List[Candle], candles_T5: List[Candle]):
+        manager = CandleManager(candles, timeframe=timedelta(minutes=5), columnar=True)
+
+        assert isinstance(manager.candles, CandleColumns)
+        assert manager.candles == candles_T5
+
+    @pytest.mark.usefixtures("candles", "candles_T5")
+    def test_resample_t5_appended(self, candles: List[Candle], candles_T5: List[Candle]):
+        manager = CandleManager([candles[0]], timeframe=timedelta(minutes=5), columnar=True)
+        for candle in candles[1:]:
+            manager.append(candle)
+
+        assert manager.candles == candles_T5
+
+    @pytest.mark.usefixtures("candles")
+    def test_prepend_insert(self, candles: List[Candle]):
+        manager = CandleManager(candles[10:20], columnar=True)
+        manager.prepend(candles[:10])
+        manager.insert([candles[25], candles[20]])
+
+        assert manager.candles == candles[:21] + [candles[25]]
+
+    @pytest.mark.usefixtures("candles")
+    def test_trim(self, candles: List[Candle]):
+        manager = CandleManager(candles, candle_life=timedelta(minutes=10), columnar=True)
+
+        assert manager.candles == candles[-11:]
+
+    @pytest.mark.usefixtures("candles", "expected_ema")
+    def test_indicator(self, candles: List[Candle], expected_ema: list):
+        strat = Hexital("Test Stratergy", candles, [EMA()], columnar=True)
+        strat.calculate()
+
+        assert strat.readings()["EMA_10"] == pytest.approx(expected_ema)
+
+    @pytest.mark.usefixtures("candles", "expected_ema_t5")
+    def test_indicator_timeframe(self, candles: List[Candle], expected_ema_t5: list):
+        strat = Hexital("Test Stratergy", [], [EMA(timeframe="T5")], columnar=True)
+
+        for candle in candles:
+            strat.append(candle)
+
+        assert strat.readings()["EMA_10_T5"] == pytest.approx(expected_ema_t5)
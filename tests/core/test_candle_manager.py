@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import List
 
 import pytest
-from hexital import Candle
+from hexital import EMA, Candle, Hexital
 from hexital.core.candle_manager import CandleManager
 from hexital.utils.common import CalcMode
 from test_candlestick import FakeType
@@ -153,6 +153,54 @@ class TestParseCandles:
         with pytest.raises(TypeError):
             manager._parse_candles(["Fuck", 2, 3])
 
+    def test_append_tuple_tuple(self):
+        manager = CandleManager()
+        raw = (
+            (datetime(2023, 10, 3, 9, 0), 17213, 2395, 7813, 3615, 19661),
+            (datetime(2023, 10, 3, 9, 5), 1301, 3007, 11626, 19048, 28909),
+        )
+        candles = manager._parse_candles(raw)
+
+        assert candles == [
+            Candle(17213, 2395, 7813, 3615, 19661, timestamp=datetime(2023, 10, 3, 9, 0)),
+            Candle(1301, 3007, 11626, 19048, 28909, timestamp=datetime(2023, 10, 3, 9, 5)),
+        ]
+
+    def test_from_list_unmodified(self):
+        raw = [datetime(2023, 10, 3, 9, 0), 17213, 2395, 7813, 3615, 19661, {"EMA": 1}, {}, "T5"]
+        Candle.from_list(raw)
+
+        assert len(raw) == 9
+
+
+class TestCandleOwnership:
+    @pytest.mark.usefixtures("minimal_candles")
+    def test_copies_candles(self, minimal_candles):
+        manager = CandleManager()
+        manager.append(minimal_candles)
+
+        assert manager.candles == [candle.clean_copy() for candle in minimal_candles]
+        assert manager.candles[-1] is not minimal_candles[-1]
+
+    @pytest.mark.usefixtures("minimal_candles")
+    def test_takes_ownership(self, minimal_candles):
+        manager = CandleManager(copy_candles=False)
+        manager.append(minimal_candles[-1])
+
+        assert manager.candles[-1] is minimal_candles[-1]
+
+    @pytest.mark.usefixtures("candles")
+    def test_hexital_takes_ownership(self, candles):
+        strat = Hexital("Test Stratergy", [], [EMA(), EMA(timeframe="T5")], copy_candles=False)
+        copies = [candle.clean_copy() for candle in candles[:20]]
+        strat.append(copies)
+
+        assert strat.candles()[-1] is copies[-1]
+        assert strat.candles("T5")[0] is not copies[0]
+        expected = Hexital("", candles[:20], timeframe="T5").candles()
+        assert [c.clean_copy() for c in strat.candles("T5")] == expected
+        assert strat.settings["copy_candles"] is False
+
 
 class TestCandleAppend:
     @pytest.mark.usefixtures("minimal_candles")
@@ -604,6 +652,39 @@ class TestCandleTimeframePrepend:
         ) = 1, 0, 2
         assert manager.candles == expected
 
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    @pytest.mark.parametrize("split", [2, 5, 7, 100])
+    def test_prepend_within_candle(self, candles, columnar, split):
+        manager = CandleManager(
+            [candle.clean_copy() for candle in candles[split:]],
+            timeframe=timedelta(minutes=5),
+            columnar=columnar,
+        )
+        expected = CandleManager(
+            [candle.clean_copy() for candle in candles], timeframe=timedelta(minutes=5)
+        )
+
+        changed = manager.prepend([candle.clean_copy() for candle in candles[:split]])
+
+        assert manager.candles == expected.candles
+        assert changed == list(range(split // 5 + 1))
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("timeframe", [None, timedelta(minutes=5)])
+    def test_prepend_outside_candle_life(self, candles, timeframe):
+        manager = CandleManager(
+            [candle.clean_copy() for candle in candles[300:]],
+            candle_life=timedelta(minutes=100),
+            timeframe=timeframe,
+        )
+        expected = [candle.clean_copy() for candle in manager.candles]
+
+        changed = manager.prepend([candle.clean_copy() for candle in candles[100:200]])
+
+        assert changed == []
+        assert manager.candles == expected
+
 
 class TestCandleInsert:
     def test_default(self):
@@ -630,6 +711,37 @@ class TestCandleInsert:
         manager.insert(split_two)
         assert manager.candles == candles
 
+    @pytest.mark.usefixtures("candles")
+    def test_insert_changed_indexes(self, candles):
+        manager = CandleManager(candles[:50] + candles[51:100] + candles[101:])
+
+        assert manager.insert([candles[100], candles[50]]) == [50, 100]
+        assert manager.insert([]) == []
+
+    @pytest.mark.usefixtures("candles")
+    def test_insert_changed_indexes_timeframe(self, candles):
+        manager = CandleManager(candles[:12] + candles[13:], timeframe=timedelta(minutes=5))
+
+        assert manager.insert(candles[12]) == [2]
+        assert manager.candles[2].timestamp == datetime(2023, 10, 3, 9, 15)
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    @pytest.mark.parametrize("timeframe", [None, timedelta(minutes=5)])
+    def test_insert_late_candles(self, candles, columnar, timeframe):
+        late = [7, 12, 13, 250, 444]
+        manager = CandleManager(
+            [candle.clean_copy() for i, candle in enumerate(candles) if i not in late],
+            timeframe=timeframe,
+            columnar=columnar,
+        )
+        expected = CandleManager([candle.clean_copy() for candle in candles], timeframe=timeframe)
+
+        for i in reversed(late):
+            manager.insert(candles[i].clean_copy())
+
+        assert manager.candles == expected.candles
+
 
 class TestCandleSort:
     def test_sort_candles(self):
@@ -1040,3 +1152,78 @@ class TestCandleConversion:
         manager.append(minimal_candles[3:])
 
         assert manager.candles == candles_candlesticks_T5_expected
+
+
+class TestAppendTick:
+    def test_forming_candle(self):
+        manager = CandleManager(timeframe=timedelta(minutes=5))
+
+        assert manager.append_tick(datetime(2023, 10, 3, 9, 1, 30), 10.0, 2)
+        assert not manager.append_tick(datetime(2023, 10, 3, 9, 3), 12.0, 1)
+        assert not manager.append_tick(datetime(2023, 10, 3, 9, 5), 9.0, 3)
+        assert manager.append_tick(datetime(2023, 10, 3, 9, 5, 1), 11.0, 1)
+
+        candle = manager.candles[0]
+        assert len(manager.candles) == 2
+        assert (candle.open, candle.high, candle.low, candle.close) == (10.0, 12.0, 9.0, 9.0)
+        assert candle.volume == 6
+        assert candle.aggregation_factor == 3
+        assert candle.timestamp == datetime(2023, 10, 3, 9, 5)
+        assert manager.candles[1].timestamp == datetime(2023, 10, 3, 9, 10)
+
+    def test_no_timeframe(self):
+        manager = CandleManager()
+
+        assert manager.append_tick(datetime(2023, 10, 3, 9, 1, 30), 10.0, 2)
+        assert manager.append_tick(datetime(2023, 10, 3, 9, 1, 31), 11.0, 2)
+
+        assert [candle.close for candle in manager.candles] == [10.0, 11.0]
+
+    def test_timeframe_fill(self):
+        manager = CandleManager(timeframe=timedelta(minutes=5), timeframe_fill=True)
+
+        manager.append_tick(datetime(2023, 10, 3, 9, 1), 10.0, 2)
+        manager.append_tick(datetime(2023, 10, 3, 9, 16), 11.0, 2)
+
+        assert [candle.timestamp.minute for candle in manager.candles] == [5, 10, 15, 20]
+        assert [candle.volume for candle in manager.candles] == [2, 0, 0, 2]
+
+
+class TestRollCandles:
+    @pytest.mark.usefixtures("candles", "candles_T5")
+    def test_rolled_appends_match_resample(self, candles: List[Candle], candles_T5: List[Candle]):
+        manager = CandleManager(candles[:2], timeframe=timedelta(minutes=5))
+        for index in range(2, len(candles), 3):
+            manager.append(candles[index : index + 3])
+
+        assert manager.candles == candles_T5
+
+    @pytest.mark.usefixtures("candles")
+    def test_in_order_skips_resample(self, candles: List[Candle], monkeypatch):
+        manager = CandleManager(candles[:2], timeframe=timedelta(minutes=5))
+
+        def resample_candles(*_):
+            raise AssertionError("resample_candles called for in-order append")
+
+        monkeypatch.setattr(manager, "resample_candles", resample_candles)
+        for candle in candles[2:]:
+            manager.append(candle)
+
+        assert manager.candles[-1].timestamp == datetime(2023, 10, 3, 17, 25)
+
+    @pytest.mark.usefixtures("candles")
+    def test_out_of_order_resamples(self, candles: List[Candle], monkeypatch):
+        manager = CandleManager(candles[:2], timeframe=timedelta(minutes=5))
+        calls = []
+        resample_candles = manager.resample_candles
+
+        def spy(*args):
+            calls.append(args)
+            resample_candles(*args)
+
+        monkeypatch.setattr(manager, "resample_candles", spy)
+        manager.append(candles[2:10])
+        assert not calls
+
+        manager.append([candles[12], candles[11]])
+        assert calls
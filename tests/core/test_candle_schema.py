@@ -0,0 +1,104 @@
+import pickle
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from hexital import EMA, Candle, CandleSchema, Hexital
+from hexital.core.candle_manager import CandleManager
+from hexital.exceptions import InvalidConfiguration
+
+
+class TestCandleSchema:
+    def test_list_columns(self):
+        schema = CandleSchema(columns=["open", "high", "low", "close", "volume", "timestamp"])
+        candle = schema.parse_row((1, 2, 0.5, 1.5, 100, "2023-10-03T09:00:00"))
+
+        assert candle == Candle(1, 2, 0.5, 1.5, 100, timestamp=datetime(2023, 10, 3, 9, 0))
+
+    def test_skipped_column(self):
+        schema = CandleSchema(columns=["timestamp", None, "open", "high", "low", "close", "volume"])
+        candle = schema.parse_row([datetime(2023, 10, 3, 9), "EURUSD", 1, 2, 0.5, 1.5, 100])
+
+        assert candle == Candle(1, 2, 0.5, 1.5, 100, timestamp=datetime(2023, 10, 3, 9))
+
+    def test_dict_keys(self):
+        keys = {"timestamp": "t", "open": "o", "high": "h", "low": "l", "close": "c", "volume": "v"}
+        schema = CandleSchema(
+            keys=keys,
+            epoch_unit="ms",
+            timeframe="T5",
+        )
+        candles = schema.parse_rows(
+            [{"t": 1696323600000, "o": 1, "h": 2, "l": 0.5, "c": 1.5, "v": 100, "x": "ignored"}]
+        )
+
+        assert candles == [
+            Candle(1, 2, 0.5, 1.5, 100, timestamp=datetime(2023, 10, 3, 9), timeframe="T5")
+        ]
+        assert candles[0].timeframe == timedelta(minutes=5)
+
+    @pytest.mark.parametrize(
+        "unit, value",
+        [
+            ("s", 1696323600),
+            ("ms", 1696323600000),
+            ("us", 1696323600000000),
+            ("ns", 1696323600000000000),
+        ],
+    )
+    def test_epoch_units(self, unit: str, value: int):
+        schema = CandleSchema(epoch_unit=unit)
+
+        assert schema.parse_row([value, 1, 2, 0.5, 1.5, 100]).timestamp == datetime(2023, 10, 3, 9)
+
+    def test_timestamp_format(self):
+        schema = CandleSchema(timestamp_format="%d/%m/%Y %H:%M")
+
+        assert schema.parse_row(["03/10/2023 09:00", 1, 2, 0.5, 1.5, 100]).timestamp == datetime(
+            2023, 10, 3, 9
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"columns": ["open", "high", "low", "close"]},
+            {"columns": ["open", "high", "low", "close", "volume", "spread"]},
+            {"epoch_unit": "minutes"},
+            {"epoch_unit": "s", "timestamp_format": "%Y"},
+        ],
+    )
+    def test_invalid(self, kwargs: dict):
+        with pytest.raises(InvalidConfiguration):
+            CandleSchema(**kwargs)
+
+    def test_pickle(self):
+        schema = CandleSchema(columns=["open", "high", "low", "close", "volume", "timestamp"])
+        loaded = pickle.loads(pickle.dumps(schema))
+
+        assert loaded == schema
+        assert loaded.parse_row([1, 2, 0.5, 1.5, 100, None]) == Candle(1, 2, 0.5, 1.5, 100)
+
+
+class TestSchemaIngestion:
+    def test_manager(self):
+        manager = CandleManager(schema=CandleSchema(epoch_unit="s"))
+        manager.append([1696323600, 1, 2, 0.5, 1.5, 100])
+        manager.append([[1696323660, 1, 2, 0.5, 1.5, 100], [1696323720, 1, 2, 0.5, 1.5, 100]])
+
+        assert [c.timestamp.minute for c in manager.candles] == [0, 1, 2]
+
+    @pytest.mark.usefixtures("candles", "expected_ema")
+    def test_hexital(self, candles: List[Candle], expected_ema: list):
+        keys = {"timestamp": "t", "open": "o", "high": "h", "low": "l", "close": "c", "volume": "v"}
+        schema = CandleSchema(keys=keys)
+        rows = [
+            {"t": c.timestamp, "o": c.open, "h": c.high, "l": c.low, "c": c.close, "v": c.volume}
+            for c in candles
+        ]
+
+        strat = Hexital("Test Stratergy", rows[:100], [EMA(), EMA(timeframe="T5")], schema=schema)
+        strat.append(rows[100:])
+
+        assert [c.clean_copy() for c in strat.candles()] == candles
+        assert strat.reading_as_list("EMA_10") == pytest.approx(expected_ema)
+        assert strat.candles("T5")
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import List
@@ -6,6 +7,7 @@ import pytest
 from hexital import Candle, Hexital, TimeFrame
 from hexital.analysis.patterns import doji
 from hexital.candlesticks.heikinashi import HeikinAshi
+from hexital.core.candle_manager import CandleManager
 from hexital.core.hexital import HexitalCol
 from hexital.core.indicator import Indicator
 from hexital.core.indicator_collection import IndicatorCollection
@@ -678,3 +680,380 @@ class TestIndicatorCollection:
 
         assert strat.collection.fake
         assert strat.collection.fake.reading is not None
+
+
+class TestAutoTrim:
+    def test_auto_trim(self, candles):
+        strat = Hexital(
+            "Test Stratergy",
+            [],
+            [EMA(period=10), SMA(period=20, timeframe="T5")],
+            auto_trim=True,
+            convergence=5,
+        )
+        for candle in candles:
+            strat.append(candle)
+
+        assert len(strat.candles()) == 16
+        assert len(strat.candles("T5")) == 21
+        assert strat.reading("EMA_10") is not None
+
+    def test_auto_trim_keeps_max_candles(self, candles):
+        strat = Hexital("Test Stratergy", [], [SMA(period=20)], auto_trim=True, max_candles=50)
+        strat.append(candles)
+
+        assert len(strat.candles()) == 50
+
+    def test_auto_trim_add_indicator(self, candles):
+        strat = Hexital("Test Stratergy", candles, [SMA(period=5)], auto_trim=True)
+        assert len(strat.candles()) == 6
+
+        strat.add_indicator(SMA(period=30))
+        assert strat.indicator("SMA_30").candle_manager.max_candles == 31
+
+    def test_auto_trim_settings(self):
+        strat = Hexital("Test Stratergy", [], [SMA()], auto_trim=True, convergence=5)
+
+        assert strat.settings["auto_trim"] is True
+        assert strat.settings["convergence"] == 5
+        assert "auto_trim" not in Hexital("Test Stratergy", [], [SMA()]).settings
+
+
+@pytest.mark.usefixtures("candles")
+class TestReadingsAsArrays:
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_readings_as_arrays(self, candles, columnar):
+        np = pytest.importorskip("numpy")
+        from hexital.indicators import MACD
+
+        strat = Hexital("Test Stratergy", candles, [EMA(), MACD()], columnar=columnar)
+        strat.calculate()
+        arrays = strat.readings_as_arrays()
+
+        assert list(arrays) == [
+            "EMA_10",
+            "MACD_12_26_9.MACD",
+            "MACD_12_26_9.signal",
+            "MACD_12_26_9.histogram",
+        ]
+        assert arrays["EMA_10"].dtype == np.float64
+        np.testing.assert_array_equal(
+            arrays["EMA_10"], np.array(strat.reading_as_list("EMA_10"), dtype=np.float64)
+        )
+        np.testing.assert_array_equal(
+            arrays["MACD_12_26_9.signal"],
+            np.array(strat.reading_as_list("MACD_12_26_9.signal"), dtype=np.float64),
+        )
+        assert np.isnan(arrays["EMA_10"][0])
+
+    def test_nested_source(self, candles):
+        pytest.importorskip("numpy")
+        from hexital.indicators import MACD
+
+        macd = MACD(candles=candles)
+        macd.calculate()
+
+        assert list(macd.readings_as_arrays("MACD_12_26_9.MACD")) == ["MACD_12_26_9.MACD"]
+
+    def test_readings_as_frame(self, candles):
+        pd = pytest.importorskip("pandas")
+
+        strat = Hexital("Test Stratergy", candles, [EMA(), EMA(timeframe="T5")])
+        strat.calculate()
+        frame = strat.readings_as_frame()
+
+        assert list(frame.columns) == ["open", "high", "low", "close", "volume", "EMA_10"]
+        assert len(frame) == len(candles)
+        assert isinstance(frame.index, pd.DatetimeIndex)
+        assert list(strat.readings_as_frame("T5").columns)[-1] == "EMA_10_T5"
+
+
+class TestThreadSafe:
+    def test_snapshot(self, candles):
+        from hexital.indicators import MACD
+
+        strat = Hexital("Test Stratergy", candles[:100], [EMA(), MACD()], thread_safe=True)
+        strat.append(candles[100])
+        snapshot = strat.snapshot()
+
+        assert snapshot.generation == 1
+        assert snapshot.candle == candles[100]
+        assert snapshot.reading("EMA_10") == strat.reading("EMA_10")
+        assert snapshot.reading("MACD_12_26_9.signal") == strat.reading("MACD_12_26_9.signal")
+
+        strat.append(candles[101])
+        assert strat.snapshot().generation == 2
+        assert snapshot.candle == candles[100]
+
+    def test_snapshot_not_thread_safe(self, candles):
+        strat = Hexital("Test Stratergy", candles, [EMA()])
+        strat.calculate()
+
+        assert strat.snapshot().reading("EMA_10") == strat.reading("EMA_10")
+        assert strat.snapshot() is not strat.snapshot()
+
+    def test_concurrent_readers(self, candles):
+        from threading import Thread
+
+        expected = Hexital("Test Stratergy", candles, [EMA(), EMA(timeframe="T5")])
+        expected.calculate()
+        readings = {
+            candle.timestamp: candle.indicators["EMA_10"] for candle in expected.candles()
+        }
+
+        strat = Hexital(
+            "Test Stratergy", candles[:50], [EMA(), EMA(timeframe="T5")], thread_safe=True
+        )
+        strat.calculate()
+        mismatched = []
+
+        def read():
+            while (snapshot := strat.snapshot()).candle.timestamp != candles[-1].timestamp:
+                if snapshot.reading("EMA_10") != readings[snapshot.candle.timestamp]:
+                    mismatched.append(snapshot)
+                if strat.reading("EMA_10") is None:
+                    mismatched.append(strat.candles())
+
+        readers = [Thread(target=read) for _ in range(3)]
+        for reader in readers:
+            reader.start()
+        for candle in candles[50:]:
+            strat.append(candle)
+        for reader in readers:
+            reader.join()
+
+        assert not mismatched
+        assert strat.reading_as_list("EMA_10_T5") == expected.reading_as_list("EMA_10_T5")
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_candles_consistent(self, candles, columnar):
+        strat = Hexital(
+            "Test Stratergy", candles[:100], [EMA()], columnar=columnar, thread_safe=True
+        )
+        held = strat.candles()
+        strat.calculate()
+
+        assert "EMA_10" not in held[-1].indicators
+        assert strat.candles()[-1].indicators["EMA_10"] == strat.reading("EMA_10")
+        assert strat.prev_reading("EMA_10") == strat.reading("EMA_10", -2)
+
+    def test_readers_share_lock(self, candles):
+        from threading import Event, Thread
+
+        strat = Hexital("Test Stratergy", candles, [EMA()], thread_safe=True)
+        strat.calculate()
+        reading, release = Event(), Event()
+
+        def hold():
+            with strat._lock.read:
+                reading.set()
+                release.wait(10)
+
+        holder = Thread(target=hold)
+        holder.start()
+        reading.wait(10)
+
+        assert strat.reading_as_list("EMA_10")[-1] == strat.reading("EMA_10")
+        assert len(strat.candles()) == len(candles)
+
+        release.set()
+        holder.join()
+
+    def test_copy(self, candles):
+        from copy import deepcopy
+
+        strat = Hexital("Test Stratergy", candles[:100], [EMA()], thread_safe=True)
+        copied = deepcopy(strat)
+        copied.append(candles[100])
+
+        assert copied._lock is not strat._lock
+        assert len(copied.candles()) == 101
+        assert len(strat.candles()) == 100
+        assert strat.settings["thread_safe"] is True
+        assert "thread_safe" not in Hexital("Test Stratergy", candles, [EMA()]).settings
+
+
+class TestCascadeTimeframes:
+    def test_cascade_source(self, candles):
+        strat = Hexital(
+            "Test Stratergy",
+            candles,
+            [
+                EMA(timeframe="T5"),
+                EMA(timeframe="T10"),
+                EMA(timeframe="T15"),
+                EMA(timeframe="H1"),
+            ],
+        )
+
+        assert strat._cascade_source(strat._candle_map["T5"]) is None
+        assert strat._cascade_source(strat._candle_map["T10"]) is strat._candle_map["T5"]
+        assert strat._cascade_source(strat._candle_map["T15"]) is strat._candle_map["T5"]
+        assert strat._cascade_source(strat._candle_map["H1"]) is strat._candle_map["T15"]
+
+    def test_cascade_timeframe_fill(self, candles):
+        strat = Hexital(
+            "Test Stratergy",
+            candles,
+            [EMA(timeframe="T5"), EMA(timeframe="H1")],
+            timeframe_fill=True,
+        )
+
+        assert strat._cascade_source(strat._candle_map["H1"]) is None
+
+    @pytest.mark.parametrize("split", [1, 100, 499])
+    def test_cascade_matches_default_candles(self, candles, split, monkeypatch):
+        indicators = [EMA(timeframe="T5"), EMA(timeframe="T15"), EMA(timeframe="H1")]
+
+        strat = Hexital("Test Stratergy", deepcopy(candles[:split]), deepcopy(indicators))
+        for index in range(split, len(candles), 7):
+            strat.append(candles[index : index + 7])
+
+        monkeypatch.setattr(Hexital, "_cascade_source", lambda *_, **__: None)
+        expected = Hexital("Test Stratergy", deepcopy(candles[:split]), deepcopy(indicators))
+        for index in range(split, len(candles), 7):
+            expected.append(candles[index : index + 7])
+
+        for name in ["T5", "T15", "H1"]:
+            assert [c.clean_copy() for c in strat.candles(name)] == [
+                c.clean_copy() for c in expected.candles(name)
+            ]
+        assert strat.readings() == expected.readings()
+
+    def test_add_indicator_cascades(self, candles, monkeypatch):
+        strat = Hexital("Test Stratergy", candles, [EMA(timeframe="T5")])
+        history = []
+        monkeypatch.setattr(
+            CandleManager,
+            "_cascade_history",
+            lambda manager: history.append(manager.name) or [],
+        )
+
+        strat.add_indicator(EMA(timeframe="H1"))
+        assert history == ["T5"]
+
+
+class TestInsertRecalculate:
+    @pytest.mark.parametrize("late", [[30], [250, 40], [498]])
+    def test_insert_matches_in_order(self, candles, late):
+        from hexital.indicators import MACD, RSI
+
+        indicators = [EMA(), SMA(), RSI(), MACD()]
+        expected = Hexital("Test Stratergy", deepcopy(candles), deepcopy(indicators))
+        expected.calculate()
+
+        remaining = [candle for i, candle in enumerate(candles) if i not in late]
+        strat = Hexital("Test Stratergy", deepcopy(remaining), indicators)
+        strat.calculate()
+        strat.insert(deepcopy([candles[i] for i in late]))
+
+        assert strat.readings() == expected.readings()
+
+    def test_insert_recalculates_changed(self, candles, monkeypatch):
+        strat = Hexital("Test Stratergy", deepcopy(candles[:400] + candles[401:]), [SMA()])
+        strat.calculate()
+
+        calculated = []
+        calculate_reading = SMA._calculate_reading
+
+        def spy(indicator, index):
+            calculated.append(index)
+            return calculate_reading(indicator, index)
+
+        monkeypatch.setattr(SMA, "_calculate_reading", spy)
+        strat.insert(deepcopy(candles[400]))
+
+        assert calculated[0] == 400
+        assert len(calculated) < 20
+
+
+class TestPrependRecalculate:
+    @pytest.mark.parametrize("timeframe", [None, "T5"])
+    def test_prepend_matches_in_order(self, candles, timeframe):
+        from hexital.indicators import MACD, RSI
+
+        indicators = [EMA(), SMA(), RSI(), MACD(), EMA(timeframe="T10")]
+        expected = Hexital(
+            "Test Stratergy", deepcopy(candles), deepcopy(indicators), timeframe=timeframe
+        )
+        expected.calculate()
+
+        strat = Hexital("Test Stratergy", deepcopy(candles[300:]), indicators, timeframe=timeframe)
+        strat.calculate()
+        for start in (200, 100, 0):
+            strat.prepend(deepcopy(candles[start : start + 100]))
+
+        assert strat.readings() == expected.readings()
+
+    def test_prepend_outside_candle_life(self, candles):
+        from hexital.indicators import ADX, STOCH
+
+        indicators = [EMA(), STOCH(), ADX()]
+        expected = Hexital(
+            "Test Stratergy",
+            deepcopy(candles[300:]),
+            deepcopy(indicators),
+            candle_life=timedelta(minutes=100),
+        )
+        expected.calculate()
+
+        strat = Hexital(
+            "Test Stratergy",
+            deepcopy(candles[300:]),
+            indicators,
+            candle_life=timedelta(minutes=100),
+        )
+        strat.calculate()
+        strat.prepend(deepcopy(candles[100:200]))
+
+        assert strat.readings() == expected.readings()
+
+
+    @pytest.mark.parametrize("mode", ["insert", "prepend"])
+    def test_changed_after_add_indicator(self, candles, mode):
+        from hexital.indicators import MACD
+
+        expected = Hexital("Test Stratergy", deepcopy(candles), [EMA(), MACD()])
+        expected.calculate()
+
+        if mode == "insert":
+            strat = Hexital("Test Stratergy", deepcopy(candles[:300] + candles[301:]), [EMA()])
+        else:
+            strat = Hexital("Test Stratergy", deepcopy(candles[100:]), [EMA()])
+        strat.calculate()
+        strat.add_indicator(MACD())
+
+        if mode == "insert":
+            strat.insert(deepcopy(candles[300]))
+        else:
+            strat.prepend(deepcopy(candles[:100]))
+
+        assert strat.readings() == expected.readings()
+
+
+class TestAppendCalculate:
+    def test_append_timeframe_only_calculates_timeframe(self, candles, monkeypatch):
+        strat = Hexital("Test Stratergy", deepcopy(candles[:100]), [SMA(), EMA(timeframe="T5")])
+        strat.calculate()
+        five_minutes = Hexital("", deepcopy(candles[100:120]), timeframe="T5").candles()
+
+        calculated = []
+        calculate = Indicator.calculate
+
+        def spy(indicator):
+            calculated.append(indicator.name)
+            return calculate(indicator)
+
+        monkeypatch.setattr(Indicator, "calculate", spy)
+        strat.append(five_minutes, timeframe="T5")
+
+        assert calculated == ["EMA_10_T5"]
+        assert strat.reading("EMA_10_T5") is not None
+
+    def test_append_calculates_uncalculated(self, candles):
+        strat = Hexital("Test Stratergy", deepcopy(candles[:100]), [SMA(), EMA(timeframe="T5")])
+        five_minutes = Hexital("", deepcopy(candles[100:120]), timeframe="T5").candles()
+
+        strat.append(five_minutes, timeframe="T5")
+
+        assert strat.reading("SMA_10") is not None
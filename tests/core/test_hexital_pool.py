@@ -0,0 +1,146 @@
+from typing import Dict, List
+
+import pytest
+from hexital import ATR, EMA, MACD, OBV, RMA, RSI, SMA, TR, Candle, Hexital, HexitalPool
+
+pytest.importorskip("numpy")
+
+
+def indicators() -> list:
+    return [
+        EMA(),
+        RMA(),
+        RSI(),
+        ATR(),
+        TR(),
+        OBV(),
+        SMA(),
+        MACD(),
+        EMA(source="high", rounding=None),
+        EMA(name="RSI_EMA", source="RSI_14"),
+    ]
+
+
+def symbol_candles(candles: List[Candle], symbols: int) -> Dict[str, List[Candle]]:
+    return {
+        f"S{i}": [
+            Candle(
+                c.open * (1 + i / 10),
+                c.high * (1 + i / 10),
+                c.low * (1 + i / 10),
+                c.close * (1 + i / 10),
+                c.volume,
+                timestamp=c.timestamp,
+            )
+            for c in candles
+        ]
+        for i in range(symbols)
+    }
+
+
+def assert_matches(pool: HexitalPool, expected: Dict[str, Hexital]):
+    for symbol, strat in expected.items():
+        for name in strat.indicators:
+            assert pool.hexital(symbol).reading_as_list(name) == strat.reading_as_list(name)
+        assert [c.sub_indicators for c in pool.hexital(symbol).candles()] == [
+            c.sub_indicators for c in strat.candles()
+        ]
+
+
+class TestHexitalPool:
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_ticks_match_hexital(self, candles: List[Candle], columnar: bool):
+        data = symbol_candles(candles, 5)
+        pool = HexitalPool(
+            "Pool", {s: c[:50] for s, c in data.items()}, indicators(), columnar=columnar
+        )
+        expected = {s: Hexital(s, c[:50], indicators(), columnar=columnar) for s, c in data.items()}
+
+        for index in range(50, len(candles)):
+            # Symbols take turns missing a tick
+            tick = {s: c[index] for i, (s, c) in enumerate(data.items()) if index % 5 != i}
+            pool.append(tick)
+            for symbol, candle in tick.items():
+                expected[symbol].append(candle)
+
+        assert_matches(pool, expected)
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("columnar", [False, True])
+    @pytest.mark.parametrize("copy_candles", [True, False])
+    def test_ticks_trimmed(self, candles: List[Candle], columnar: bool, copy_candles: bool):
+        data = symbol_candles(candles, 3)
+        settings = {"max_candles": 60, "columnar": columnar, "copy_candles": copy_candles}
+        pool = HexitalPool(
+            "Pool",
+            {s: [x.clean_copy() for x in c[:50]] for s, c in data.items()},
+            indicators(),
+            **settings,
+        )
+        expected = {
+            s: Hexital(s, [x.clean_copy() for x in c[:50]], indicators(), **settings)
+            for s, c in data.items()
+        }
+
+        for index in range(50, 200):
+            pool.append({s: c[index].clean_copy() for s, c in data.items()})
+            for symbol, symbol_candles_ in data.items():
+                expected[symbol].append(symbol_candles_[index].clean_copy())
+
+        assert_matches(pool, expected)
+
+    @pytest.mark.usefixtures("candles")
+    def test_mixed_appends(self, candles: List[Candle]):
+        data = symbol_candles(candles, 3)
+        pool = HexitalPool("Pool", list(data), indicators())
+        expected = {s: Hexital(s, [], indicators()) for s in data}
+
+        pool.append({s: c[:100] for s, c in data.items()})
+        for index in range(100, 200):
+            pool.append({s: c[index] for s, c in data.items()})
+        pool.append({"S1": data["S1"][200:250]})
+        for index in range(200, 300):
+            pool.append({s: c[index] for s, c in data.items() if s != "S1" or index >= 250})
+
+        for symbol, strat in expected.items():
+            strat.append(data[symbol][:300])
+
+        assert_matches(pool, expected)
+
+    @pytest.mark.usefixtures("candles")
+    def test_add_remove_symbol(self, candles: List[Candle]):
+        data = symbol_candles(candles, 3)
+        pool = HexitalPool("Pool", {"S0": data["S0"][:100]}, [EMA(), RSI()])
+
+        for index in range(100, 150):
+            pool.append({"S0": data["S0"][index]})
+        pool.add_symbol("S1", data["S1"][:150])
+        pool.add_symbol("S2", data["S2"][:150])
+        pool.remove_symbol("S0")
+        for index in range(150, 200):
+            pool.append({s: data[s][index] for s in ["S1", "S2"]})
+
+        assert pool.symbols == ["S1", "S2"]
+        assert "S0" not in pool
+        for symbol in ["S1", "S2"]:
+            expected = Hexital(symbol, data[symbol][:200], [EMA(), RSI()])
+            expected.calculate()
+            assert pool.hexital(symbol).reading_as_list("RSI_14") == expected.reading_as_list(
+                "RSI_14"
+            )
+
+    @pytest.mark.usefixtures("candles")
+    def test_readings(self, candles: List[Candle]):
+        data = symbol_candles(candles, 3)
+        pool = HexitalPool("Pool", {s: c[:100] for s, c in data.items()}, [EMA()])
+        pool.append({s: c[100] for s, c in data.items()})
+
+        expected = Hexital("S0", data["S0"][:101], [EMA()])
+        expected.calculate()
+        readings = pool.readings("EMA_10")
+
+        assert list(readings) == ["S0", "S1", "S2"]
+        assert readings["S2"] == pool.reading("S2", "EMA_10")
+        assert readings["S0"] == expected.reading("EMA_10")
+        assert pool.reading("Missing", "EMA_10") is None
@@ -0,0 +1,134 @@
+import asyncio
+from typing import List
+
+import pytest
+from hexital import EMA, RSI, Candle, Hexital, HexitalStream
+from hexital.exceptions import InvalidCandleOrder, InvalidConfiguration
+
+
+def strategy(candles: List[Candle]) -> Hexital:
+    return Hexital("Test Stratergy", candles, [EMA(), RSI(), EMA(timeframe="T5")])
+
+
+async def feed(candles: List[Candle], delay: float = 0):
+    for candle in candles:
+        if delay:
+            await asyncio.sleep(delay)
+        yield candle
+
+
+async def collect(stream: HexitalStream, source) -> list:
+    subscription = stream.subscribe()
+    _, snapshots = await asyncio.gather(stream.run(source), gather(subscription))
+    return snapshots
+
+
+async def gather(subscription) -> list:
+    return [snapshot async for snapshot in subscription]
+
+
+class TestHexitalStream:
+    @pytest.mark.usefixtures("candles")
+    def test_run(self, candles: List[Candle]):
+        expected = strategy(candles)
+        expected.calculate()
+
+        strat = strategy(candles[:100])
+        stream = HexitalStream(strat, batch_size=25)
+        snapshots = asyncio.run(collect(stream, feed(candles[100:])))
+
+        assert len(snapshots) == (len(candles) - 100) // 25
+        assert snapshots[-1].candle.timestamp == candles[-1].timestamp
+        assert snapshots[-1].reading("RSI_14") == expected.reading("RSI_14")
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    def test_flush_remaining(self, candles: List[Candle]):
+        stream = HexitalStream(strategy(candles[:100]), batch_size=30)
+        snapshots = asyncio.run(collect(stream, feed(candles[100:200])))
+
+        assert [snapshot.candle.timestamp for snapshot in snapshots] == [
+            candles[129].timestamp,
+            candles[159].timestamp,
+            candles[189].timestamp,
+            candles[199].timestamp,
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    def test_flush_interval(self, candles: List[Candle]):
+        stream = HexitalStream(strategy(candles[:100]), batch_size=100, flush_interval=0.01)
+        snapshots = asyncio.run(collect(stream, feed(candles[100:110], delay=0.02)))
+
+        assert len(snapshots) == 10
+
+    @pytest.mark.usefixtures("candles")
+    def test_queue_source(self, candles: List[Candle]):
+        async def run() -> list:
+            queue = asyncio.Queue()
+            for candle in candles[100:150]:
+                queue.put_nowait(candle)
+            queue.put_nowait(candles[150:200])
+            queue.put_nowait(None)
+            return await collect(HexitalStream(strategy(candles[:100]), batch_size=50), queue)
+
+        snapshots = asyncio.run(run())
+
+        assert [snapshot.candle.timestamp for snapshot in snapshots] == [
+            candles[149].timestamp,
+            candles[199].timestamp,
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    def test_backpressure(self, candles: List[Candle]):
+        async def run():
+            stream = HexitalStream(strategy(candles[:100]), max_pending=5)
+            slow = stream.subscribe(max_size=2)
+
+            producer = asyncio.create_task(stream.run(feed(candles[100:200])))
+            await asyncio.sleep(0.1)
+            waiting = stream._pending.qsize()
+            blocked = not producer.done()
+
+            snapshots = await gather(slow)
+            await producer
+            return waiting, blocked, snapshots
+
+        waiting, blocked, snapshots = asyncio.run(run())
+
+        assert blocked
+        assert waiting == 5
+        assert [snapshot.candle.timestamp for snapshot in snapshots] == [
+            candle.timestamp for candle in candles[100:200]
+        ]
+
+    @pytest.mark.usefixtures("candles")
+    def test_append_error(self, candles: List[Candle]):
+        async def run() -> list:
+            stream = HexitalStream(strategy(candles[:100]), batch_size=5, max_pending=5)
+            source = feed(candles[100:110] + [candles[50]] + candles[110:200])
+            return await asyncio.wait_for(collect(stream, source), 10)
+
+        with pytest.raises(InvalidCandleOrder):
+            asyncio.run(run())
+
+    @pytest.mark.usefixtures("candles")
+    def test_append_error_put(self, candles: List[Candle]):
+        async def run() -> list:
+            stream = HexitalStream(strategy(candles[:100]), batch_size=1, max_pending=1)
+            subscription = stream.subscribe()
+            with pytest.raises(InvalidCandleOrder):
+                for candle in [candles[100], candles[50]] + candles[101:200]:
+                    await stream.put(candle)
+            with pytest.raises(InvalidCandleOrder):
+                await stream.close()
+            return await gather(subscription)
+
+        snapshots = asyncio.run(asyncio.wait_for(run(), 10))
+
+        assert [snapshot.candle.timestamp for snapshot in snapshots] == [candles[100].timestamp]
+
+    def test_invalid(self, candles: List[Candle]):
+        with pytest.raises(InvalidConfiguration):
+            HexitalStream(strategy(candles), batch_size=0)
+        with pytest.raises(InvalidConfiguration):
+            HexitalStream(strategy(candles), batch_size=10, max_pending=5)
@@ -35,6 +35,15 @@ def test_calculate(minimal_candles: List[Candle]):
     assert minimal_candles[-1].indicators.get("Fake_10")
 
 
+@pytest.mark.usefixtures("minimal_candles")
+def test_step_readings_unsupported(minimal_candles: List[Candle]):
+    test = FakeIndicator(candles=minimal_candles)
+
+    assert not test._can_step()
+    with pytest.raises(ValueError, match="Fake_10"):
+        test._step_readings({}, {})
+
+
 @pytest.mark.usefixtures("minimal_candles")
 def test_name_default(minimal_candles: List[Candle]):
     test = FakeIndicator(candles=minimal_candles)
@@ -266,3 +275,69 @@ class TestCandlestickType:
     def test_indicator_candlestick_type_error(self):
         with pytest.raises(InvalidCandlestickType):
             test_indicator = FakeIndicator(candles=[], candlestick="FUCK")
+
+
+class TestLookback:
+    def test_lookback_period(self):
+        assert FakeIndicator(period=10).lookback() == 11
+
+    def test_lookback_recursive(self):
+        from hexital.indicators import EMA, SMA
+
+        assert EMA(period=10).lookback(50) == 61
+        assert SMA(period=10).lookback(50) == 11
+
+    def test_lookback_composite(self):
+        from hexital.indicators import JMA, MACD
+
+        assert MACD().lookback() == 26 + 9 + 1
+        assert MACD().lookback(10) == 26 + 9 + 1 + 20
+        assert JMA().lookback() == 75
+
+    def test_lookback_source(self):
+        from hexital.indicators import EMA, SMA
+
+        assert SMA(period=5, source=EMA(period=10)).lookback() == 5 + 1 + 10
+
+    def test_lookback_initialised(self, candles):
+        from hexital.indicators import MACD
+
+        macd = MACD(candles=candles)
+        macd.calculate()
+        assert macd.lookback(10) == 26 + 9 + 1 + 20
+
+
+class TestCalculatedWatermark:
+    def test_resumes_after_append(self, candles):
+        indicator = FakeIndicator(candles=candles[:100])
+        indicator.calculate()
+        indicator.candle_manager.append(candles[100:110])
+
+        assert indicator._find_calc_index() == 100
+
+    def test_resumes_after_trim(self, candles):
+        indicator = FakeIndicator(candles=candles[:100], max_candles=50)
+        indicator.calculate()
+        indicator.candle_manager.append(candles[100:110])
+
+        assert indicator._find_calc_index() == 40
+        indicator.calculate()
+        assert all(candle.has_reading(indicator.name) for candle in indicator.candles)
+
+    def test_resumes_merged_candle(self, candles):
+        indicator = FakeIndicator(candles=candles[:12], timeframe="T5")
+        indicator.calculate()
+        indicator.candle_manager.append(candles[12])
+
+        assert indicator._find_calc_index() == 2
+
+    def test_prepend_searches(self, candles):
+        indicator = FakeIndicator(candles=candles[10:100])
+        indicator.calculate()
+        generation = indicator._calculated[0]
+        indicator.candle_manager.prepend(candles[:10])
+
+        assert indicator.candle_manager._generation != generation
+        assert indicator._find_calc_index() == 0
+        indicator.calculate()
+        assert all(candle.has_reading(indicator.name) for candle in indicator.candles)
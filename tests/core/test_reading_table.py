@@ -0,0 +1,92 @@
+from datetime import timedelta
+from typing import List
+
+import pytest
+from hexital import EMA, Candle, Hexital
+from hexital.core.reading_table import EMPTY, ReadingsView, ReadingTable
+
+
+class TestReadingTable:
+    def test_bind_moves_readings(self):
+        table = ReadingTable()
+        candle = Candle(1, 2, 0.5, 1.5, 100, indicators={"EMA": 1.0}, sub_indicators={"SMA": 2.0})
+
+        slot = table.bind(candle)
+
+        assert candle._table is table
+        assert isinstance(candle.indicators, ReadingsView)
+        assert candle.indicators == {"EMA": 1.0}
+        assert candle.sub_indicators == {"SMA": 2.0}
+        assert table.columns == {"EMA": [1.0], "SMA": [2.0]}
+        assert slot == 0
+
+    def test_none_reading_is_present(self):
+        table = ReadingTable()
+        candle = Candle(1, 2, 0.5, 1.5, 100)
+        table.bind(candle)
+
+        candle.set_reading("EMA", None)
+
+        assert candle.has_reading("EMA")
+        assert not candle.has_reading("SMA")
+        assert candle.indicators == {"EMA": None}
+
+    def test_detach_frees_slot(self):
+        table = ReadingTable()
+        candles = [Candle(1, 2, 0.5, 1.5, 100) for _ in range(3)]
+        for candle in candles:
+            table.bind(candle)
+            candle.set_reading("EMA", 5.0)
+
+        candles[0].detach()
+
+        assert candles[0]._table is None
+        assert candles[0].indicators == {"EMA": 5.0}
+        assert table.columns["EMA"][0] is EMPTY
+
+        candle = Candle(1, 2, 0.5, 1.5, 100)
+        assert table.bind(candle) == 0
+        assert candle.indicators == {}
+
+    def test_positional_rows(self):
+        table = ReadingTable()
+        table.set_rows(0, [({"EMA": 1.0}, {}), ({"EMA": 2.0}, {"SMA": 3.0})])
+
+        table.insert_rows(0)
+        assert table.columns["EMA"] == [EMPTY, 1.0, 2.0]
+
+        table.delete_rows(0, 2)
+        assert table.columns["EMA"] == [2.0]
+        assert table.row(0, True) == {"SMA": 3.0}
+
+
+class TestManagerReadings:
+    @pytest.mark.usefixtures("candles")
+    def test_columns_follow_candles(self, candles: List[Candle]):
+        strat = Hexital("Test Stratergy", candles[:50], [EMA()])
+        strat.calculate()
+
+        table = strat.indicator("EMA_10").candle_manager.readings
+        assert table.columns["EMA_10"][:50] == strat.readings()["EMA_10"]
+
+    @pytest.mark.usefixtures("candles")
+    def test_trim_detaches(self, candles: List[Candle]):
+        strat = Hexital("Test Stratergy", candles[:20], [EMA()], candle_life=timedelta(minutes=10))
+        strat.calculate()
+        dropped = candles[12]
+        assert dropped._table is not None
+
+        for candle in candles[20:30]:
+            strat.append(candle)
+
+        assert dropped._table is None
+        assert strat.indicator("EMA_10").candle_manager.readings.size <= 22
+
+    @pytest.mark.usefixtures("candles")
+    def test_purge(self, candles: List[Candle]):
+        strat = Hexital("Test Stratergy", candles[:20], [EMA()])
+        strat.calculate()
+        strat.purge("EMA_10")
+
+        assert "EMA_10" not in strat.indicator("EMA_10").candle_manager.readings.columns
+        assert strat.reading("EMA_10") is None
@@ -0,0 +1,160 @@
+import gc
+from multiprocessing import Process, Queue
+from typing import List
+
+import pytest
+from hexital import EMA, MACD, RSI, Candle, Hexital, SharedCandles
+from hexital.exceptions import InvalidConfiguration
+
+
+def strategy(candles) -> Hexital:
+    return Hexital("Test Stratergy", candles, [EMA(), RSI(), MACD(), EMA(timeframe="T5")])
+
+
+def expected_readings(candles: List[Candle]) -> dict:
+    strat = strategy(candles)
+    strat.calculate()
+    return strat.readings()
+
+
+def read_shared(store: SharedCandles, written: Queue, results: Queue):
+    strat = strategy(store)
+    strat.calculate()
+    results.put(len(strat.candles()))
+
+    written.get()
+    strat.sync()
+    results.put(strat.readings())
+
+
+@pytest.fixture(name="store")
+def fixture_store():
+    store = SharedCandles.create(1000)
+    yield store
+    gc.collect()
+    store.close()
+    store.unlink()
+
+
+class TestSharedCandles:
+    @pytest.mark.usefixtures("candles")
+    def test_reader(self, candles: List[Candle], store: SharedCandles):
+        store.append(candles)
+        reader = SharedCandles.attach(store.name)
+
+        strat = strategy(reader)
+        strat.calculate()
+
+        assert len(reader) == len(candles)
+        assert strat.candles()[10].clean_copy() == candles[10]
+        assert strat.readings() == expected_readings(candles)
+
+        del strat
+        gc.collect()
+        reader.close()
+
+    @pytest.mark.usefixtures("candles")
+    def test_sync(self, candles: List[Candle], store: SharedCandles):
+        store.append(candles[:100])
+        strat = strategy(store)
+
+        for index in range(100, 200):
+            store.append(candles[index])
+            strat.sync()
+        store.append(candles[200:])
+        strat.sync()
+
+        assert strat.readings() == expected_readings(candles)
+
+    @pytest.mark.usefixtures("candles")
+    def test_max_candles(self, candles: List[Candle], store: SharedCandles):
+        store.append(candles[:100])
+        strat = Hexital("Test Stratergy", store, [EMA()], max_candles=50)
+        expected = Hexital("Test Stratergy", candles[:100], [EMA()], max_candles=50)
+
+        for index in range(100, 150):
+            store.append(candles[index])
+            strat.sync()
+            expected.append(candles[index])
+
+        assert len(strat.candles()) == 50
+        assert strat.candles()[0].timestamp == candles[100].timestamp
+        assert strat.reading_as_list("EMA_10") == expected.reading_as_list("EMA_10")
+
+    @pytest.mark.usefixtures("candles")
+    def test_process(self, candles: List[Candle], store: SharedCandles):
+        store.append(candles[:300])
+        written, results = Queue(), Queue()
+        process = Process(target=read_shared, args=(store, written, results))
+        process.start()
+
+        assert results.get(timeout=30) == 300
+        store.append(candles[300:])
+        written.put(True)
+        readings = results.get(timeout=30)
+        process.join()
+
+        assert readings == expected_readings(candles)
+
+    @pytest.mark.usefixtures("candles")
+    def test_arrays(self, candles: List[Candle], store: SharedCandles):
+        np = pytest.importorskip("numpy")
+        store.append(
+            np.array(
+                [[c.timestamp, c.open, c.high, c.low, c.close, c.volume] for c in candles],
+                dtype=object,
+            )
+        )
+
+        strat = strategy(store)
+        strat.calculate()
+
+        assert strat.readings() == expected_readings(candles)
+
+    @pytest.mark.usefixtures("candles")
+    def test_read_only(self, candles: List[Candle], store: SharedCandles):
+        store.append(candles[:10])
+        reader = SharedCandles.attach(store.name)
+        columns = reader.columns()
+
+        with pytest.raises(InvalidConfiguration):
+            reader.append(candles[10])
+        with pytest.raises(TypeError):
+            columns.append(candles[10])
+        with pytest.raises(TypeError):
+            columns[0].close = 1.0
+
+        del columns
+        gc.collect()
+        reader.close()
+
+    @pytest.mark.usefixtures("candles")
+    def test_close_held(self, candles: List[Candle], store: SharedCandles):
+        store.append(candles[:10])
+        reader = SharedCandles.attach(store.name)
+        columns = reader.columns()
+        strat = strategy(reader)
+        strat.calculate()
+
+        reader.close()
+
+        assert len(columns) == 0
+        assert len(strat.candles()) == 0
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("options", [{"timeframe": "T5"}, {"candlestick": "HA"}])
+    def test_resampled_default(self, candles: List[Candle], store: SharedCandles, options: dict):
+        store.append(candles[:10])
+
+        with pytest.raises(InvalidConfiguration):
+            Hexital("Test Stratergy", store, [EMA()], **options)
+
+    @pytest.mark.usefixtures("candles")
+    def test_full(self, candles: List[Candle]):
+        with SharedCandles.create(10) as store:
+            store.append(candles[:8])
+            with pytest.raises(InvalidConfiguration):
+                store.append(candles[8:12])
+
+            assert len(store) == 8
+            store.unlink()
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from random import Random
+from typing import List
+
+import pytest
+from hexital import EMA, RSI, Candle, Hexital, TickAggregator
+from hexital.exceptions import InvalidConfiguration
+
+
+def strategy() -> Hexital:
+    return Hexital("Test Stratergy", [], [EMA(), RSI(), EMA(timeframe="T5")], timeframe="T1")
+
+
+def make_ticks(candles: List[Candle], per_candle: int = 5) -> list:
+    random = Random(1)
+    return [
+        (
+            candle.timestamp - timedelta(seconds=59 - i * 10),
+            round(random.uniform(candle.low, candle.high), 1),
+            random.randint(1, 10),
+        )
+        for candle in candles
+        for i in range(per_candle)
+    ]
+
+
+def as_candle(tick) -> Candle:
+    return Candle(tick[1], tick[1], tick[1], tick[1], tick[2], timestamp=tick[0])
+
+
+class TestTickAggregator:
+    @pytest.mark.usefixtures("candles")
+    def test_matches_candle_append(self, candles: List[Candle]):
+        ticks = make_ticks(candles[:200])
+        expected = strategy()
+        for tick in ticks:
+            expected.append(as_candle(tick))
+
+        strat = strategy()
+        aggregator = TickAggregator(strat)
+        aggregator.append(ticks)
+        aggregator.flush()
+
+        assert [c.clean_copy() for c in strat.candles()] == [
+            c.clean_copy() for c in expected.candles()
+        ]
+        assert [c.clean_copy() for c in strat.candles("T5")] == [
+            c.clean_copy() for c in expected.candles("T5")
+        ]
+        assert strat.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    def test_calculates_on_close(self, candles: List[Candle]):
+        ticks = make_ticks(candles[:50])
+        strat = strategy()
+        aggregator = TickAggregator(strat)
+
+        calculated = [aggregator.append(tick) for tick in ticks]
+
+        assert calculated == [i % 5 == 0 for i in range(len(ticks))]
+        assert strat.reading("EMA_10") is None
+        assert strat.prev_reading("EMA_10") is not None
+
+    @pytest.mark.usefixtures("candles")
+    def test_partial_ticks(self, candles: List[Candle]):
+        strat = strategy()
+        aggregator = TickAggregator(strat, partial_ticks=2)
+
+        calculated = [aggregator.append(tick) for tick in make_ticks(candles[:20])]
+
+        assert calculated[:10] == [True, False, True, False, True] * 2
+        assert strat.reading("EMA_10") is not None
+
+    @pytest.mark.usefixtures("candles")
+    def test_partial_interval(self, candles: List[Candle]):
+        strat = strategy()
+        aggregator = TickAggregator(strat, partial_interval=timedelta(seconds=20))
+
+        calculated = [aggregator.append(tick) for tick in make_ticks(candles[:20])]
+
+        assert calculated[:10] == [True, False, True, False, True] * 2
+
+    @pytest.mark.usefixtures("candles")
+    def test_late_tick(self, candles: List[Candle]):
+        ticks = make_ticks(candles[:100])
+        late = ticks.pop(250)
+        expected = strategy()
+        expected.append([as_candle(tick) for tick in ticks[:300]])
+        expected.insert(as_candle(late))
+
+        strat = strategy()
+        aggregator = TickAggregator(strat)
+        aggregator.append(ticks[:300])
+        assert aggregator.append(late)
+
+        assert strat.candles()[50].clean_copy() == expected.candles()[50].clean_copy()
+        assert strat.readings() == expected.readings()
+
+    def test_invalid(self):
+        with pytest.raises(InvalidConfiguration):
+            TickAggregator(strategy(), partial_ticks=0)
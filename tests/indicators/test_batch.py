@@ -0,0 +1,121 @@
+from typing import List
+
+import pytest
+from hexital import Candle, Hexital, indicators
+
+pytest.importorskip("numpy")
+
+BATCHED = [
+    indicators.ATR,
+    indicators.BBANDS,
+    indicators.EMA,
+    indicators.MACD,
+    indicators.OBV,
+    indicators.RMA,
+    indicators.ROC,
+    indicators.RSI,
+    indicators.SMA,
+    indicators.STDEV,
+    indicators.STOCH,
+    indicators.TR,
+    indicators.WMA,
+]
+
+
+def sub_readings(candles: List[Candle]) -> list:
+    return [candle.sub_indicators for candle in candles]
+
+
+class TestBatch:
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("indicator", BATCHED)
+    def test_matches_incremental(self, candles: List[Candle], indicator: type):
+        expected = indicator(candles=[c.clean_copy() for c in candles])
+        expected.calculate()
+
+        test = indicator(candles=[c.clean_copy() for c in candles], batch=True)
+        test.calculate()
+
+        assert test.readings() == expected.readings()
+        assert sub_readings(test.candles) == sub_readings(expected.candles)
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize("indicator", BATCHED)
+    def test_append_after_batch(self, candles: List[Candle], indicator: type):
+        expected = indicator(candles=[c.clean_copy() for c in candles])
+        expected.calculate()
+
+        test = indicator(candles=[c.clean_copy() for c in candles[:300]], batch=True)
+        test.calculate()
+        for candle in candles[300:]:
+            test.append(candle.clean_copy())
+
+        assert test.readings() == expected.readings()
+
+    @pytest.mark.usefixtures("candles")
+    @pytest.mark.parametrize(
+        "indicator, kwargs",
+        [
+            (indicators.SMA, {"source": "volume", "rounding": None}),
+            (indicators.WMA, {"source": "high"}),
+            (indicators.EMA, {"source": "SMA_10"}),
+            (indicators.MACD, {"rounding": None}),
+            (indicators.STDEV, {"period": 5, "rounding": 2}),
+        ],
+    )
+    def test_sources(self, candles: List[Candle], indicator: type, kwargs: dict):
+        expected = Hexital("Test", [c.clean_copy() for c in candles], [indicators.SMA()])
+        expected.add_indicator(indicator(**kwargs))
+        expected.calculate()
+
+        test = Hexital("Test", [c.clean_copy() for c in candles], [indicators.SMA()], batch=True)
+        test.add_indicator(indicator(**kwargs, batch=True))
+        test.calculate()
+
+        name = indicator(**kwargs).name
+        assert test.reading_as_list(name) == expected.reading_as_list(name)
+
+    @pytest.mark.usefixtures("candles")
+    def test_columnar(self, candles: List[Candle]):
+        names = [indicators.MACD().name, indicators.STOCH().name, indicators.BBANDS().name]
+
+        expected = Hexital(
+            "Test", candles[:100], [indicators.MACD(), indicators.STOCH(), indicators.BBANDS()]
+        )
+        expected.append(candles[100:])
+        test = Hexital(
+            "Test",
+            candles[:100],
+            [indicators.MACD(), indicators.STOCH(), indicators.BBANDS()],
+            columnar=True,
+            batch=True,
+        )
+        test.append(candles[100:])
+
+        for name in names:
+            assert test.reading_as_list(name) == expected.reading_as_list(name)
+
+    @pytest.mark.usefixtures("candles")
+    def test_short_calculation_not_batched(self, candles: List[Candle], monkeypatch):
+        def batch_readings(*_):
+            raise AssertionError("Batch calculated")
+
+        monkeypatch.setattr(indicators.SMA, "_batch_readings", batch_readings)
+
+        test = indicators.SMA(candles=candles[:20], batch=True)
+        test.calculate()
+        test.append(candles[20:40])
+
+        assert test.reading() is not None
+
+    def test_settings_batch(self):
+        assert "batch" not in indicators.EMA().settings
+        assert indicators.EMA(batch=True).settings["batch"] is True
+
+    @pytest.mark.usefixtures("candles")
+    def test_hexital_batch(self, candles: List[Candle]):
+        strat = Hexital("Test", candles, [indicators.EMA()], batch=True)
+
+        assert strat.indicator("EMA_10").batch
+        assert strat.settings["batch"] is True
+        assert "batch" not in Hexital("Test", candles, [indicators.EMA()]).settings
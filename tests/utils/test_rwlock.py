@@ -0,0 +1,71 @@
+from threading import Event, Thread
+
+import pytest
+from hexital.utils.rwlock import ReadWriteLock
+
+
+def test_readers_concurrent():
+    lock = ReadWriteLock()
+    reading, release = Event(), Event()
+
+    def hold():
+        with lock.read:
+            reading.set()
+            release.wait(10)
+
+    holder = Thread(target=hold)
+    holder.start()
+    reading.wait(10)
+
+    with lock.read:
+        assert lock._readers == 2
+
+    release.set()
+    holder.join()
+    assert lock._readers == 0
+
+
+def test_writer_waits_for_readers():
+    lock = ReadWriteLock()
+    written = Event()
+
+    def write():
+        with lock.write:
+            written.set()
+
+    with lock.read:
+        writer = Thread(target=write)
+        writer.start()
+        assert not written.wait(0.1)
+
+    writer.join()
+    assert written.is_set()
+
+
+def test_writer_reentrant():
+    lock = ReadWriteLock()
+
+    with lock.write:
+        with lock.read:
+            with lock.write:
+                assert lock.is_writer()
+
+    assert not lock.is_writer()
+    assert lock._writer is None
+
+
+def test_reader_reentrant():
+    lock = ReadWriteLock()
+
+    with lock.read:
+        with lock.read:
+            assert lock._readers == 1
+    assert lock._readers == 0
+
+
+def test_reader_cannot_write():
+    lock = ReadWriteLock()
+
+    with lock.read:
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
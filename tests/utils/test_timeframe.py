@@ -1,12 +1,15 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from hexital import TimeFrame
 from hexital.exceptions import InvalidTimeFrame
 from hexital.utils.timeframe import (
+    on_timeframe,
     round_down_timestamp,
     timedelta_to_str,
     timeframe_to_timedelta,
+    to_epoch,
+    trim_timestamp,
     within_timeframe,
 )
 
@@ -47,6 +50,33 @@ class TestRoundDownTimestamp:
             datetime(2023, 6, 6, 12, 9, 43, 3857), timedelta(days=1)
         ) == datetime(2023, 6, 6, 0, 0, 0)
 
+    def test_round_down_timezone(self):
+        tz = timezone(timedelta(hours=5, minutes=30))
+        assert round_down_timestamp(
+            datetime(2023, 6, 6, 12, 9, 43, tzinfo=tz), timedelta(hours=1)
+        ) == datetime(2023, 6, 6, 11, 30, 0, tzinfo=tz)
+
+
+class TestEpochTimestamps:
+    def test_on_timeframe(self):
+        assert on_timeframe(datetime(2023, 6, 6, 12, 5), timedelta(minutes=5))
+        assert not on_timeframe(datetime(2023, 6, 6, 12, 5, 1), timedelta(minutes=5))
+        assert not on_timeframe(datetime(2023, 6, 6, 12, 5, 0, 1), timedelta(minutes=5))
+
+    def test_on_timeframe_timezone(self):
+        tz = timezone(timedelta(hours=-1))
+        assert on_timeframe(datetime(2023, 6, 6, 11, 0, tzinfo=tz), timedelta(hours=2))
+        assert not on_timeframe(datetime(2023, 6, 6, 12, 0, tzinfo=tz), timedelta(hours=2))
+
+    def test_trim_timestamp(self):
+        timestamp = datetime(2023, 6, 6, 12, 5)
+        assert trim_timestamp(timestamp) is timestamp
+        assert trim_timestamp(datetime(2023, 6, 6, 12, 5, 0, 3857)) == timestamp
+
+    def test_to_epoch(self):
+        assert to_epoch(datetime(1970, 1, 1, 0, 0, 1, 5)) == 1_000_005
+        assert to_epoch(datetime(1970, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))) == 0
+
 
 class TestTimeframeToTimeDelta:
     def test_timeframe_to_delta_min(self):